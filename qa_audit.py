@@ -5,29 +5,76 @@ SGMS Automated QA Audit System
 Comprehensive quality assurance testing for backend and frontend
 
 Features:
-- Tests all backend API endpoints
+- Tests all backend GET endpoints, discovered from the controllers' @*Mapping annotations;
+  load, soak and open-loop runs use the same catalog
 - Detects 500, 401, 404 errors
-- Measures response times
-- Validates JSON responses
-- Checks frontend routes
+- Measures response times, split into DNS/connect/TLS/TTFB/download phases
+- Checks latency, error-rate and payload budgets per endpoint (qa_budgets.json)
+- Saves named baselines and flags significant regressions against them (--save-baseline, --compare)
+- Validates JSON responses and records payload size, compression, item count and decode cost
+- Checks responses against the backend DTO schemas (--validate-sample to sample them under load)
+- Per-role session pool from a credentials file covering dashboard and site-access endpoints
+- Checks frontend routes and weighs the JS/CSS they load, with simulated mobile load times
+- Audits HTTP caching: Cache-Control policy, ETags, 304 rates and repeat-visit savings
 - Generates HTML report
 - Loads credentials from .env
+- Concurrent virtual-user load testing (--load)
+- Statistical micro-benchmarks of single endpoints (--bench)
+- Soak testing with time-windowed drift detection (--soak)
+- Open-loop constant-arrival-rate load without coordinated omission (--rate)
+- Shift-change check-in/check-out burst simulation (--shift-change)
+- Data-volume scaling benchmark of the list endpoints (--scale)
+- Streams results to an append-only NDJSON file (--results-file, --resume, --report-from)
 
 Usage:
     python qa_audit.py
     python qa_audit.py --api-url http://localhost:8080/api
     python qa_audit.py --frontend-url http://localhost:5173
+    python qa_audit.py --load --users 200 --ramp-up 30 --duration 120
+    python qa_audit.py --bench /dashboard/admin-summary --warmup 20 --iterations 200
+    python qa_audit.py --soak 8h --window 5m --users 20
+    python qa_audit.py --rate 500 --duration 60 --target /attendance/today-summary
+    python qa_audit.py --shift-change 2000 --burst-window 120
+    python qa_audit.py --scale --scale-sizes 100,1000,10000,50000
+    python qa_audit.py --report-from qa_results.ndjson
+    python qa_audit.py --budgets ci_budgets.json
+    python qa_audit.py --load --save-baseline release-1.4
+    python qa_audit.py --load --compare release-1.4
+    python qa_audit.py --rate 200 --duration 60 --validate-sample 0.05
+    python qa_audit.py --load --users 40 --credentials qa_credentials.json
+
+Exit codes:
+    0  all checks passed and all budgets met
+    1  functional failures
+    2  performance budget violations or regressions against --compare
+    3  both
 """
 
 import requests
 import json
+import socket
+import fnmatch
+import re
 import time
+import random
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Tuple, Optional
 import argparse
 import sys
 import os
+import threading
+import statistics
+from array import array
+from contextlib import contextmanager
 from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
 
 # Try to import python-dotenv for .env support
 try:
@@ -36,6 +83,13 @@ try:
 except ImportError:
     DOTENV_AVAILABLE = False
 
+# The route table extractor of the static auditor (next to this script) drives endpoint discovery
+try:
+    from sgms_auditor import RouteIndex, SourceIndex
+    ROUTE_INDEX_AVAILABLE = True
+except ImportError:
+    ROUTE_INDEX_AVAILABLE = False
+
 # ANSI color codes for terminal output
 class Colors:
     GREEN = '\033[92m'
@@ -50,7 +104,10 @@ class QAResult:
     """Store test result data"""
     def __init__(self, endpoint: str, method: str, status: str, 
                  status_code: int = None, response_time: float = None, 
-                 error: str = None, warning: str = None):
+                 error: str = None, warning: str = None, body=None,
+                 headers: Dict[str, str] = None, timings: Dict[str, float] = None,
+                 size: int = None, transferred: int = None, encoding: str = None, items: int = None,
+                 schema_valid: bool = None, role: str = None):
         self.endpoint = endpoint
         self.method = method
         self.status = status  # 'pass', 'fail', 'warning'
@@ -58,424 +115,2691 @@ class QAResult:
         self.response_time = response_time
         self.error = error
         self.warning = warning
+        self.body = body  # Parsed JSON body (None if empty or not JSON)
+        self.headers = headers or {}
+        self.timings = timings or {}  # dns, connect, tls, ttfb, download, json_decode, validate, total (ms); reused
+        self.size = size  # Response body bytes after decompression
+        self.transferred = transferred  # Body bytes on the wire
+        self.encoding = encoding  # Content-Encoding ('identity' when uncompressed)
+        self.items = items  # Top-level item count of list responses
+        self.schema_valid = schema_valid  # None when the response was not schema-checked
+        self.role = role  # Role of the session that sent the request (None if anonymous)
         self.timestamp = datetime.now().isoformat()
+    
+    @property
+    def key(self) -> str:
+        """Aggregation key: 'METHOD /endpoint'"""
+        return f"{self.method} {self.endpoint}"
+    
+    def to_dict(self) -> dict:
+        """JSON-serializable record (body and headers are not persisted)"""
+        return {
+            'endpoint': self.endpoint,
+            'method': self.method,
+            'status': self.status,
+            'status_code': self.status_code,
+            'response_time': self.response_time,
+            'error': self.error,
+            'warning': self.warning,
+            'timings': self.timings,
+            'size': self.size,
+            'transferred': self.transferred,
+            'encoding': self.encoding,
+            'items': self.items,
+            'schema_valid': self.schema_valid,
+            'role': self.role,
+            'timestamp': self.timestamp,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QAResult':
+        result = cls(data['endpoint'], data['method'], data['status'], data.get('status_code'),
+                     data.get('response_time'), data.get('error'), data.get('warning'),
+                     timings=data.get('timings'), size=data.get('size'), transferred=data.get('transferred'),
+                     encoding=data.get('encoding'), items=data.get('items'),
+                     schema_valid=data.get('schema_valid'), role=data.get('role'))
+        result.timestamp = data.get('timestamp', result.timestamp)
+        return result
 
 
-class SGMSQASystem:
-    """Main QA testing system"""
+# Percentiles shown in every latency report (terminal, HTML, JSON)
+REPORT_PERCENTILES = (50, 90, 95, 99, 99.9)
+
+
+class LatencyHistogram:
+    """Fixed-memory, mergeable latency histogram (HDR-style log-linear buckets)
     
-    def __init__(self, api_base_url: str, frontend_url: str, admin_email: str = None, admin_password: str = None):
-        self.api_base_url = api_base_url.rstrip('/')
-        self.frontend_url = frontend_url.rstrip('/')
-        self.admin_email = admin_email
-        self.admin_password = admin_password
-        self.results: List[QAResult] = []
-        self.token: Optional[str] = None
-        self.session = requests.Session()
-        
-    def print_header(self, text: str):
-        """Print section header"""
-        print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}\n")
+    Values are recorded in microseconds. Each power-of-two bucket is split into
+    linear sub-buckets so every recorded value keeps `significant_digits` of
+    precision, and memory depends only on the configured range - never on the
+    number of samples. Values above `max_value_us` are clamped to the top bucket.
+    """
     
-    def print_result(self, result: QAResult):
-        """Print test result to terminal"""
-        status_icon = {
-            'pass': f"{Colors.GREEN}✔{Colors.RESET}",
-            'fail': f"{Colors.RED}❌{Colors.RESET}",
-            'warning': f"{Colors.YELLOW}⚠{Colors.RESET}"
-        }
-        
-        icon = status_icon.get(result.status, '?')
-        method_color = Colors.BLUE
+    def __init__(self, max_value_us: int = 3_600_000_000, significant_digits: int = 3):
+        self.max_value_us = max_value_us
+        self.significant_digits = significant_digits
         
-        print(f"{icon} {method_color}{result.method}{Colors.RESET} {result.endpoint}", end='')
-        
-        if result.status_code:
-            code_color = Colors.GREEN if result.status_code < 300 else Colors.RED
-            print(f" - {code_color}{result.status_code}{Colors.RESET}", end='')
+        single_unit_limit = 2 * 10 ** significant_digits
+        self.sub_bucket_count_magnitude = (single_unit_limit - 1).bit_length()
+        self.sub_bucket_count = 1 << self.sub_bucket_count_magnitude
+        self.sub_bucket_half_count_magnitude = self.sub_bucket_count_magnitude - 1
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
         
-        if result.response_time:
-            time_color = Colors.GREEN if result.response_time < 2000 else Colors.YELLOW if result.response_time < 5000 else Colors.RED
-            print(f" - {time_color}{result.response_time:.0f}ms{Colors.RESET}", end='')
+        smallest_untrackable = self.sub_bucket_count
+        self.bucket_count = 1
+        while smallest_untrackable <= max_value_us:
+            smallest_untrackable <<= 1
+            self.bucket_count += 1
         
-        if result.error:
-            print(f"\n  {Colors.RED}Error: {result.error}{Colors.RESET}")
-        elif result.warning:
-            print(f"\n  {Colors.YELLOW}Warning: {result.warning}{Colors.RESET}")
-        else:
-            print()
+        self.counts = array('q', bytes(8 * (self.bucket_count + 1) * self.sub_bucket_half_count))
+        self.total_count = 0
+        self.total_sum = 0
+        self.min_value: Optional[int] = None
+        self.max_value: Optional[int] = None
     
-    def test_endpoint(self, endpoint: str, method: str = 'GET', 
-                     requires_auth: bool = True, payload: dict = None) -> QAResult:
-        """Test a single endpoint"""
-        url = f"{self.api_base_url}{endpoint}"
-        headers = {}
-        
-        if requires_auth and self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
-        
-        try:
-            start_time = time.time()
-            
-            if method == 'GET':
-                response = self.session.get(url, headers=headers, timeout=10)
-            elif method == 'POST':
-                headers['Content-Type'] = 'application/json'
-                response = self.session.post(url, headers=headers, json=payload, timeout=10)
-            elif method == 'DELETE':
-                response = self.session.delete(url, headers=headers, timeout=10)
-            else:
-                return QAResult(endpoint, method, 'fail', error='Unsupported HTTP method')
-            
-            response_time = (time.time() - start_time) * 1000  # Convert to ms
-            
-            # Check for errors
-            if response.status_code == 401:
-                return QAResult(endpoint, method, 'fail', response.status_code, response_time, 
-                              error='Unauthorized - Check JWT token')
-            
-            if response.status_code == 500:
-                error_msg = 'Internal Server Error'
-                try:
-                    error_data = response.json()
-                    if 'message' in error_data:
-                        error_msg += f": {error_data['message']}"
-                except:
-                    pass
-                return QAResult(endpoint, method, 'fail', response.status_code, response_time, 
-                              error=error_msg)
-            
-            if response.status_code >= 400:
-                # Check for ErrorResponse {success: false, message, timestamp, path}
-                try:
-                    error_data = response.json()
-                    if error_data.get('success') == False:
-                        error_msg = error_data.get('message', 'Unknown error')
-                        return QAResult(endpoint, method, 'fail', response.status_code, response_time, 
-                                      error=f'Backend error: {error_msg}')
-                except:
-                    pass
-                
-                return QAResult(endpoint, method, 'fail', response.status_code, response_time, 
-                              error=f'HTTP {response.status_code}')
-            
-            # Check for HTML response when expecting JSON
-            content_type = response.headers.get('Content-Type', '')
-            if 'text/html' in content_type:
-                return QAResult(endpoint, method, 'fail', response.status_code, response_time,
-                              error='HTML response received (expected JSON) - Check CORS or server routing')
-            
-            # Check for 302 redirect
-            if response.status_code == 302:
-                return QAResult(endpoint, method, 'fail', response.status_code, response_time,
-                              error='Redirect detected - API should return JSON, not redirect')
-            
-            # Check response time
-            warning = None
-            if response_time > 5000:
-                warning = 'Very slow response (>5s)'
-            elif response_time > 2000:
-                warning = 'Slow response (>2s)'
-            
-            # Validate JSON
-            try:
-                response.json()
-            except:
-                return QAResult(endpoint, method, 'fail', response.status_code, response_time, 
-                              error='Invalid JSON response')
-            
-            status = 'warning' if warning else 'pass'
-            return QAResult(endpoint, method, status, response.status_code, response_time, 
-                          warning=warning)
-            
-        except requests.exceptions.Timeout:
-            return QAResult(endpoint, method, 'fail', error='Request timeout (>10s)')
-        except requests.exceptions.ConnectionError:
-            return QAResult(endpoint, method, 'fail', error='Connection failed - Is server running?')
-        except Exception as e:
-            return QAResult(endpoint, method, 'fail', error=str(e))
+    def _counts_index(self, value: int) -> int:
+        bucket_index = (value | self.sub_bucket_mask).bit_length() - self.sub_bucket_count_magnitude
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + \
+            (sub_bucket_index - self.sub_bucket_half_count)
     
-    def login_admin(self) -> bool:
-        """Login as admin to get JWT token"""
-        self.print_header("AUTHENTICATION TEST")
-        
-        # Try credentials from .env if available, then fallback to defaults
-        login_payloads = []
+    def _highest_value_at(self, index: int) -> int:
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+        return ((sub_bucket_index + 1) << bucket_index) - 1
+    
+    def record(self, value_us: int, count: int = 1):
+        """Record a latency in microseconds"""
+        value_us = min(max(0, int(value_us)), self.max_value_us)
+        self.counts[self._counts_index(value_us)] += count
+        self.total_count += count
+        self.total_sum += value_us * count
+        if self.min_value is None or value_us < self.min_value:
+            self.min_value = value_us
+        if self.max_value is None or value_us > self.max_value:
+            self.max_value = value_us
+    
+    def record_ms(self, value_ms: float):
+        """Record a latency given in milliseconds"""
+        self.record(int(round(value_ms * 1000)))
+    
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram with the same configuration into this one"""
+        if (other.max_value_us, other.significant_digits) != (self.max_value_us, self.significant_digits):
+            raise ValueError('Cannot merge histograms with different configurations')
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total_count += other.total_count
+        self.total_sum += other.total_sum
+        if other.min_value is not None:
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+            self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+    
+    def mean(self) -> Optional[float]:
+        """Mean latency in microseconds"""
+        return self.total_sum / self.total_count if self.total_count else None
+    
+    def percentiles(self, pcts=REPORT_PERCENTILES) -> Dict[float, Optional[int]]:
+        """Latency in microseconds at each requested percentile, in a single pass"""
+        if not self.total_count:
+            return {pct: None for pct in pcts}
         
-        if self.admin_email and self.admin_password:
-            login_payloads.append({'email': self.admin_email, 'password': self.admin_password})
-            print(f"{Colors.BLUE}Using credentials from .env file{Colors.RESET}")
-        else:
-            print(f"{Colors.YELLOW}No .env credentials found, using defaults{Colors.RESET}")
+        targets = sorted((max(1, int(-(-pct * self.total_count // 100))), pct) for pct in pcts)
+        values = {}
+        cumulative = 0
+        position = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            cumulative += count
+            while position < len(targets) and cumulative >= targets[position][0]:
+                value = min(self._highest_value_at(index), self.max_value)
+                values[targets[position][1]] = max(value, self.min_value)
+                position += 1
+            if position == len(targets):
+                break
+        return values
+    
+    def buckets(self):
+        """Yield (counts index, highest value in bucket, count) for non-empty buckets in value order"""
+        for index, count in enumerate(self.counts):
+            if count:
+                yield index, self._highest_value_at(index), count
+    
+    def value_at_percentile(self, pct: float) -> Optional[int]:
+        """Latency in microseconds at one percentile"""
+        return self.percentiles((pct,))[pct]
+    
+    def summary_ms(self) -> Dict[str, Optional[float]]:
+        """min/pXX/max in milliseconds, keyed for reports"""
+        def to_ms(value):
+            return None if value is None else value / 1000.0
         
-        # Fallback credentials
-        login_payloads.extend([
-            {'email': 'admin@sgms.com', 'password': 'admin123'},
-            {'email': 'admin@test.com', 'password': 'admin123'},
-            {'email': 'test@admin.com', 'password': 'Test@123'},
-        ])
+        summary = {'count': self.total_count, 'min': to_ms(self.min_value)}
+        for pct, value in self.percentiles().items():
+            summary[f'p{pct:g}'] = to_ms(value)
+        summary['max'] = to_ms(self.max_value)
+        summary['mean'] = to_ms(self.mean())
+        return summary
+    
+    def to_dict(self) -> dict:
+        """Sparse, JSON-serializable encoding (mergeable after from_dict)"""
+        return {
+            'max_value_us': self.max_value_us,
+            'significant_digits': self.significant_digits,
+            'total_count': self.total_count,
+            'total_sum': self.total_sum,
+            'min': self.min_value,
+            'max': self.max_value,
+            'counts': [[index, count] for index, count in enumerate(self.counts) if count],
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LatencyHistogram':
+        histogram = cls(data['max_value_us'], data['significant_digits'])
+        for index, count in data['counts']:
+            histogram.counts[index] = count
+        histogram.total_count = data['total_count']
+        histogram.total_sum = data['total_sum']
+        histogram.min_value = data['min']
+        histogram.max_value = data['max']
+        return histogram
+
+
+def latency_columns() -> List[str]:
+    """Column labels for latency summaries"""
+    return ['min'] + [f'p{pct:g}' for pct in REPORT_PERCENTILES] + ['max']
+
+
+def print_latency_table(histograms: Dict[str, 'LatencyHistogram'], errors: Dict[str, int] = None,
+                        requests_per_key: Dict[str, int] = None, key_width: int = 38):
+    """Print per-endpoint latency percentiles to the terminal"""
+    columns = latency_columns()
+    header = f"{'Endpoint':<{key_width}} {'Reqs':>7}"
+    if errors is not None:
+        header += f" {'Err%':>6}"
+    print(header + ''.join(f" {col:>8}" for col in columns))
+    
+    for key in sorted(histograms):
+        summary = histograms[key].summary_ms()
+        count = (requests_per_key or {}).get(key, summary['count'])
+        row = f"{key:<{key_width}} {count:>7}"
+        if errors is not None:
+            row += f" {errors.get(key, 0) / (count or 1) * 100:>5.1f}%"
+        for col in columns:
+            value = summary[col]
+            row += f" {value:>6.0f}ms" if value is not None else f" {'N/A':>8}"
+        print(row)
+
+
+# Request phases timed for every HTTP request (dns/connect/tls on new connections only)
+REQUEST_PHASES = ('dns', 'connect', 'tls', 'ttfb', 'download')
+
+
+class PhaseStats:
+    """Per-endpoint request phase histograms and connection reuse counts"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.requests: Dict[str, int] = {}
+        self.reused: Dict[str, int] = {}
+    
+    def add(self, key: str, timings: dict):
+        """Fold one request's timing breakdown into the phase histograms"""
+        if not timings or 'ttfb' not in timings:
+            return
+        with self.lock:
+            phases = self.histograms.setdefault(key, {})
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if timings.get('reused'):
+                self.reused[key] = self.reused.get(key, 0) + 1
+            for phase in REQUEST_PHASES:
+                if timings.get(phase) is not None:
+                    if phase not in phases:
+                        phases[phase] = LatencyHistogram(significant_digits=2)
+                    phases[phase].record_ms(timings[phase])
+    
+    def summary(self) -> Dict[str, dict]:
+        """Requests, connection reuse and p50/p95/p99 of each phase per endpoint"""
+        report = {}
+        for key in sorted(self.histograms):
+            entry = {'requests': self.requests.get(key, 0), 'reused': self.reused.get(key, 0)}
+            for phase in REQUEST_PHASES:
+                histogram = self.histograms[key].get(phase)
+                if histogram is not None and histogram.total_count:
+                    values = histogram.percentiles((50, 95, 99))
+                    entry[phase] = {'count': histogram.total_count,
+                                    **{f'p{pct}': values[pct] / 1000 for pct in (50, 95, 99)}}
+            report[key] = entry
+        return report
+
+
+def print_phase_table(phases: PhaseStats):
+    """Print per-endpoint phase p50/p99 and connection reuse to the terminal"""
+    summary = phases.summary()
+    if not summary:
+        return
+    print(f"{'Endpoint':<38} {'Reqs':>7} {'Reuse':>6}" + ''.join(f" {phase:>13}" for phase in REQUEST_PHASES))
+    for key, entry in summary.items():
+        row = f"{key:<38} {entry['requests']:>7} {entry['reused'] / (entry['requests'] or 1) * 100:>5.0f}%"
+        for phase in REQUEST_PHASES:
+            cell = f"{entry[phase]['p50']:.1f}/{entry[phase]['p99']:.1f}" if phase in entry else '-'
+            row += f" {cell:>13}"
+        print(row)
+    print(f"(p50/p99 ms; dns, connect and tls are only paid on new connections)")
+
+
+class PayloadStats:
+    """Per-endpoint response bytes, compression, item counts and JSON decode cost"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints: Dict[str, dict] = {}
+    
+    def add(self, key: str, record: dict):
+        """Fold one serialized QAResult's payload metrics into the totals"""
+        size = record.get('size')
+        if size is None:
+            return
+        transferred = record.get('transferred')
+        decode_ms = (record.get('timings') or {}).get('json_decode')
+        with self.lock:
+            entry = self.endpoints.setdefault(key, {
+                'responses': 0, 'bytes': 0, 'max_bytes': 0, 'transferred': 0, 'transferred_responses': 0,
+                'items': 0, 'item_responses': 0, 'item_bytes': 0, 'decode_ms': 0.0, 'encodings': {},
+            })
+            entry['responses'] += 1
+            entry['bytes'] += size
+            entry['max_bytes'] = max(entry['max_bytes'], size)
+            if transferred is not None:
+                entry['transferred'] += transferred
+                entry['transferred_responses'] += 1
+            if record.get('items') is not None:
+                entry['items'] += record['items']
+                entry['item_responses'] += 1
+                entry['item_bytes'] += size
+            if decode_ms is not None:
+                entry['decode_ms'] += decode_ms
+            encoding = record.get('encoding') or 'identity'
+            entry['encodings'][encoding] = entry['encodings'].get(encoding, 0) + 1
+    
+    def mean_size(self, key: str) -> Optional[float]:
+        """Mean decompressed response bytes of an endpoint"""
+        entry = self.endpoints.get(key)
+        return entry['bytes'] / entry['responses'] if entry else None
+    
+    def max_size(self, key: str) -> Optional[int]:
+        entry = self.endpoints.get(key)
+        return entry['max_bytes'] if entry else None
+    
+    def summary(self) -> Dict[str, dict]:
+        """Per-endpoint payload metrics, heaviest bytes per request first"""
+        report = {}
+        for key, entry in self.endpoints.items():
+            transferred = entry['transferred'] / entry['transferred_responses'] if entry['transferred_responses'] else None
+            report[key] = {
+                'responses': entry['responses'],
+                'bytes_per_request': entry['bytes'] / entry['responses'],
+                'max_bytes': entry['max_bytes'],
+                'transferred_per_request': transferred,
+                'compression_ratio': (entry['bytes'] / entry['responses'] / transferred) if transferred else None,
+                'items_per_response': entry['items'] / entry['item_responses'] if entry['item_responses'] else None,
+                'bytes_per_item': entry['item_bytes'] / entry['items'] if entry['items'] else None,
+                'json_decode_ms': entry['decode_ms'] / entry['responses'],
+                'encodings': dict(entry['encodings']),
+            }
+        return dict(sorted(report.items(), key=lambda item: -item[1]['bytes_per_request']))
+
+
+def format_bytes(value: Optional[float]) -> str:
+    if value is None:
+        return '-'
+    if value >= 1024 * 1024:
+        return f"{value / 1024 / 1024:.1f}MB"
+    if value >= 1024:
+        return f"{value / 1024:.1f}KB"
+    return f"{value:.0f}B"
+
+
+def print_payload_table(payload: PayloadStats):
+    """Print endpoints ranked by bytes per request, with wire size, items and decode cost"""
+    summary = payload.summary()
+    if not summary:
+        return
+    print(f"{'Endpoint':<38} {'Bytes/req':>10} {'Wire/req':>10} {'Encoding':>10} {'Items':>7} "
+          f"{'Bytes/item':>10} {'Decode':>8}")
+    for key, entry in summary.items():
+        encoding = max(entry['encodings'], key=entry['encodings'].get)
+        items = f"{entry['items_per_response']:.0f}" if entry['items_per_response'] is not None else '-'
+        print(f"{key:<38} {format_bytes(entry['bytes_per_request']):>10} "
+              f"{format_bytes(entry['transferred_per_request']):>10} {encoding:>10} {items:>7} "
+              f"{format_bytes(entry['bytes_per_item']):>10} {entry['json_decode_ms']:>6.2f}ms")
+    
+    per_item = sorted((e['bytes_per_item'], k) for k, e in summary.items() if e['bytes_per_item'])
+    if per_item:
+        print("Heaviest per item: " + ', '.join(f"{k} ({format_bytes(b)})" for b, k in reversed(per_item[-3:])))
+
+
+class ValidationStats:
+    """Per-endpoint schema validation counts and the time spent validating"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints: Dict[str, dict] = {}
+    
+    def add(self, key: str, record: dict):
+        """Fold one serialized QAResult into the totals if its schema was checked"""
+        valid = record.get('schema_valid')
+        if valid is None:
+            return
+        cost_ms = (record.get('timings') or {}).get('validate', 0.0)
+        with self.lock:
+            entry = self.endpoints.setdefault(key, {'validated': 0, 'failed': 0, 'cost_ms': 0.0, 'max_ms': 0.0})
+            entry['validated'] += 1
+            entry['failed'] += 0 if valid else 1
+            entry['cost_ms'] += cost_ms
+            entry['max_ms'] = max(entry['max_ms'], cost_ms)
+    
+    def summary(self) -> Dict[str, dict]:
+        """Validated and failed responses plus mean/max validation cost per endpoint"""
+        return {
+            key: {'validated': entry['validated'], 'failed': entry['failed'],
+                  'mean_ms': entry['cost_ms'] / entry['validated'], 'max_ms': entry['max_ms'],
+                  'total_ms': entry['cost_ms']}
+            for key, entry in sorted(self.endpoints.items())
+        }
+
+
+def print_validation_table(validation: ValidationStats, responses: int):
+    """Print schema validation failures and cost, separate from request latency"""
+    summary = validation.summary()
+    if not summary:
+        print("No responses were schema-validated")
+        return
+    print(f"{'Endpoint':<38} {'Checked':>8} {'Failed':>7} {'Mean':>9} {'Max':>9}")
+    for key, entry in summary.items():
+        color = Colors.RED if entry['failed'] else ''
+        print(f"{color}{key:<38} {entry['validated']:>8} {entry['failed']:>7} "
+              f"{entry['mean_ms'] * 1000:>7.1f}µs {entry['max_ms'] * 1000:>7.1f}µs{Colors.RESET if color else ''}")
+    validated = sum(entry['validated'] for entry in summary.values())
+    total_ms = sum(entry['total_ms'] for entry in summary.values())
+    print(f"Validated {validated} of {responses} responses ({validated / (responses or 1) * 100:.1f}%), "
+          f"{total_ms:.1f}ms spent validating (not included in response times)")
+
+
+class RoleStats:
+    """Per-role request counts, errors and latency, overall and per endpoint
+    
+    There is one histogram per role and endpoint, so a discovered catalog of
+    100 templates across 4 roles needs 400 of them. Those keep 2 significant
+    digits (~30 KB each rather than ~200 KB), which is plenty for a per-role
+    breakdown table; the per-role totals keep full precision.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms: Dict[str, LatencyHistogram] = {}  # keyed by role
+        self.endpoint_histograms: Dict[str, LatencyHistogram] = {}  # keyed by 'ROLE METHOD /endpoint'
+        self.requests: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+    
+    def add(self, key: str, record: dict):
+        """Fold one serialized QAResult into its role's totals"""
+        role = record.get('role')
+        if not role:
+            return
+        failed = 1 if record['status'] == 'fail' else 0
+        with self.lock:
+            for name, histograms, digits in ((role, self.histograms, 3),
+                                             (f"{role} {key}", self.endpoint_histograms, 2)):
+                histogram = histograms.get(name)
+                if histogram is None:
+                    histogram = histograms[name] = LatencyHistogram(significant_digits=digits)
+                if record.get('response_time') is not None:
+                    histogram.record_ms(record['response_time'])
+                self.requests[name] = self.requests.get(name, 0) + 1
+                self.errors[name] = self.errors.get(name, 0) + failed
+    
+    def summary(self) -> Dict[str, dict]:
+        """Requests, errors and latency per role with a per-endpoint breakdown"""
+        report = {}
+        for role in sorted(self.histograms):
+            endpoints = {
+                name[len(role) + 1:]: {'requests': self.requests[name], 'errors': self.errors[name],
+                                       'summary_ms': histogram.summary_ms()}
+                for name, histogram in sorted(self.endpoint_histograms.items())
+                if name.startswith(f"{role} ")
+            }
+            report[role] = {'requests': self.requests[role], 'errors': self.errors[role],
+                            'summary_ms': self.histograms[role].summary_ms(), 'endpoints': endpoints}
+        return report
+
+
+def print_role_table(roles: RoleStats):
+    """Print latency per role, then per role and endpoint"""
+    if not roles.histograms:
+        return
+    print_latency_table(roles.histograms, roles.errors, roles.requests)
+    print()
+    print_latency_table(roles.endpoint_histograms, roles.errors, roles.requests,
+                        max(38, max(len(key) for key in roles.endpoint_histograms)))
+
+
+class ResultAggregate:
+    """Incrementally maintained, thread-safe counters and latency histograms
+    
+    Memory depends on the number of distinct endpoints and error messages,
+    never on the number of results.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.total = 0
+        self.status_counts: Dict[str, int] = {'pass': 0, 'fail': 0, 'warning': 0}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.endpoint_requests: Dict[str, int] = {}
+        self.endpoint_errors: Dict[str, int] = {}
+        self.error_messages: Dict[str, int] = {}
+        self.phases = PhaseStats()
+        self.payload = PayloadStats()
+        self.validation = ValidationStats()
+        self.roles = RoleStats()
+    
+    @property
+    def errors(self) -> int:
+        return self.status_counts.get('fail', 0)
+    
+    def add(self, record: dict):
+        """Fold one serialized QAResult into the aggregates"""
+        key = f"{record['method']} {record['endpoint']}"
+        status = record['status']
+        with self.lock:
+            self.total += 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            histogram = self.histograms.get(key)
+            if histogram is None:  # Not setdefault: a histogram is ~200 KB to allocate
+                histogram = self.histograms[key] = LatencyHistogram()
+            self.endpoint_requests[key] = self.endpoint_requests.get(key, 0) + 1
+            self.endpoint_errors.setdefault(key, 0)
+            if record.get('response_time') is not None:
+                histogram.record_ms(record['response_time'])
+            if status == 'fail':
+                self.endpoint_errors[key] += 1
+                message = record.get('error') or 'Unknown error'
+                self.error_messages[message] = self.error_messages.get(message, 0) + 1
+        self.phases.add(key, record.get('timings'))
+        self.payload.add(key, record)
+        self.validation.add(key, record)
+        self.roles.add(key, record)
+
+
+class ResultSink:
+    """Append-only NDJSON stream of results plus their running aggregates
+    
+    Every result is appended to the file as one JSON line as soon as it is
+    produced, so a killed run can still be reported (--report-from) or
+    continued (--resume). Reports stream over the file instead of holding
+    results in memory. With no path the sink keeps aggregates only.
+    """
+    
+    def __init__(self, path: str = None, resume: bool = False, run_info: dict = None,
+                 flush_interval: float = 1.0):
+        self.path = Path(path) if path else None
+        self.aggregate = ResultAggregate()
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.file = None
+        self.last_flush = time.monotonic()
         
-        for payload in login_payloads:
-            print(f"Attempting login: {payload['email']}")
-            result = self.test_endpoint('/auth/login', method='POST', 
-                                       requires_auth=False, payload=payload)
-            self.print_result(result)
-            self.results.append(result)
-            
-            if result.status == 'pass':
+        if self.path:
+            if resume and self.path.exists():
+                for record in self.iter_results():
+                    self.aggregate.add(record)
+            self.file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+            self._write_line({'type': 'run', 'started': datetime.now().isoformat(), **(run_info or {})})
+            self.flush()
+    
+    @classmethod
+    def load(cls, path: str) -> 'ResultSink':
+        """Read-only sink over an existing results file, e.g. from a killed run"""
+        sink = cls()
+        sink.path = Path(path)
+        for record in sink.iter_results():
+            sink.aggregate.add(record)
+        return sink
+    
+    def _write_line(self, data: dict):
+        self.file.write(json.dumps(data, separators=(',', ':'), default=str) + '\n')
+    
+    def write(self, result: QAResult) -> dict:
+        """Append one result and fold it into the aggregates; returns its serialized record"""
+        record = result.to_dict()
+        self.aggregate.add(record)
+        if not self.file:
+            return record
+        with self.lock:
+            self._write_line({'type': 'result', **record})
+            now = time.monotonic()
+            if result.status == 'fail' or now - self.last_flush >= self.flush_interval:
+                self.file.flush()
+                self.last_flush = now
+        return record
+    
+    def write_event(self, data: dict):
+        """Append a non-result record, e.g. a closed soak-test window"""
+        if not self.file:
+            return
+        with self.lock:
+            self._write_line(data)
+            self.file.flush()
+            self.last_flush = time.monotonic()
+    
+    def flush(self):
+        if self.file:
+            with self.lock:
+                self.file.flush()
+                self.last_flush = time.monotonic()
+    
+    def close(self):
+        if self.file:
+            with self.lock:
+                self.file.close()
+                self.file = None
+    
+    def iter_results(self, record_type: str = 'result'):
+        """Stream records from the file (a truncated last line is ignored)"""
+        if not self.path or not self.path.exists():
+            return
+        self.flush()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
                 try:
-                    url = f"{self.api_base_url}/auth/login"
-                    response = self.session.post(url, json=payload)
-                    data = response.json()
-                    
-                    # Handle ApiResponse wrapper
-                    if 'data' in data and 'accessToken' in data['data']:
-                        self.token = data['data']['accessToken']
-                    elif 'accessToken' in data:
-                        self.token = data['accessToken']
-                    
-                    if self.token:
-                        print(f"{Colors.GREEN}✓ JWT token obtained{Colors.RESET}\n")
-                        return True
-                except Exception as e:
-                    print(f"{Colors.RED}Failed to extract token: {e}{Colors.RESET}\n")
-        
-        print(f"{Colors.YELLOW}⚠ Could not authenticate - Some tests will fail{Colors.RESET}\n")
-        return False
+                    data = json.loads(line)
+                except ValueError:
+                    continue
+                if data.get('type') == record_type:
+                    yield data
+
+
+class PerformanceBudgets:
+    """Per-endpoint latency, error-rate and payload budgets loaded from JSON
     
-    def test_backend_endpoints(self):
-        """Test all backend API endpoints"""
-        self.print_header("BACKEND API TESTS - READ OPERATIONS")
+    The file has a "default" budget and an ordered "endpoints" mapping of
+    patterns to budgets. Patterns are fnmatch globs matched against
+    "METHOD /endpoint" when they contain a method, else against the path; the
+    first matching pattern wins and missing limits fall back to the default.
+    Limits: p95_ms, p99_ms, max_error_rate (fraction) and max_bytes.
+    """
+    
+    DEFAULT_PATH = Path(__file__).parent / 'qa_budgets.json'
+    DEFAULT_BUDGET = {'p95_ms': 2000, 'p99_ms': 5000}
+    METRICS = ('p95_ms', 'p99_ms', 'max_error_rate', 'max_bytes')
+    
+    def __init__(self, default: dict = None, endpoints: Dict[str, dict] = None):
+        self.default = {**self.DEFAULT_BUDGET, **(default or {})}
+        self.endpoints = endpoints or {}
+        self._cache: Dict[str, Tuple[str, dict]] = {}
+    
+    @classmethod
+    def load(cls, path) -> 'PerformanceBudgets':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for pattern, budget in [('default', data.get('default', {}))] + list(data.get('endpoints', {}).items()):
+            unknown = set(budget) - set(cls.METRICS)
+            if unknown:
+                raise ValueError(f"Unknown budget limits for '{pattern}': {', '.join(sorted(unknown))}")
+        return cls(data.get('default'), data.get('endpoints'))
+    
+    def match(self, key: str) -> Tuple[str, dict]:
+        """(pattern, effective budget) for a 'METHOD /endpoint' key"""
+        if key not in self._cache:
+            path = key.split(' ', 1)[-1]
+            for pattern, budget in self.endpoints.items():
+                if fnmatch.fnmatchcase(key if ' ' in pattern else path, pattern):
+                    self._cache[key] = (pattern, {**self.default, **budget})
+                    break
+            else:
+                self._cache[key] = ('default', self.default)
+        return self._cache[key]
+    
+    def for_key(self, key: str) -> dict:
+        return self.match(key)[1]
+    
+    def check(self, aggregate: 'ResultAggregate') -> List[dict]:
+        """Compare measured aggregates with the budgets; returns one row per violation"""
+        violations = []
+        for key in sorted(aggregate.endpoint_requests):
+            pattern, budget = self.match(key)
+            requests_made = aggregate.endpoint_requests[key]
+            histogram = aggregate.histograms.get(key)
+            percentiles = histogram.percentiles((95, 99)) if histogram is not None else {}
+            measured = {
+                'p95_ms': percentiles[95] / 1000 if percentiles.get(95) is not None else None,
+                'p99_ms': percentiles[99] / 1000 if percentiles.get(99) is not None else None,
+                'max_error_rate': aggregate.endpoint_errors.get(key, 0) / requests_made if requests_made else None,
+                'max_bytes': aggregate.payload.max_size(key),
+            }
+            for metric in self.METRICS:
+                limit = budget.get(metric)
+                if limit is not None and measured[metric] is not None and measured[metric] > limit:
+                    violations.append({'endpoint': key, 'metric': metric, 'budget': limit,
+                                       'measured': measured[metric], 'pattern': pattern})
+        return violations
+
+
+def format_budget_value(metric: str, value) -> str:
+    if metric == 'max_error_rate':
+        return f"{value * 100:.2f}%"
+    if metric == 'max_bytes':
+        return f"{value / 1024:.1f}KB" if value >= 1024 else f"{value}B"
+    return f"{value:.1f}ms" if value < 10 else f"{value:.0f}ms"
+
+
+def print_budget_violations(violations: List[dict]):
+    """Print budget violations as a table (or a confirmation when there are none)"""
+    if not violations:
+        print(f"{Colors.GREEN}✓ All endpoints within performance budgets{Colors.RESET}")
+        return
+    print(f"{Colors.RED}{Colors.BOLD}✗ {len(violations)} performance budget violation(s):{Colors.RESET}")
+    print(f"{'Endpoint':<38} {'Metric':<15} {'Budget':>10} {'Measured':>10}  Pattern")
+    for v in violations:
+        print(f"{Colors.RED}{v['endpoint']:<38} {v['metric']:<15} "
+              f"{format_budget_value(v['metric'], v['budget']):>10} "
+              f"{format_budget_value(v['metric'], v['measured']):>10}{Colors.RESET}  {v['pattern']}")
+
+
+def exit_status(functional_failure: bool, performance_failure: bool) -> int:
+    """0 ok, 1 functional failures, 2 budget violations or regressions, 3 both"""
+    return (1 if functional_failure else 0) | (2 if performance_failure else 0)
+
+
+class ResponseSchemas:
+    """Per-endpoint response schemas compiled once into cached validators
+    
+    DTO schemas mirror the backend response classes field for field, typed with
+    the Java type names: boxed types are nullable, primitives and types marked
+    '!' are not, 'List<T>' is a JSON array and any other name is a nested DTO.
+    Every field must be present (the DTOs serialize nulls). ENDPOINTS maps
+    fnmatch patterns over 'METHOD /endpoint' to the type of the ApiResponse
+    `data` field, 'Void' for no data and None for an empty body; the first
+    matching pattern wins and unmatched endpoints are not checked.
+    """
+    
+    DTOS = {
+        'UserResponse': {
+            'id': 'Long!', 'email': 'String!', 'phone': 'String', 'fullName': 'String', 'roles': 'List<String>',
+        },
+        'AuthResponse': {
+            'accessToken': 'String!', 'tokenType': 'String', 'expiresInSeconds': 'long', 'user': 'UserResponse',
+        },
+        'ClientResponse': {
+            'id': 'Long!', 'name': 'String', 'status': 'String', 'createdAt': 'Instant', 'deletedAt': 'Instant',
+        },
+        'SiteResponse': {
+            'id': 'Long!', 'clientAccountId': 'Long', 'clientAccountName': 'String', 'name': 'String',
+            'address': 'String', 'latitude': 'BigDecimal', 'longitude': 'BigDecimal', 'status': 'String',
+            'createdAt': 'Instant', 'updatedAt': 'Instant', 'deletedAt': 'Instant',
+        },
+        'SitePostResponse': {
+            'id': 'Long!', 'siteId': 'Long', 'siteName': 'String', 'postName': 'String', 'description': 'String',
+            'requiredGuards': 'Integer', 'status': 'String', 'createdAt': 'Instant', 'updatedAt': 'Instant',
+            'deletedAt': 'Instant',
+        },
+        'GuardResponse': {
+            'id': 'Long!', 'userId': 'Long', 'email': 'String', 'supervisorId': 'Long', 'supervisorName': 'String',
+            'employeeCode': 'String', 'firstName': 'String', 'lastName': 'String', 'phone': 'String',
+            'status': 'String', 'hireDate': 'LocalDate', 'baseSalary': 'BigDecimal', 'perDayRate': 'BigDecimal',
+            'overtimeRate': 'BigDecimal',
+        },
+        'GuardDetailResponseDTO': {
+            'id': 'Long!', 'userId': 'Long', 'fullName': 'String', 'email': 'String', 'phone': 'String',
+            'employeeCode': 'String', 'firstName': 'String', 'lastName': 'String', 'active': 'Boolean',
+            'status': 'String', 'hireDate': 'LocalDate', 'supervisorId': 'Long', 'supervisorName': 'String',
+            'baseSalary': 'BigDecimal', 'perDayRate': 'BigDecimal', 'overtimeRate': 'BigDecimal',
+            'assignmentId': 'Long', 'sitePostId': 'Long', 'currentPost': 'String', 'siteId': 'Long',
+            'currentSite': 'String', 'clientId': 'Long', 'clientName': 'String', 'shiftTypeId': 'Long',
+            'shiftType': 'String', 'assignmentEffectiveFrom': 'LocalDate', 'assignmentEffectiveTo': 'LocalDate',
+            'assignmentStatus': 'String', 'licenseNumber': 'String',
+        },
+        'ShiftTypeResponse': {
+            'id': 'Long!', 'name': 'String', 'startTime': 'LocalTime', 'endTime': 'LocalTime',
+            'description': 'String', 'createdAt': 'Instant',
+        },
+        'AssignmentResponse': {
+            'id': 'Long!', 'guardId': 'Long', 'guardEmployeeCode': 'String', 'guardName': 'String',
+            'sitePostId': 'Long', 'sitePostName': 'String', 'siteId': 'Long', 'siteName': 'String',
+            'clientId': 'Long', 'clientName': 'String', 'shiftTypeId': 'Long', 'shiftTypeName': 'String',
+            'shiftStartTime': 'LocalTime', 'shiftEndTime': 'LocalTime', 'effectiveFrom': 'LocalDate',
+            'effectiveTo': 'LocalDate', 'status': 'String', 'notes': 'String', 'createdAt': 'Instant',
+            'updatedAt': 'Instant', 'createdByUserId': 'Long', 'createdByEmail': 'String',
+        },
+        'AttendanceResponse': {
+            'attendanceId': 'Long!', 'attendanceDate': 'LocalDate', 'checkInTime': 'Instant',
+            'checkOutTime': 'Instant', 'status': 'String', 'lateMinutes': 'Integer', 'earlyLeaveMinutes': 'Integer',
+            'notes': 'String', 'guardId': 'Long', 'guardFirstName': 'String', 'guardLastName': 'String',
+            'guardFullName': 'String', 'employeeCode': 'String', 'assignmentId': 'Long', 'sitePostId': 'Long',
+            'postName': 'String', 'siteId': 'Long', 'siteName': 'String', 'clientId': 'Long',
+            'clientName': 'String', 'shiftName': 'String', 'shiftStart': 'String', 'shiftEnd': 'String',
+            'createdAt': 'Instant', 'updatedAt': 'Instant',
+        },
+        'ClientSiteAccessResponse': {
+            'id': 'Long!', 'clientUserId': 'Long', 'clientName': 'String', 'clientEmail': 'String',
+            'siteId': 'Long', 'siteName': 'String', 'grantedAt': 'Instant', 'revokedAt': 'Instant',
+        },
+        'SupervisorSiteResponse': {
+            'id': 'Long!', 'supervisorUserId': 'Long', 'supervisorName': 'String', 'supervisorEmail': 'String',
+            'siteId': 'Long', 'siteName': 'String', 'assignedAt': 'Instant', 'removedAt': 'Instant',
+        },
+        'AdminSummaryDTO': {
+            'totalGuards': 'Long', 'activeGuards': 'Long', 'totalSites': 'Long', 'activeAssignments': 'Long',
+            'todayAttendance': 'Long',
+        },
+        'ManagerSummaryDTO': {
+            'guardsOnDuty': 'Long', 'sitesManaged': 'Long', 'lateToday': 'Long', 'absentToday': 'Long',
+        },
+        'GuardSummaryDTO': {
+            'todayShift': 'String', 'siteName': 'String', 'postName': 'String', 'checkInTime': 'LocalTime',
+            'checkOutTime': 'LocalTime', 'status': 'String',
+        },
+    }
+    
+    ENDPOINTS = (
+        ('POST /auth/login', 'AuthResponse'),
+        ('POST /auth/register', 'UserResponse'),
+        ('GET /auth/me', 'UserResponse'),
+        ('GET /clients', 'List<ClientResponse>'),
+        ('GET /clients/*', 'ClientResponse'),
+        ('POST /clients', 'ClientResponse'),
+        ('GET /sites', 'List<SiteResponse>'),
+        ('GET /sites/*', 'SiteResponse'),
+        ('POST /sites', 'SiteResponse'),
+        ('GET /site-posts', 'List<SitePostResponse>'),
+        ('GET /site-posts/site/*', 'List<SitePostResponse>'),
+        ('GET /site-posts/*', 'SitePostResponse'),
+        ('POST /site-posts', 'SitePostResponse'),
+        ('PUT /site-posts/*', 'SitePostResponse'),
+        ('GET /guards', 'List<GuardResponse>'),
+        ('GET /guards/detailed', 'List<GuardDetailResponseDTO>'),
+        ('GET /guards/me', 'GuardDetailResponseDTO'),
+        ('GET /guards/*', 'GuardResponse'),
+        ('POST /guards', 'GuardResponse'),
+        ('PUT /guards/*', 'GuardResponse'),
+        ('GET /assignments', 'List<AssignmentResponse>'),
+        ('GET /assignments/shift-types', 'List<ShiftTypeResponse>'),
+        ('GET /assignments/guard/*', 'List<AssignmentResponse>'),
+        ('GET /assignments/site-post/*', 'List<AssignmentResponse>'),
+        ('GET /assignments/*', 'AssignmentResponse'),
+        ('POST /assignments', 'AssignmentResponse'),
+        ('DELETE /assignments/*', None),
+        ('POST /attendance/check-in', 'AttendanceResponse'),
+        ('POST /attendance/check-out', 'AttendanceResponse'),
+        ('GET /attendance/today-summary', 'List<AttendanceResponse>'),
+        ('GET /attendance/guard/*', 'List<AttendanceResponse>'),
+        ('GET /attendance/site/*', 'List<AttendanceResponse>'),
+        ('GET /attendance/*', 'AttendanceResponse'),
+        ('GET /client/sites/*', 'List<ClientSiteAccessResponse>'),
+        ('GET /client/site/*/clients', 'List<ClientSiteAccessResponse>'),
+        ('GET /supervisor/sites/*', 'List<SupervisorSiteResponse>'),
+        ('GET /supervisor/site/*/supervisors', 'List<SupervisorSiteResponse>'),
+        ('GET /dashboard/admin-summary', 'AdminSummaryDTO'),
+        ('GET /dashboard/manager-summary', 'ManagerSummaryDTO'),
+        ('GET /dashboard/guard-summary', 'GuardSummaryDTO'),
+        ('DELETE *', 'Void'),
+    )
+    
+    # JSON types accepted for each Java type (Jackson writes java.time values as ISO strings)
+    JSON_TYPES = {
+        'Long': (int,), 'long': (int,), 'Integer': (int,), 'int': (int,),
+        'BigDecimal': (int, float), 'Double': (int, float), 'double': (int, float),
+        'Boolean': (bool,), 'boolean': (bool,), 'String': (str,),
+        'Instant': (str,), 'LocalDate': (str,), 'LocalTime': (str,),
+    }
+    PRIMITIVES = frozenset(('long', 'int', 'double', 'boolean'))
+    
+    def __init__(self):
+        self._types: Dict[str, object] = {}
+        self._endpoints: Dict[str, object] = {}
+    
+    def compile_type(self, spec: str):
+        """Validator for a Java type name: value -> None, or a ': message' suffixed with its path"""
+        if spec in self._types:
+            return self._types[spec]
+        nullable = not spec.endswith('!') and spec not in self.PRIMITIVES
+        name = spec.rstrip('!')
         
-        # Define all endpoints to test
-        endpoints = [
-            # Guards
-            ('/guards', 'GET', True),
-            
-            # Clients
-            ('/clients', 'GET', True),
-            
-            # Sites
-            ('/sites', 'GET', True),
+        if name in self.JSON_TYPES:
+            accepted = self.JSON_TYPES[name] + ((type(None),) if nullable else ())
             
-            # Site Posts
-            ('/site-posts', 'GET', True),
-            
-            # Assignments
-            ('/assignments', 'GET', True),
-            ('/assignments/shift-types', 'GET', True),
-            
-            # Attendance
-            ('/attendance/today-summary', 'GET', True),
+            def check(value):
+                if not isinstance(value, accepted) or (value is True or value is False) and bool not in accepted:
+                    return f": expected {name}, got {type(value).__name__}"
+                return None
+        
+        elif name.startswith('List<') and name.endswith('>'):
+            item_check = self.compile_type(name[5:-1])
             
-            # Auth (public)
-            ('/auth/me', 'GET', True),
-        ]
+            def check(value):
+                if value is None and nullable:
+                    return None
+                if not isinstance(value, list):
+                    return f": expected {name}, got {type(value).__name__}"
+                for index, item in enumerate(value):
+                    error = item_check(item)
+                    if error:
+                        return f"[{index}]{error}"
+                return None
         
-        for endpoint_data in endpoints:
-            endpoint = endpoint_data[0]
-            method = endpoint_data[1] if len(endpoint_data) > 1 else 'GET'
-            requires_auth = endpoint_data[2] if len(endpoint_data) > 2 else True
+        elif name in self.DTOS:
+            fields = self.DTOS[name]
+            required = frozenset(fields)
+            # Scalar fields are checked inline with one isinstance each; DTO and list fields recurse
+            scalars = []
+            nested = []
+            for field, field_spec in fields.items():
+                field_name = field_spec.rstrip('!')
+                if field_name in self.JSON_TYPES:
+                    field_nullable = not field_spec.endswith('!') and field_spec not in self.PRIMITIVES
+                    scalars.append((field, self.JSON_TYPES[field_name] + ((type(None),) if field_nullable else ()),
+                                    field_name))
+                else:
+                    nested.append((field, self.compile_type(field_spec)))
             
-            result = self.test_endpoint(endpoint, method, requires_auth)
-            self.print_result(result)
-            self.results.append(result)
+            def check(value):
+                if value is None and nullable:
+                    return None
+                if not isinstance(value, dict):
+                    return f": expected {name}, got {type(value).__name__}"
+                if not required <= value.keys():
+                    return f": {name} missing {', '.join(sorted(required - value.keys()))}"
+                for field, accepted, field_type in scalars:
+                    field_value = value[field]
+                    if not isinstance(field_value, accepted) or \
+                            (field_value is True or field_value is False) and bool not in accepted:
+                        return f".{field}: expected {field_type}, got {type(field_value).__name__}"
+                for field, field_check in nested:
+                    error = field_check(value[field])
+                    if error:
+                        return f".{field}{error}"
+                return None
+        
+        else:
+            raise ValueError(f"Unknown schema type '{spec}'")
+        
+        self._types[spec] = check
+        return check
     
-    def test_crud_operations(self):
-        """Test create, update, delete operations"""
-        self.print_header("BACKEND API TESTS - CRUD OPERATIONS")
+    def compile_endpoint(self, data_spec: Optional[str]):
+        """Validator for a whole response body: the ApiResponse envelope around `data_spec`"""
+        if data_spec is None:
+            return lambda body: None if body is None else "expected an empty body"
+        data_check = None if data_spec == 'Void' else self.compile_type(data_spec)
         
-        # Test data for integration tests
-        timestamp = int(time.time())
-        created_ids = {}
-        
-        # 1. Create Client
-        print(f"{Colors.BOLD}Testing: Create Client{Colors.RESET}")
-        client_payload = {
-            'name': f'QA Test Client {timestamp}',
-            'status': 'ACTIVE'
+        def check(body):
+            if not isinstance(body, dict):
+                return f"expected an ApiResponse object, got {type(body).__name__}"
+            if body.get('success') is not True:
+                return f"success: expected true, got {body.get('success')!r}"
+            if 'timestamp' not in body:
+                return "ApiResponse missing timestamp"
+            if data_check is None:
+                return None if body.get('data') is None else "data: expected no data"
+            if 'data' not in body:
+                return "ApiResponse missing data"
+            error = data_check(body['data'])
+            return f"data{error}" if error else None
+        return check
+    
+    def validator(self, key: str):
+        """Cached compiled validator for a 'METHOD /endpoint' key (None when unmatched)"""
+        if key not in self._endpoints:
+            for pattern, data_spec in self.ENDPOINTS:
+                if fnmatch.fnmatchcase(key, pattern):
+                    self._endpoints[key] = self.compile_endpoint(data_spec)
+                    break
+            else:
+                self._endpoints[key] = None
+        return self._endpoints[key]
+    
+    def validate(self, key: str, body) -> Optional[str]:
+        """Return the first schema violation of a successful response body, or None"""
+        check = self.validator(key)
+        return check(body) if check is not None else None
+
+
+class BaselineStore:
+    """Named snapshots of per-endpoint latency distributions and payload sizes
+    
+    Each baseline is one JSON file holding the full latency histogram of every
+    endpoint, so a later run can be compared distribution-to-distribution
+    rather than by a single number.
+    """
+    
+    DEFAULT_DIR = Path(__file__).parent / 'qa_baselines'
+    
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else self.DEFAULT_DIR
+    
+    def path(self, name: str) -> Path:
+        if not name or any(c in name for c in '/\\') or name.startswith('.'):
+            raise ValueError(f"Invalid baseline name: {name!r}")
+        return self.directory / f"{name}.json"
+    
+    def save(self, name: str, aggregate: 'ResultAggregate', run_info: dict = None) -> Path:
+        """Write the aggregate's distributions as baseline NAME"""
+        baseline = {
+            'name': name,
+            'created': datetime.now().isoformat(),
+            'run': run_info or {},
+            'endpoints': {
+                key: {
+                    'requests': aggregate.endpoint_requests.get(key, 0),
+                    'errors': aggregate.endpoint_errors.get(key, 0),
+                    'mean_size': aggregate.payload.mean_size(key),
+                    'max_size': aggregate.payload.max_size(key),
+                    'histogram': histogram.to_dict(),
+                }
+                for key, histogram in sorted(aggregate.histograms.items())
+                if histogram.total_count
+            },
         }
-        result = self.test_endpoint('/clients', 'POST', True, client_payload)
-        self.print_result(result)
-        self.results.append(result)
+        path = self.path(name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2)
+        os.replace(tmp_path, path)
+        return path
+    
+    def load(self, name: str) -> dict:
+        with open(self.path(name), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+def compare_to_baseline(baseline: dict, aggregate: 'ResultAggregate', tolerance: float = 0.10,
+                        alpha: float = 0.01, min_samples: int = 5) -> List[dict]:
+    """Classify each endpoint as regression, improvement or unchanged against a baseline
+    
+    A change counts only when it is statistically significant (one-sided
+    Mann-Whitney on the histograms, p < alpha) and the median moved by more
+    than `tolerance`, so run-to-run noise and tiny-but-significant shifts are
+    both ignored. Payload size changes beyond `tolerance` are flagged as well.
+    """
+    rows = []
+    endpoints = baseline.get('endpoints', {})
+    for key in sorted(set(endpoints) | {k for k, h in aggregate.histograms.items() if h.total_count}):
+        row = {'endpoint': key, 'verdict': 'unchanged'}
+        rows.append(row)
+        if key not in endpoints:
+            row['verdict'] = 'new'
+            continue
+        current = aggregate.histograms.get(key)
+        if current is None or not current.total_count:
+            row['verdict'] = 'missing'
+            continue
         
-        if result.status == 'pass':
-            try:
-                response = self.session.post(
-                    f"{self.api_base_url}/clients",
-                    headers={'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'},
-                    json=client_payload
-                )
-                data = response.json()
-                created_ids['client'] = data.get('data', {}).get('id') or data.get('id')
-                print(f"  {Colors.GREEN}Created client ID: {created_ids['client']}{Colors.RESET}")
-            except Exception as e:
-                print(f"  {Colors.RED}Failed to extract client ID: {e}{Colors.RESET}")
+        before = LatencyHistogram.from_dict(endpoints[key]['histogram'])
+        before_pcts, current_pcts = before.percentiles((50, 95)), current.percentiles((50, 95))
+        row.update({
+            'baseline_p50': before_pcts[50] / 1000, 'baseline_p95': before_pcts[95] / 1000,
+            'p50': current_pcts[50] / 1000, 'p95': current_pcts[95] / 1000,
+            'baseline_samples': before.total_count, 'samples': current.total_count,
+        })
+        row['p50_change'] = (row['p50'] - row['baseline_p50']) / row['baseline_p50'] if row['baseline_p50'] else 0.0
+        row['p95_change'] = (row['p95'] - row['baseline_p95']) / row['baseline_p95'] if row['baseline_p95'] else 0.0
         
-        # 2. Create Site (requires client)
-        if 'client' in created_ids:
-            print(f"\n{Colors.BOLD}Testing: Create Site{Colors.RESET}")
-            site_payload = {
-                'clientAccountId': created_ids['client'],
-                'name': f'QA Test Site {timestamp}',
-                'address': '123 Test Street',
-                'status': 'ACTIVE'
-            }
-            result = self.test_endpoint('/sites', 'POST', True, site_payload)
-            self.print_result(result)
-            self.results.append(result)
-            
-            if result.status == 'pass':
-                try:
-                    response = self.session.post(
-                        f"{self.api_base_url}/sites",
-                        headers={'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'},
-                        json=site_payload
-                    )
-                    data = response.json()
-                    created_ids['site'] = data.get('data', {}).get('id') or data.get('id')
-                    print(f"  {Colors.GREEN}Created site ID: {created_ids['site']}{Colors.RESET}")
-                except Exception as e:
-                    print(f"  {Colors.RED}Failed to extract site ID: {e}{Colors.RESET}")
-        
-        # 3. Create Site Post (requires site)
-        if 'site' in created_ids:
-            print(f"\n{Colors.BOLD}Testing: Create Site Post{Colors.RESET}")
-            post_payload = {
-                'siteId': created_ids['site'],
-                'postName': f'QA Gate {timestamp}',
-                'description': 'QA Test Post',
-                'requiredGuards': 1
-            }
-            result = self.test_endpoint('/site-posts', 'POST', True, post_payload)
-            self.print_result(result)
-            self.results.append(result)
-            
-            if result.status == 'pass':
-                try:
-                    response = self.session.post(
-                        f"{self.api_base_url}/site-posts",
-                        headers={'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'},
-                        json=post_payload
-                    )
-                    data = response.json()
-                    created_ids['sitePost'] = data.get('data', {}).get('id') or data.get('id')
-                    print(f"  {Colors.GREEN}Created site post ID: {created_ids['sitePost']}{Colors.RESET}")
-                except Exception as e:
-                    print(f"  {Colors.RED}Failed to extract site post ID: {e}{Colors.RESET}")
-        
-        # 4. Create Guard
-        print(f"\n{Colors.BOLD}Testing: Create Guard{Colors.RESET}")
-        guard_payload = {
-            'email': f'qaguard{timestamp}@test.com',
-            'password': 'Test@123',
-            'fullName': f'QA Guard {timestamp}',
-            'phone': '1234567890',
-            'employeeCode': f'QAG{timestamp}',
-            'firstName': 'QA',
-            'lastName': 'Guard',
-            'baseSalary': 25000.00,
-            'perDayRate': 1000.00,
-            'overtimeRate': 150.00
-        }
-        result = self.test_endpoint('/guards', 'POST', True, guard_payload)
-        self.print_result(result)
-        self.results.append(result)
+        before_size, size = endpoints[key].get('mean_size'), aggregate.payload.mean_size(key)
+        if before_size and size is not None:
+            row['size_change'] = (size - before_size) / before_size
         
-        if result.status == 'pass':
-            try:
-                response = self.session.post(
-                    f"{self.api_base_url}/guards",
-                    headers={'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'},
-                    json=guard_payload
-                )
-                data = response.json()
-                created_ids['guard'] = data.get('data', {}).get('id') or data.get('id')
-                print(f"  {Colors.GREEN}Created guard ID: {created_ids['guard']}{Colors.RESET}")
-            except Exception as e:
-                print(f"  {Colors.RED}Failed to extract guard ID: {e}{Colors.RESET}")
-        
-        # 5. Get Shift Types for assignment
-        shift_type_id = None
+        if min(before.total_count, current.total_count) < min_samples:
+            row['verdict'] = 'insufficient'
+            continue
+        row['p_slower'] = mann_whitney_histograms(before, current)
+        row['p_faster'] = mann_whitney_histograms(current, before)
+        if row['p_slower'] < alpha and row['p50_change'] > tolerance:
+            row['verdict'] = 'regression'
+        elif row['p_faster'] < alpha and row['p50_change'] < -tolerance:
+            row['verdict'] = 'improvement'
+    return rows
+
+
+def print_baseline_comparison(name: str, rows: List[dict], tolerance: float):
+    """Print the per-endpoint regression/improvement table"""
+    colors = {'regression': Colors.RED, 'improvement': Colors.GREEN, 'insufficient': Colors.YELLOW,
+              'new': Colors.BLUE, 'missing': Colors.YELLOW}
+    print(f"{'Endpoint':<38} {'p50 base→now':>18} {'Δp50':>7} {'Δp95':>7} {'Δsize':>7} {'p':>7}  Verdict")
+    for row in rows:
+        color = colors.get(row['verdict'], '')
+        line = f"{row['endpoint']:<38}"
+        if 'p50' in row:
+            size_change = f"{row['size_change'] * 100:+.0f}%" if 'size_change' in row else '-'
+            p_value = min(row['p_slower'], row['p_faster']) if 'p_slower' in row else None
+            line += (f" {row['baseline_p50']:>7.1f}→{row['p50']:>7.1f}ms {row['p50_change'] * 100:>+6.0f}%"
+                     f" {row['p95_change'] * 100:>+6.0f}% {size_change:>7}"
+                     f" {(f'{p_value:.3f}' if p_value is not None else '-'):>7}")
+        else:
+            line += f" {'':>18} {'':>7} {'':>7} {'':>7} {'':>7}"
+        if abs(row.get('size_change', 0)) > tolerance:
+            line += f"  {Colors.YELLOW}size{Colors.RESET}"
+        print(f"{line}  {color}{row['verdict']}{Colors.RESET if color else ''}")
+    
+    regressions = sum(1 for row in rows if row['verdict'] == 'regression')
+    improvements = sum(1 for row in rows if row['verdict'] == 'improvement')
+    color = Colors.RED if regressions else Colors.GREEN
+    print(f"{color}{regressions} regression(s), {improvements} improvement(s) vs baseline '{name}' "
+          f"(noise tolerance ±{tolerance * 100:.0f}%){Colors.RESET}")
+
+
+class TokenCache:
+    """JWT tokens cached on disk per (api_base_url, email)
+    
+    Tokens are reused until `refresh_margin` seconds before the `exp` claim.
+    The file only ever holds tokens (never passwords) and is written with
+    owner-only permissions.
+    """
+    
+    DEFAULT_PATH = Path(__file__).parent / '.qa_token_cache.json'
+    _lock = threading.Lock()
+    
+    def __init__(self, path: Path = None, refresh_margin: int = 120):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.refresh_margin = refresh_margin
+    
+    @staticmethod
+    def decode_expiry(token: str) -> Optional[float]:
+        """`exp` claim of a JWT (signature is not verified)"""
+        import base64
         try:
-            response = self.session.get(
-                f"{self.api_base_url}/assignments/shift-types",
-                headers={'Authorization': f'Bearer {self.token}'}
-            )
-            if response.status_code == 200:
-                data = response.json()
-                shifts = data.get('data', data) if isinstance(data, dict) and 'data' in data else data
-                if shifts and len(shifts) > 0:
-                    shift_type_id = shifts[0].get('id')
-        except:
+            payload = token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            return float(claims['exp'])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _key(api_base_url: str, email: str) -> str:
+        return f"{api_base_url.rstrip('/')}|{email.lower()}"
+    
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self, data: dict):
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+        try:
+            os.chmod(self.path, 0o600)
+        except OSError:
             pass
+    
+    def get(self, api_base_url: str, email: str) -> Optional[str]:
+        """Cached token for this API and user, unless it expires within the refresh margin"""
+        with self._lock:
+            entry = self._load().get(self._key(api_base_url, email))
+        if not entry or not entry.get('token'):
+            return None
+        if entry.get('exp') is None or entry['exp'] - self.refresh_margin <= time.time():
+            return None
+        return entry['token']
+    
+    def put(self, api_base_url: str, email: str, token: str, expires_in: Optional[float] = None):
+        """Store a token; expiry comes from the JWT, else from expiresInSeconds"""
+        exp = self.decode_expiry(token)
+        if exp is None and expires_in:
+            exp = time.time() + float(expires_in)
+        if exp is None:
+            return  # Unknown lifetime - never reuse
+        with self._lock:
+            data = self._load()
+            now = time.time()
+            data = {key: entry for key, entry in data.items() if entry.get('exp', 0) > now}
+            data[self._key(api_base_url, email)] = {
+                'token': token,
+                'exp': exp,
+                'saved_at': datetime.now().isoformat(),
+            }
+            try:
+                self._save(data)
+            except OSError as e:
+                print(f"{Colors.YELLOW}⚠ Could not write token cache {self.path}: {e}{Colors.RESET}")
+    
+    def invalidate(self, api_base_url: str, email: str):
+        """Drop a token the server rejected"""
+        with self._lock:
+            data = self._load()
+            if data.pop(self._key(api_base_url, email), None) is not None:
+                try:
+                    self._save(data)
+                except OSError:
+                    pass
+
+
+class SessionPool:
+    """Pre-authenticated sessions per role, loaded from a credentials file
+    
+    The JSON file maps backend role names to accounts:
+    {"SUPERVISOR": [{"email": "...", "password": "..."}], "GUARD": [...]}.
+    Every account is logged in once up front (concurrently, reusing the token
+    cache) and its user id is read from /auth/me. `client(role, n)` returns a
+    fresh client with its own connection pool carrying the token of the n-th
+    account of that role, so concurrent users spread over the role's accounts.
+    """
+    
+    DEFAULT_PATH = Path(__file__).parent / 'qa_credentials.json'
+    ROLES = ('ADMIN', 'SUPERVISOR', 'CLIENT', 'GUARD')
+    
+    def __init__(self, qa: 'SGMSQASystem', credentials: Dict[str, List[dict]]):
+        self.qa = qa
+        self.credentials = credentials
+        self.sessions: Dict[str, List['SGMSQASystem']] = {}
+        self.failures: List[str] = []
+    
+    @classmethod
+    def load(cls, qa: 'SGMSQASystem', path) -> 'SessionPool':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("expected an object mapping roles to lists of accounts")
+        credentials = {}
+        for role, accounts in data.items():
+            if role.upper() not in cls.ROLES:
+                raise ValueError(f"Unknown role '{role}' (expected one of {', '.join(cls.ROLES)})")
+            if not isinstance(accounts, list) or \
+                    not all(isinstance(a, dict) and a.get('email') and a.get('password') for a in accounts):
+                raise ValueError(f"Accounts for '{role}' must be a list of {{email, password}} objects")
+            credentials.setdefault(role.upper(), []).extend(accounts)
+        return cls(qa, credentials)
+    
+    def authenticate(self, workers: int = 8) -> int:
+        """Log every account in; returns the number of ready sessions"""
+        from concurrent.futures import ThreadPoolExecutor
         
-        # 6. Create Assignment (requires guard, site post, shift type)
-        if 'guard' in created_ids and 'sitePost' in created_ids and shift_type_id:
-            print(f"\n{Colors.BOLD}Testing: Create Assignment{Colors.RESET}")
-            from datetime import date, timedelta
-            assignment_payload = {
-                'guardId': created_ids['guard'],
-                'sitePostId': created_ids['sitePost'],
-                'shiftTypeId': shift_type_id,
-                'effectiveFrom': str(date.today()),
-                'effectiveTo': str(date.today() + timedelta(days=30))
+        accounts = [(role, account) for role, role_accounts in self.credentials.items() for account in role_accounts]
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(accounts) or 1))) as pool:
+            sessions = list(pool.map(lambda item: self.authenticate_account(*item), accounts))
+        
+        for (role, account), session in zip(accounts, sessions):
+            if session is not None:
+                self.sessions.setdefault(role, []).append(session)
+        return sum(len(role_sessions) for role_sessions in self.sessions.values())
+    
+    def authenticate_account(self, role: str, account: dict) -> Optional['SGMSQASystem']:
+        """Log one account in and check it really has `role`"""
+        session = self.qa.spawn()  # Records into its own sink, so setup logins stay out of the run
+        session.token_cache = self.qa.token_cache
+        payload = {'email': account['email'], 'password': account['password']}
+        if not session.login_with(payload):
+            self.failures.append(f"{role} {account['email']}: login failed")
+            return None
+        
+        result = session.test_endpoint('/auth/me')
+        data = session.response_data(result)
+        if result.status == 'fail' or not isinstance(data, dict):
+            self.failures.append(f"{role} {account['email']}: /auth/me failed ({result.error})")
+            return None
+        roles = [str(name).upper().replace('ROLE_', '') for name in data.get('roles') or []]
+        if role not in roles:
+            self.failures.append(f"{role} {account['email']}: account has roles {', '.join(roles) or 'none'}")
+            return None
+        session.role = role
+        session.user_id = data.get('id')
+        return session
+    
+    def roles(self) -> List[str]:
+        return [role for role in self.ROLES if self.sessions.get(role)]
+    
+    def client(self, role: str, index: int = 0) -> 'SGMSQASystem':
+        """New client authenticated as the (index mod n)-th account of `role`"""
+        source = self.sessions[role][index % len(self.sessions[role])]
+        client = self.qa.spawn(role)
+        client.token = source.token
+        client.token_from_cache = source.token_from_cache
+        client.auth_payload = source.auth_payload
+        client.token_cache = source.token_cache
+        client.user_id = source.user_id
+        return client
+    
+    def catalog(self) -> List[Tuple[str, str, str]]:
+        """(endpoint, method, role) load catalog: admin reads plus every role the pool can serve"""
+        entries = [(endpoint, method, 'ADMIN') for endpoint, method, _ in SGMSQASystem.READ_ENDPOINTS]
+        available = set(self.roles()) | {'ADMIN'}
+        return entries + [entry for entry in SGMSQASystem.ROLE_ENDPOINTS if entry[2] in available]
+    
+    def print_status(self):
+        for role in self.ROLES:
+            if role in self.credentials:
+                ready = len(self.sessions.get(role, []))
+                color = Colors.GREEN if ready == len(self.credentials[role]) else Colors.YELLOW
+                print(f"{color}{role:<11} {ready}/{len(self.credentials[role])} sessions{Colors.RESET}")
+        for failure in self.failures:
+            print(f"  {Colors.RED}✗ {failure}{Colors.RESET}")
+
+
+class EndpointCatalog:
+    """GET endpoints discovered from the backend's @*Mapping annotations
+    
+    Routes come from sgms_auditor's route table (.sgms_routes.json), refreshed
+    by file mtime from the controllers under RouteIndex.SOURCE_DIR. Each route
+    is probed with a session of a role its @PreAuthorize allows - the admin
+    session whenever ADMIN may call it, else a pool session.
+    
+    Path variables are filled from IDs harvested from earlier responses: the
+    `id` of items listed by a variable-free endpoint under its resource name
+    (/site-posts -> sitePostId) and `...UserId` from the pool session of that
+    role. {id} only ever takes a listed ID; other variables fall back to any
+    `...Id` field, and since such references may point at rows deleted since,
+    a 404 on one is reported as skipped rather than failed. Routes are probed
+    in rounds, each round fully concurrent: first those without variables,
+    then whichever the IDs harvested so far can fill.
+    
+    Results are recorded under the route template (/sites/{id}) so statistics
+    and baselines don't split by row ID; `probed` keeps the concrete path each
+    template was probed with, which later requests reuse via resolve().
+    """
+    
+    def __init__(self, qa: 'SGMSQASystem', routes: List[dict]):
+        self.qa = qa
+        self.routes = routes  # GET routes from the route table, 'endpoint' relative to the API base URL
+        self.ids: Dict[str, List[int]] = {}  # 'siteId' -> IDs of the sites listed, in discovery order
+        self.references: Dict[str, List[int]] = {}  # 'siteId' -> siteId fields of any item
+        self.clients: Dict[str, Optional['SGMSQASystem']] = {}
+        self.probed: Dict[str, Tuple[str, str]] = {}  # template -> (path, role) of routes that did not fail
+        self.skipped: List[Tuple[str, str]] = []  # (route, reason)
+        self.rounds = 0
+    
+    @classmethod
+    def discover(cls, qa: 'SGMSQASystem') -> Optional['EndpointCatalog']:
+        """Catalog of the GET routes in the backend sources, or None without sources or sgms_auditor"""
+        if not ROUTE_INDEX_AVAILABLE:
+            return None
+        root = Path(__file__).parent
+        source_dir = root / RouteIndex.SOURCE_DIR
+        if not source_dir.is_dir():
+            return None
+        table = RouteIndex.load(root)
+        table.update(SourceIndex(source_dir), source_dir)
+        try:
+            table.save()
+        except OSError:
+            pass  # A read-only checkout still gets this run's table
+        
+        prefix = urlsplit(qa.api_base_url).path.rstrip('/')
+        routes = []
+        for route in table.routes:
+            if route['method'] != 'GET':
+                continue
+            path = route['path'][len(prefix):] if prefix and route['path'].startswith(prefix + '/') else route['path']
+            routes.append(dict(route, endpoint=path))
+        return cls(qa, routes)
+    
+    @staticmethod
+    def resource_key(segment: str) -> str:
+        """'site-posts' -> 'sitePostId'"""
+        words = segment.split('-')
+        name = words[0] + ''.join(word.title() for word in words[1:])
+        if name.endswith('s') and not name.endswith('ss'):
+            name = name[:-1]
+        return f"{name}Id"
+    
+    def client(self, route: dict) -> Optional['SGMSQASystem']:
+        """Session allowed to call a route, or None if no session has one of its roles"""
+        roles = route['roles']
+        if not roles or 'ADMIN' in roles:
+            return self.qa
+        for role in roles:
+            if role not in self.clients:
+                pool = self.qa.pool
+                self.clients[role] = pool.client(role) if pool is not None and role in pool.roles() else None
+            if self.clients[role] is not None:
+                return self.clients[role]
+        return None
+    
+    def session_user_id(self, variable: str) -> Optional[int]:
+        """User id of the pool session for a 'clientUserId'-style variable"""
+        role = variable[:-len('UserId')].upper()
+        pool = self.qa.pool
+        if pool is None or role not in pool.roles():
+            return None
+        return pool.sessions[role][0].user_id
+    
+    def fill(self, route: dict) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """(endpoint with its path variables filled, None, ['name=value' taken from references])
+        or (None, first variable without a value, [])"""
+        endpoint = route['endpoint']
+        referenced = []
+        for variable in route['path_variables']:
+            name = variable['name']
+            key = name
+            if name == 'id':
+                key = self.resource_key(endpoint.split('{', 1)[0].rstrip('/').rsplit('/', 1)[-1])
+            value = self.session_user_id(name) if name.endswith('UserId') else None
+            if value is None and self.ids.get(key):
+                value = self.ids[key][0]
+            if value is None and name != 'id' and self.references.get(key):
+                value = self.references[key][0]
+                referenced.append(f"{name}={value}")
+            if value is None:
+                return None, name, []
+            endpoint = re.sub(r'\{' + name + r'(?::[^}]*)?\}', str(value), endpoint, count=1)
+        return endpoint, None, referenced
+    
+    def harvest(self, route: dict, result: QAResult):
+        """Collect IDs from a successful response"""
+        data = self.qa.response_data(result)
+        items = data if isinstance(data, list) else [data]
+        collection = None
+        if not route['path_variables']:
+            collection = self.resource_key(route['endpoint'].rstrip('/').rsplit('/', 1)[-1])
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            found = [(self.references, key, value) for key, value in item.items() if key.endswith('Id')]
+            if collection and 'id' in item:
+                found.append((self.ids, collection, item['id']))
+            for harvested, key, value in found:
+                if isinstance(value, int) and not isinstance(value, bool) and value not in harvested.get(key, []):
+                    harvested.setdefault(key, []).append(value)
+    
+    def probe(self, batch: List[Tuple[dict, str, 'SGMSQASystem', List[str]]], workers: int):
+        """Request a batch of (route, endpoint, client, references) concurrently; record and harvest in catalog order"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batch)))) as pool:
+            results = list(pool.map(lambda item: item[2].test_endpoint(item[1]), batch))
+        for (route, endpoint, client, referenced), result in zip(batch, results):
+            if referenced and result.status_code == 404:
+                self.skipped.append((route['endpoint'], f"stale reference {', '.join(referenced)} (404)"))
+                continue
+            result.endpoint = route['endpoint']
+            self.qa.record(result)
+            if result.status != 'fail':
+                self.probed[route['endpoint']] = (endpoint, client.role or 'ADMIN')
+                self.harvest(route, result)
+    
+    def run(self, workers: int = 8):
+        """Probe every discovered GET route, round by round as path variables become resolvable"""
+        pending = []
+        for route in self.routes:
+            if self.client(route) is None:
+                self.skipped.append((route['endpoint'], f"no session for {' or '.join(route['roles'])}"))
+            else:
+                pending.append(route)
+        
+        while pending:
+            batch, unresolved = [], []
+            for route in pending:
+                endpoint, _, referenced = self.fill(route)
+                if endpoint is None:
+                    unresolved.append(route)
+                else:
+                    batch.append((route, endpoint, self.client(route), referenced))
+            if not batch:
+                break
+            self.rounds += 1
+            self.probe(batch, workers)
+            pending = unresolved
+        
+        for route in pending:
+            self.skipped.append((route['endpoint'], f"no ID harvested for {{{self.fill(route)[1]}}}"))
+    
+    @property
+    def targets(self) -> List[Tuple[str, str, str]]:
+        """(endpoint, method, role) catalog of the routes probed without failing, in route order"""
+        return [(route['endpoint'], 'GET', self.probed[route['endpoint']][1])
+                for route in self.routes if route['endpoint'] in self.probed]
+    
+    def print_skipped(self):
+        if self.skipped:
+            print(f"\n{Colors.YELLOW}⚠ {len(self.skipped)} discovered endpoint(s) not probed:{Colors.RESET}")
+            for endpoint, reason in self.skipped:
+                print(f"  {Colors.YELLOW}{endpoint:<44} {reason}{Colors.RESET}")
+
+
+# Connection setup timings of the request currently being sent on this thread
+_connection_phases = threading.local()
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """urllib3 connection that times name resolution and TCP connect separately
+    
+    The host is resolved once, timed, and every resolved address is then tried
+    in order - as urllib3's create_connection does - so a host resolving to
+    ::1 first still reaches a server listening on 127.0.0.1 only.
+    """
+    
+    def _new_conn(self):
+        host = self._dns_host
+        start_ns = time.perf_counter_ns()
+        try:
+            addresses = list(dict.fromkeys(
+                info[4][0] for info in socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)))
+        except OSError:
+            addresses = []
+        addresses = addresses or [host]  # Let urllib3 raise its usual resolution error
+        resolved_ns = time.perf_counter_ns()
+        
+        try:
+            for position, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except (NewConnectionError, ConnectTimeoutError):
+                    if position == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+        
+        _connection_phases.value = {
+            'dns': (resolved_ns - start_ns) / 1_000_000,
+            'connect': (time.perf_counter_ns() - resolved_ns) / 1_000_000,
+        }
+        return sock
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """HTTPS connection that additionally times the TLS handshake"""
+    
+    def connect(self):
+        start_ns = time.perf_counter_ns()
+        super().connect()
+        phases = getattr(_connection_phases, 'value', None)
+        if phases is not None:
+            total = (time.perf_counter_ns() - start_ns) / 1_000_000
+            phases['tls'] = max(0.0, total - phases['dns'] - phases['connect'])
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class PhaseTimingAdapter(HTTPAdapter):
+    """Transport adapter exposing connection setup timings on each response
+    
+    `response.connection_phases` holds dns/connect(/tls) in ms when the request
+    opened a new connection, or None when a pooled connection was reused.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+    
+    def send(self, request, **kwargs):
+        _connection_phases.value = None
+        response = super().send(request, **kwargs)
+        response.connection_phases = _connection_phases.value
+        return response
+
+
+def request_timings(response: requests.Response, total: float) -> Dict[str, float]:
+    """Split a request's wall time into connection setup, TTFB and download phases (ms)"""
+    phases = getattr(response, 'connection_phases', None) or {}
+    setup = sum(phases.values())
+    # requests stops the elapsed clock once headers are parsed
+    headers_at = min(response.elapsed.total_seconds() * 1000, total)
+    timings = dict(phases)
+    timings.update({
+        'ttfb': max(0.0, headers_at - setup),
+        'download': total - headers_at,
+        'total': total,
+        'reused': not phases,
+    })
+    return timings
+
+
+def response_sizes(response: requests.Response) -> Dict[str, object]:
+    """Decompressed size, bytes on the wire and content encoding of a consumed response"""
+    transferred = None
+    try:
+        transferred = response.raw.tell()  # urllib3 counts raw bytes read from the socket
+    except (AttributeError, OSError, ValueError):
+        pass
+    if not transferred and response.headers.get('Content-Length', '').isdigit():
+        transferred = int(response.headers['Content-Length'])
+    return {
+        'size': len(response.content),
+        'transferred': transferred,
+        'encoding': response.headers.get('Content-Encoding', 'identity').lower(),
+    }
+
+
+def count_items(data) -> Optional[int]:
+    """Top-level item count of a list payload (a plain list or a Spring page)"""
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict) and isinstance(data.get('content'), list):
+        return len(data['content'])
+    return None
+
+
+# Simulated client networks: name -> (downlink kbit/s, round-trip time ms)
+NETWORK_PROFILES = {
+    'slow-3g': (400, 400),
+    'fast-3g': (1600, 150),
+    '4g': (9000, 60),
+    'wifi': (30000, 20),
+}
+
+
+def parse_network_profiles(text: str) -> Dict[str, Tuple[float, float]]:
+    """'slow-3g,4g' or 'NAME:KBPS:RTT_MS' entries -> {name: (kbit/s, rtt ms)}"""
+    profiles = {}
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        if ':' in item:
+            if item.count(':') != 2:
+                raise ValueError(f"Network profile '{item}' must be NAME:KBPS:RTT_MS")
+            name, kbps, rtt = item.split(':')
+            if float(kbps) <= 0 or float(rtt) < 0:
+                raise ValueError(f"Network profile '{item}' needs a positive bandwidth and RTT")
+            profiles[name] = (float(kbps), float(rtt))
+        elif item in NETWORK_PROFILES:
+            profiles[item] = NETWORK_PROFILES[item]
+        else:
+            raise ValueError(f"Unknown network profile '{item}' "
+                             f"(known: {', '.join(NETWORK_PROFILES)}; or NAME:KBPS:RTT_MS)")
+    return profiles
+
+
+class PageAssetParser(HTMLParser):
+    """Scripts, stylesheets and preloads referenced by an HTML page"""
+    
+    def __init__(self):
+        super().__init__()
+        self.assets: List[dict] = []  # {'href', 'kind', 'critical'}
+    
+    def handle_starttag(self, tag: str, attrs):
+        attrs = dict(attrs)
+        if tag == 'script' and attrs.get('src'):
+            # Classic and module scripts both gate an SPA's first render; async ones do not
+            self.assets.append({'href': attrs['src'], 'kind': 'script', 'critical': 'async' not in attrs})
+        elif tag == 'link' and attrs.get('href'):
+            rel = (attrs.get('rel') or '').lower().split()
+            if 'stylesheet' in rel:
+                self.assets.append({'href': attrs['href'], 'kind': 'style',
+                                    'critical': (attrs.get('media') or 'all') != 'print'})
+            elif 'modulepreload' in rel:
+                self.assets.append({'href': attrs['href'], 'kind': 'script', 'critical': True})
+            elif 'preload' in rel:
+                kind = attrs.get('as') or 'other'
+                self.assets.append({'href': attrs['href'], 'kind': kind, 'critical': kind in ('script', 'style')})
+
+
+class AssetWaterfall:
+    """Concurrent fetch of the assets frontend pages reference, plus a load-time model
+    
+    Every script, stylesheet and preload referenced by the fetched pages is
+    requested once, six at a time like a browser, with compression negotiated.
+    Only first-level references are followed (not ES module imports or CSS
+    url()s), so point --frontend-url at a production build (vite build &&
+    vite preview) to see real bundle weights.
+    
+    The simulated critical-path time of a page on a (kbit/s, RTT) profile is:
+    connection setup (DNS + TCP, + TLS for https: one RTT each) + one RTT and
+    the HTML's wire bytes, then the render-blocking assets in parallel - new
+    origins pay their own setup, each origin one RTT per six requests - and
+    their summed wire bytes through the shared downlink. Slow start and
+    server think time are ignored.
+    """
+    
+    CONNECTIONS_PER_ORIGIN = 6
+    
+    def __init__(self, qa: 'SGMSQASystem', profiles: Dict[str, Tuple[float, float]] = None):
+        self.qa = qa
+        self.profiles = profiles if profiles is not None else parse_network_profiles('slow-3g,fast-3g,4g')
+        self.pages: Dict[str, dict] = {}  # route -> {'url', 'size', 'transferred', 'assets': [urls]}
+        self.assets: Dict[str, dict] = {}  # absolute URL -> kind, critical and, once fetched, its metrics
+        self.elapsed = 0.0
+    
+    def add_page(self, route: str, url: str, html: str, sizes: dict):
+        """Register a fetched page and the assets its HTML references"""
+        parser = PageAssetParser()
+        parser.feed(html)
+        urls = []
+        for ref in parser.assets:
+            absolute = urljoin(url, ref['href'])
+            if absolute not in urls:
+                urls.append(absolute)
+            entry = self.assets.setdefault(absolute, {'kind': ref['kind'], 'critical': False})
+            entry['critical'] = entry['critical'] or ref['critical']
+        self.pages[route] = {'url': url, 'size': sizes.get('size'), 'transferred': sizes.get('transferred'),
+                             'assets': urls}
+    
+    def is_first_party(self, url: str) -> bool:
+        return urlsplit(url)[:2] == urlsplit(self.qa.frontend_url)[:2]
+    
+    def fetch(self, url: str, batch_start: float) -> QAResult:
+        """GET one asset and note its start offset, time and sizes"""
+        entry = self.assets[url]
+        first_party = self.is_first_party(url)
+        endpoint = urlsplit(url).path if first_party else url
+        # Unreachable third-party assets (CDNs, fonts) are warnings, not failures of our frontend
+        status = 'fail' if first_party else 'warning'
+        
+        started = time.perf_counter()
+        entry['start'] = (started - batch_start) * 1000
+        try:
+            response = self.qa.session.get(url, timeout=10)
+        except requests.exceptions.RequestException as e:
+            message = f'Asset unreachable: {type(e).__name__}'
+            return QAResult(endpoint, 'GET', status, error=message if first_party else None,
+                            warning=None if first_party else message)
+        response_time = (time.perf_counter() - started) * 1000
+        sizes = response_sizes(response)
+        entry.update(time=response_time, status_code=response.status_code, **sizes)
+        timings = request_timings(response, response_time)
+        
+        if response.status_code != 200:
+            message = f'Asset returned HTTP {response.status_code}'
+            return QAResult(endpoint, 'GET', status, response.status_code, response_time,
+                            error=message if first_party else None, warning=None if first_party else message,
+                            timings=timings, **sizes)
+        return QAResult(endpoint, 'GET', 'pass', response.status_code, response_time, timings=timings, **sizes)
+    
+    def run(self):
+        """Fetch every referenced asset concurrently and record the results"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if not self.assets:
+            return
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.CONNECTIONS_PER_ORIGIN) as pool:
+            results = list(pool.map(lambda url: self.fetch(url, start), list(self.assets)))
+        self.elapsed = (time.perf_counter() - start) * 1000
+        for result in results:
+            self.qa.record(result)
+    
+    def page_weight(self, route: str) -> Tuple[int, int]:
+        """(decompressed, wire) bytes of a page's HTML plus all its fetched assets"""
+        page = self.pages[route]
+        size = (page['size'] or 0) + sum(self.assets[url].get('size') or 0 for url in page['assets'])
+        wire = (page['transferred'] or 0) + sum(self.assets[url].get('transferred') or 0 for url in page['assets'])
+        return size, wire
+    
+    def critical_path_ms(self, route: str, kbps: float, rtt_ms: float) -> float:
+        """Simulated time until a page's HTML and render-blocking assets have arrived"""
+        page = self.pages[route]
+        bytes_per_ms = kbps / 8
+        
+        def setup(url: str) -> float:
+            return rtt_ms * (3 if urlsplit(url).scheme == 'https' else 2)
+        
+        elapsed = setup(page['url']) + rtt_ms + (page['transferred'] or 0) / bytes_per_ms
+        critical = [url for url in page['assets'] if self.assets[url]['critical']]
+        if not critical:
+            return elapsed
+        
+        page_origin = urlsplit(page['url'])[:2]
+        by_origin: Dict[tuple, List[str]] = {}
+        for url in critical:
+            by_origin.setdefault(urlsplit(url)[:2], []).append(url)
+        latency = max((0 if origin == page_origin else setup(urls[0])) +
+                      rtt_ms * -(-len(urls) // self.CONNECTIONS_PER_ORIGIN)
+                      for origin, urls in by_origin.items())
+        wire = sum(self.assets[url].get('transferred') or 0 for url in critical)
+        return elapsed + latency + wire / bytes_per_ms
+    
+    def summary(self) -> dict:
+        """Assets, per-route page weight and simulated critical-path times for reports"""
+        return {
+            'profiles': {name: {'kbps': kbps, 'rtt_ms': rtt} for name, (kbps, rtt) in self.profiles.items()},
+            'elapsed_ms': self.elapsed,
+            'assets': self.assets,
+            'pages': {
+                route: {
+                    'assets': len(page['assets']),
+                    'bytes': self.page_weight(route)[0],
+                    'transferred': self.page_weight(route)[1],
+                    'critical_path_ms': {name: self.critical_path_ms(route, kbps, rtt)
+                                         for name, (kbps, rtt) in self.profiles.items()},
+                }
+                for route, page in self.pages.items()
+            },
+        }
+    
+    def print_report(self, bar_width: int = 30):
+        """Print the asset waterfall and per-route page weight and load times"""
+        if not self.pages:
+            return
+        if not self.assets:
+            print("No scripts, stylesheets or preloads referenced by the frontend routes")
+        else:
+            scale = bar_width / max(self.elapsed, 1e-9)
+            width = max(38, max(len(self.label(url)) for url in self.assets))
+            print(f"{'Asset':<{width}} {'Type':<7} {'Size':>9} {'Wire':>9} {'Encoding':>9} {'Time':>8}  Waterfall")
+            for url, entry in sorted(self.assets.items(), key=lambda item: item[1].get('start', 0)):
+                time_ms = entry.get('time')
+                bar = ' ' * int(entry.get('start', 0) * scale)
+                bar += '█' * max(1, int(time_ms * scale)) if time_ms is not None else '✗'
+                color = Colors.RED if entry.get('status_code') != 200 else ''
+                print(f"{color}{self.label(url):<{width}} {entry['kind'] + ('*' if entry['critical'] else ''):<7} "
+                      f"{format_bytes(entry.get('size')):>9} {format_bytes(entry.get('transferred')):>9} "
+                      f"{entry.get('encoding') or '-':>9} "
+                      f"{(f'{time_ms:.0f}ms' if time_ms is not None else 'failed'):>8}  "
+                      f"|{bar:<{bar_width}}|{Colors.RESET if color else ''}")
+            print(f"(* render-blocking; all assets fetched in {self.elapsed:.0f}ms)")
+        
+        print()
+        header = f"{'Route':<24} {'Assets':>6} {'Weight':>9} {'Wire':>9}"
+        header += ''.join(f" {name:>9}" for name in self.profiles)
+        print(header)
+        for route, page in self.pages.items():
+            size, wire = self.page_weight(route)
+            row = f"{route:<24} {len(page['assets']):>6} {format_bytes(size):>9} {format_bytes(wire):>9}"
+            for kbps, rtt in self.profiles.values():
+                row += f" {self.critical_path_ms(route, kbps, rtt) / 1000:>8.2f}s"
+            print(row)
+        print("Profiles: " + ', '.join(f"{name} {kbps:g}kbit/s {rtt:g}ms RTT"
+                                       for name, (kbps, rtt) in self.profiles.items()))
+    
+    def label(self, url: str, limit: int = 60) -> str:
+        parts = urlsplit(url)
+        label = parts.path if self.is_first_party(url) else f"{parts.netloc}{parts.path}"
+        return label if len(label) <= limit else label[:limit - 1] + '…'
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """'public, max-age=600' -> {'public': None, 'max-age': '600'}"""
+    directives = {}
+    for part in filter(None, (item.strip() for item in (value or '').split(','))):
+        name, _, argument = part.partition('=')
+        directives[name.strip().lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def format_age(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return '-'
+    for unit, size in (('y', 31536000), ('d', 86400), ('h', 3600), ('m', 60)):
+        if seconds >= size:
+            return f"{seconds / size:.0f}{unit}"
+    return f"{seconds:.0f}s"
+
+
+class CacheAudit:
+    """Two-fetch HTTP caching audit of the frontend assets and GET endpoints
+    
+    Every resource is fetched plainly, then again with the validators the
+    first response carried (If-None-Match / If-Modified-Since). A repeat visit
+    then costs nothing for a response that is still fresh (max-age or Expires
+    and no no-cache), the conditional fetch when it has to revalidate - a 304
+    if the server honours validators - and the full body again for no-store.
+    
+    Flagged: content-hashed assets (Vite's name-<hash>.js) without a long
+    max-age, un-hashed assets, HTML shells and the service worker cached long
+    enough to outlive a deploy, and authenticated API responses that shared
+    caches may store.
+    """
+    
+    # Vite/Rollup content hashes: 8+ base64url characters with a digit or capital
+    HASHED_NAME = re.compile(r'[.-](?=[\w-]*[0-9A-Z])[\w-]{8,}\.(?:m?js|css|woff2?|ttf|png|jpe?g|gif|svg|webp|avif)$')
+    LONG_LIVED = 30 * 86400  # Shortest acceptable max-age for content-hashed assets
+    UNHASHED_MAX_AGE = 3600  # Longest acceptable freshness for a URL that survives deploys
+    # public/ files loaded by scripts rather than referenced from the HTML
+    EXTRA_PATHS = ('/service-worker.js',)
+    
+    def __init__(self, qa: 'SGMSQASystem', waterfall: AssetWaterfall = None):
+        self.qa = qa
+        self.waterfall = waterfall
+        self.entries: Dict[str, dict] = {}  # URL -> label, kind, headers, both fetches and repeat-visit cost
+        self.routes: Dict[str, List[str]] = {}  # route -> URLs a visit loads
+        self.findings: List[dict] = []  # {'resource', 'severity', 'message'}
+        self.lock = threading.Lock()
+    
+    def kind(self, url: str) -> str:
+        path = urlsplit(url).path
+        if path.endswith('service-worker.js') or path.endswith('sw.js'):
+            return 'sw'
+        if self.waterfall is not None and any(page['url'] == url for page in self.waterfall.pages.values()):
+            return 'html'
+        return 'hashed' if self.HASHED_NAME.search(path) else 'asset'
+    
+    def targets(self) -> List[Tuple[str, str, str, Optional['SGMSQASystem']]]:
+        """(route, URL, label, client) of everything to probe; API requests carry the client's token"""
+        targets = []
+        if self.waterfall is not None and self.waterfall.pages:
+            for route, page in self.waterfall.pages.items():
+                for url in [page['url']] + page['assets']:
+                    targets.append((route, url, self.waterfall.label(url), None))
+            for path in self.EXTRA_PATHS:
+                targets.append((path, f"{self.qa.frontend_url}{path}", path, None))
+        
+        clients = {}
+        for endpoint, method, role in self.qa.request_catalog():
+            if method != 'GET':
+                continue
+            if role not in clients:
+                clients[role] = self.qa.pool.client(role) if self.qa.pool is not None and \
+                    role in self.qa.pool.roles() else self.qa if role == 'ADMIN' else None
+            client = clients[role]
+            if client is None or not client.token:
+                continue
+            label = f"GET {endpoint}"
+            targets.append((label, f"{self.qa.api_base_url}{client.resolve(endpoint)}", label, client))
+        return targets
+    
+    @staticmethod
+    def fetch(session: requests.Session, url: str, headers: dict) -> dict:
+        started = time.perf_counter()
+        try:
+            response = session.get(url, headers=headers, timeout=10)
+        except requests.exceptions.RequestException as e:
+            return {'error': type(e).__name__}
+        sizes = response_sizes(response)
+        return {'status_code': response.status_code, 'time': (time.perf_counter() - started) * 1000,
+                'transferred': sizes['transferred'] or 0, 'size': sizes['size'], 'headers': response.headers}
+    
+    @staticmethod
+    def freshness(directives: Dict[str, Optional[str]], headers) -> Optional[float]:
+        """Seconds a browser may reuse the response without asking; None if unspecified (heuristic)"""
+        if 'no-store' in directives or 'no-cache' in directives:
+            return 0
+        if 'max-age' in directives:
+            try:
+                return max(0, int(directives['max-age'] or 0))
+            except ValueError:
+                return 0
+        if headers.get('Expires'):
+            try:
+                expires = parsedate_to_datetime(headers['Expires'])
+                date = parsedate_to_datetime(headers['Date']) if headers.get('Date') else None
+                now = date or datetime.now(expires.tzinfo)
+                return max(0, (expires - now).total_seconds())
+            except (TypeError, ValueError):
+                return 0  # Invalid dates such as 'Expires: 0' mean already expired
+        return None
+    
+    def probe(self, route: str, url: str, label: str, client: Optional['SGMSQASystem']):
+        """Fetch a resource plainly, then conditionally, and work out what a repeat visit costs"""
+        with self.lock:
+            self.routes.setdefault(route, []).append(url)
+            if url in self.entries:
+                return
+            entry = self.entries[url] = {'label': label, 'kind': 'api' if client else self.kind(url)}
+        headers = {'Authorization': f'Bearer {client.token}'} if client is not None else {}
+        session = client.session if client is not None else self.qa.session
+        
+        first = self.fetch(session, url, headers)
+        entry['first'] = first
+        if first.get('error') or first['status_code'] != 200:
+            first.pop('headers', None)
+            return
+        
+        response_headers = first.pop('headers')
+        directives = parse_cache_control(response_headers.get('Cache-Control'))
+        entry.update(cache_control=response_headers.get('Cache-Control'), etag=response_headers.get('ETag'),
+                     last_modified=response_headers.get('Last-Modified'),
+                     freshness=self.freshness(directives, response_headers))
+        conditional = dict(headers)
+        if entry['etag']:
+            conditional['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            conditional['If-Modified-Since'] = entry['last_modified']
+        entry['conditional'] = len(conditional) > len(headers)
+        second = entry['second'] = self.fetch(session, url, conditional)
+        second.pop('headers', None)
+        
+        if 'no-store' in directives:
+            entry['policy'], repeat_bytes, repeat_ms = 'no-store', first['transferred'], first['time']
+        elif entry['freshness']:
+            entry['policy'], repeat_bytes, repeat_ms = 'fresh', 0, 0.0
+        elif second.get('error'):
+            entry['policy'], repeat_bytes, repeat_ms = 'revalidate', first['transferred'], first['time']
+        else:
+            entry['policy'], repeat_bytes, repeat_ms = 'revalidate', second['transferred'], second['time']
+        entry.update(repeat_bytes=repeat_bytes, repeat_ms=repeat_ms,
+                     saved_bytes=first['transferred'] - repeat_bytes, saved_ms=max(0.0, first['time'] - repeat_ms))
+        self.check(entry, directives, bool(headers))
+    
+    def check(self, entry: dict, directives: Dict[str, Optional[str]], authenticated: bool):
+        """Flag cache policies that waste bandwidth or risk serving stale or private content"""
+        kind, freshness = entry['kind'], entry['freshness']
+        policy = f"'{entry['cache_control']}'" if entry['cache_control'] else 'no Cache-Control'
+        
+        def flag(severity: str, message: str):
+            with self.lock:
+                self.findings.append({'resource': entry['label'], 'severity': severity, 'message': message})
+        
+        if kind == 'hashed':
+            if not freshness or freshness < self.LONG_LIVED:
+                flag('error', f"content-hashed asset served with {policy}; "
+                              f"use 'public, max-age=31536000, immutable'")
+            elif 'immutable' not in directives:
+                flag('warning', "long-lived but not 'immutable': reloads still revalidate it")
+        elif kind == 'sw' and freshness:
+            flag('error', f"service worker fresh for {format_age(freshness)} ({policy}); "
+                          f"updates reach users late - serve it with 'no-cache'")
+        elif kind == 'html' and freshness:
+            flag('error', f"HTML shell fresh for {format_age(freshness)} ({policy}); "
+                          f"after a deploy it points at stale asset hashes - serve it with 'no-cache'")
+        elif kind == 'asset' and freshness and freshness > self.UNHASHED_MAX_AGE:
+            flag('error', f"un-hashed asset fresh for {format_age(freshness)} ({policy}); "
+                          f"a deploy keeps serving stale code - add a content hash or shorten max-age")
+        elif kind == 'api' and authenticated and ('public' in directives or 's-maxage' in directives):
+            flag('error', f"authenticated response cacheable by shared caches ({policy}); "
+                          f"use 'private' or 'no-store'")
+        
+        if freshness is None and 'no-store' not in directives:
+            flag('warning', "no Cache-Control or Expires: browsers pick a heuristic lifetime")
+        if entry['policy'] == 'revalidate' and kind != 'api':
+            if not entry['conditional']:
+                flag('warning', "no ETag or Last-Modified: every revalidation downloads the full body")
+            elif entry['second'].get('status_code') == 200:
+                flag('warning', "validators ignored: the conditional request returned 200 with the full body")
+    
+    def run(self, workers: int = 6):
+        from concurrent.futures import ThreadPoolExecutor
+        
+        targets = self.targets()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda target: self.probe(*target), targets))
+        # Extra public/ paths the frontend does not serve are not part of the app
+        for path in self.EXTRA_PATHS:
+            url = f"{self.qa.frontend_url}{path}"
+            if url in self.entries and self.entries[url]['first'].get('status_code') == 404:
+                del self.entries[url]
+                del self.routes[path]
+        self.findings.sort(key=lambda finding: (finding['severity'] != 'error', finding['resource']))
+    
+    def route_costs(self) -> Dict[str, dict]:
+        """First- and repeat-visit bytes and fetch time per route"""
+        costs = {}
+        for route, urls in self.routes.items():
+            entries = [self.entries[url] for url in dict.fromkeys(urls) if 'policy' in self.entries[url]]
+            costs[route] = {
+                'resources': len(entries),
+                'first_bytes': sum(entry['first']['transferred'] for entry in entries),
+                'first_ms': sum(entry['first']['time'] for entry in entries),
+                'repeat_bytes': sum(entry['repeat_bytes'] for entry in entries),
+                'repeat_ms': sum(entry['repeat_ms'] for entry in entries),
             }
-            result = self.test_endpoint('/assignments', 'POST', True, assignment_payload)
+        return costs
+    
+    def revalidation_counts(self) -> Tuple[int, int]:
+        """(conditional requests sent, answered 304)"""
+        conditional = [entry for entry in self.entries.values() if entry.get('conditional')]
+        return len(conditional), sum(entry['second'].get('status_code') == 304 for entry in conditional)
+    
+    @staticmethod
+    def revisit(entry: dict) -> str:
+        """How a repeat visit gets the resource: from cache, a 304, or a full download"""
+        if entry['policy'] == 'fresh':
+            return f"fresh {format_age(entry['freshness'])}"
+        if entry['policy'] == 'no-store':
+            return 'no-store'
+        return str(entry['second'].get('status_code') or entry['second'].get('error'))
+    
+    def summary(self) -> dict:
+        sent, not_modified = self.revalidation_counts()
+        return {
+            'resources': self.entries,
+            'routes': self.route_costs(),
+            'conditional_requests': sent,
+            'not_modified': not_modified,
+            'findings': self.findings,
+        }
+    
+    def print_report(self):
+        if not self.entries:
+            print("Nothing to audit")
+            return
+        width = max(30, max(len(entry['label']) for entry in self.entries.values()))
+        print(f"{'Resource':<{width}} {'Kind':<6} {'Cache-Control':<38} {'Validators':<10} "
+              f"{'Revisit':<10} {'Saved':>9} {'Time':>7}")
+        for entry in sorted(self.entries.values(), key=lambda entry: (entry['kind'] == 'api', entry['label'])):
+            first = entry['first']
+            if 'policy' not in entry:
+                problem = first.get('error') or f"HTTP {first['status_code']}"
+                print(f"{Colors.RED}{entry['label']:<{width}} {entry['kind']:<6} {problem}{Colors.RESET}")
+                continue
+            validators = '+'.join(name for name, key in (('ETag', 'etag'), ('LM', 'last_modified')) if entry[key])
+            cache_control = entry['cache_control'] or '-'
+            if len(cache_control) > 38:
+                cache_control = cache_control[:37] + '…'
+            print(f"{entry['label']:<{width}} {entry['kind']:<6} {cache_control:<38} {validators or '-':<10} "
+                  f"{self.revisit(entry):<10} {format_bytes(entry['saved_bytes']):>9} {entry['saved_ms']:>5.0f}ms")
+        
+        print()
+        costs = self.route_costs()
+        route_width = max(24, max(len(route) for route in costs))
+        print(f"{'Route':<{route_width}} {'Items':>5} {'1st visit':>10} {'Repeat':>10} {'Saved':>10} "
+              f"{'Time saved':>10}")
+        for route, cost in costs.items():
+            saved = cost['first_bytes'] - cost['repeat_bytes']
+            share = f" {saved / cost['first_bytes'] * 100:3.0f}%" if cost['first_bytes'] else ''
+            print(f"{route:<{route_width}} {cost['resources']:>5} {format_bytes(cost['first_bytes']):>10} "
+                  f"{format_bytes(cost['repeat_bytes']):>10} {format_bytes(saved):>10} "
+                  f"{max(0.0, cost['first_ms'] - cost['repeat_ms']):>8.0f}ms{share}")
+        
+        sent, not_modified = self.revalidation_counts()
+        rate = f" ({not_modified / sent * 100:.0f}%)" if sent else ''
+        print(f"\nConditional requests: {sent} sent, {not_modified} answered 304{rate}")
+        print("(Revisit: fresh = served from cache without a request; 304/200 = status of the conditional "
+              "refetch; bytes are body bytes on the wire)")
+        
+        if not self.findings:
+            print(f"{Colors.GREEN}✓ No caching misconfigurations found{Colors.RESET}")
+        for finding in self.findings:
+            color, mark = (Colors.RED, '✗') if finding['severity'] == 'error' else (Colors.YELLOW, '⚠')
+            print(f"{color}{mark} {finding['resource']}: {finding['message']}{Colors.RESET}")
+
+
+class SGMSQASystem:
+    """Main QA testing system"""
+    
+    # Read-only endpoints exercised by test_backend_endpoints and load mode
+    # (endpoint, method, requires_auth)
+    READ_ENDPOINTS = [
+        # Guards
+        ('/guards', 'GET', True),
+        
+        # Clients
+        ('/clients', 'GET', True),
+        
+        # Sites
+        ('/sites', 'GET', True),
+        
+        # Site Posts
+        ('/site-posts', 'GET', True),
+        
+        # Assignments
+        ('/assignments', 'GET', True),
+        ('/assignments/shift-types', 'GET', True),
+        
+        # Attendance
+        ('/attendance/today-summary', 'GET', True),
+        
+        # Auth (public)
+        ('/auth/me', 'GET', True),
+    ]
+    
+    # Dashboard, site-access and self-service endpoints by the role allowed to call
+    # them (@PreAuthorize); {userId} is the calling session's own user id
+    # (endpoint, method, role)
+    ROLE_ENDPOINTS = [
+        ('/dashboard/admin-summary', 'GET', 'ADMIN'),
+        
+        ('/dashboard/manager-summary', 'GET', 'SUPERVISOR'),
+        ('/supervisor/sites/{userId}', 'GET', 'SUPERVISOR'),
+        ('/guards', 'GET', 'SUPERVISOR'),
+        ('/site-posts', 'GET', 'SUPERVISOR'),
+        ('/assignments', 'GET', 'SUPERVISOR'),
+        ('/attendance/today-summary', 'GET', 'SUPERVISOR'),
+        ('/auth/me', 'GET', 'SUPERVISOR'),
+        
+        ('/client/sites/{userId}', 'GET', 'CLIENT'),
+        ('/auth/me', 'GET', 'CLIENT'),
+        
+        ('/dashboard/guard-summary', 'GET', 'GUARD'),
+        ('/guards/me', 'GET', 'GUARD'),
+        ('/auth/me', 'GET', 'GUARD'),
+    ]
+    
+    def __init__(self, api_base_url: str, frontend_url: str, admin_email: str = None,
+                 admin_password: str = None, verbose: bool = True,
+                 token_cache: 'TokenCache' = None, sink: ResultSink = None,
+                 budgets: PerformanceBudgets = None, schemas: ResponseSchemas = None,
+                 validate_sample: float = 1.0):
+        self.api_base_url = api_base_url.rstrip('/')
+        self.frontend_url = frontend_url.rstrip('/')
+        self.admin_email = admin_email
+        self.admin_password = admin_password
+        self.verbose = verbose
+        self.sink = sink or ResultSink()
+        self.stats = ResultAggregate()  # This run's results only; the sink also holds resumed ones
+        self.budgets = budgets or PerformanceBudgets()
+        self.schemas = schemas  # None disables response schema validation
+        self.validate_sample = validate_sample  # Fraction of responses validated
+        self.token: Optional[str] = None
+        self.token_cache = token_cache
+        self.token_from_cache = False
+        self.auth_payload: Optional[dict] = None
+        self.session = requests.Session()
+        self.session.mount('http://', PhaseTimingAdapter())
+        self.session.mount('https://', PhaseTimingAdapter())
+        self.lock = threading.RLock()
+        self.crud_workers = 4
+        self.network_profiles: Optional[Dict[str, Tuple[float, float]]] = None
+        self.waterfall: Optional[AssetWaterfall] = None
+        self.audit_caching = True
+        self.cache_audit: Optional[CacheAudit] = None
+        self.role: Optional[str] = None  # Role of the authenticated account, tagged on results
+        self.user_id: Optional[int] = None
+        self.pool: Optional[SessionPool] = None
+        self.discover_endpoints = True
+        self.probe_workers = 8
+        self.catalog: Optional[EndpointCatalog] = None
+        
+    def print_header(self, text: str):
+        """Print section header"""
+        if not self.verbose:
+            return
+        print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}")
+        print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.RESET}")
+        print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}\n")
+    
+    def record(self, result: QAResult):
+        """Print a result, stream it to the result sink and count it towards this run"""
+        with self.lock:
             self.print_result(result)
-            self.results.append(result)
+        self.stats.add(self.sink.write(result))
+    
+    @property
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """Per-endpoint latency histograms of everything recorded so far"""
+        return self.sink.aggregate.histograms
+    
+    @contextmanager
+    def unrecorded(self):
+        """Send setup traffic (e.g. logins before a load run) quietly, into a throwaway sink"""
+        sink, stats, verbose = self.sink, self.stats, self.verbose
+        self.sink, self.stats, self.verbose = ResultSink(), ResultAggregate(), False
+        try:
+            yield
+        finally:
+            self.sink, self.stats, self.verbose = sink, stats, verbose
+    
+    def log(self, message: str):
+        """Print a progress message unless running quietly"""
+        if self.verbose:
+            print(message)
+    
+    def print_result(self, result: QAResult):
+        """Print test result to terminal"""
+        if not self.verbose:
+            return
+        status_icon = {
+            'pass': f"{Colors.GREEN}✔{Colors.RESET}",
+            'fail': f"{Colors.RED}❌{Colors.RESET}",
+            'warning': f"{Colors.YELLOW}⚠{Colors.RESET}"
+        }
+        
+        icon = status_icon.get(result.status, '?')
+        method_color = Colors.BLUE
+        
+        # Build the whole line first so concurrent scenario steps don't interleave
+        line = f"{icon} {method_color}{result.method}{Colors.RESET} {result.endpoint}"
+        
+        if result.status_code:
+            code_color = Colors.GREEN if result.status_code < 300 else Colors.RED
+            line += f" - {code_color}{result.status_code}{Colors.RESET}"
+        
+        if result.response_time:
+            budget = self.budgets.for_key(result.key)
+            time_color = Colors.GREEN if result.response_time < budget['p95_ms'] else \
+                Colors.YELLOW if result.response_time < budget['p99_ms'] else Colors.RED
+            line += f" - {time_color}{result.response_time:.0f}ms{Colors.RESET}"
+        
+        if result.error:
+            line += f"\n  {Colors.RED}Error: {result.error}{Colors.RESET}"
+        elif result.warning:
+            line += f"\n  {Colors.YELLOW}Warning: {result.warning}{Colors.RESET}"
+        
+        print(line)
+    
+    def test_endpoint(self, endpoint: str, method: str = 'GET', 
+                     requires_auth: bool = True, payload: dict = None,
+                     retry_auth: bool = True) -> QAResult:
+        """Test a single endpoint
+        
+        The returned QAResult carries the parsed JSON body, response headers and
+        a timing breakdown, so callers never repeat a request just to read it.
+        """
+        url = f"{self.api_base_url}{endpoint}"
+        headers = {}
+        sent_token = self.token if requires_auth else None
+        
+        if sent_token:
+            headers['Authorization'] = f'Bearer {sent_token}'
+        
+        try:
+            start_ns = time.perf_counter_ns()
+            
+            if method == 'GET':
+                response = self.session.get(url, headers=headers, timeout=10)
+            elif method == 'POST':
+                headers['Content-Type'] = 'application/json'
+                response = self.session.post(url, headers=headers, json=payload, timeout=10)
+            elif method == 'DELETE':
+                response = self.session.delete(url, headers=headers, timeout=10)
+            else:
+                return QAResult(endpoint, method, 'fail', error='Unsupported HTTP method', role=self.role)
             
-            if result.status == 'pass':
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # Convert to ms
+            
+            # Parse the body exactly once
+            body = None
+            json_valid = response.status_code == 204
+            decode_start_ns = time.perf_counter_ns()
+            if response.content:
                 try:
-                    response = self.session.post(
-                        f"{self.api_base_url}/assignments",
-                        headers={'Authorization': f'Bearer {self.token}', 'Content-Type': 'application/json'},
-                        json=assignment_payload
-                    )
-                    data = response.json()
-                    created_ids['assignment'] = data.get('data', {}).get('id') or data.get('id')
-                    print(f"  {Colors.GREEN}Created assignment ID: {created_ids['assignment']}{Colors.RESET}")
-                except Exception as e:
-                    print(f"  {Colors.RED}Failed to extract assignment ID: {e}{Colors.RESET}")
-        
-        # 7. Test Check-in (requires guard)
-        if 'guard' in created_ids and 'assignment' in created_ids:
-            print(f"\n{Colors.BOLD}Testing: Check-in{Colors.RESET}")
-            checkin_payload = {'guardId': created_ids['guard']}
-            result = self.test_endpoint('/attendance/check-in', 'POST', True, checkin_payload)
-            self.print_result(result)
-            self.results.append(result)
+                    body = response.json()
+                    json_valid = True
+                except ValueError:
+                    json_valid = False
+            decode_time = (time.perf_counter_ns() - decode_start_ns) / 1_000_000
             
-            if result.status == 'pass':
-                created_ids['attendance'] = True
-        
-        # 8. Test Check-out (requires previous check-in)
-        if created_ids.get('attendance'):
-            print(f"\n{Colors.BOLD}Testing: Check-out{Colors.RESET}")
-            checkout_payload = {'guardId': created_ids['guard']}
-            result = self.test_endpoint('/attendance/check-out', 'POST', True, checkout_payload)
-            self.print_result(result)
-            self.results.append(result)
+            timings = request_timings(response, response_time)
+            timings['json_decode'] = decode_time
+            sizes = response_sizes(response)
+            items = count_items(self.unwrap(body))
+            schema_valid = None
+            
+            def verdict(status: str, error: str = None, warning: str = None) -> QAResult:
+                return QAResult(endpoint, method, status, response.status_code, response_time,
+                                error=error, warning=warning, body=body,
+                                headers=response.headers, timings=timings, items=items,
+                                schema_valid=schema_valid, role=self.role, **sizes)
+            
+            # Check for errors
+            if response.status_code == 401:
+                # A cached token may have been revoked or signed with a rotated secret
+                if sent_token and retry_auth and self.token_from_cache and self.reauthenticate(sent_token):
+                    return self.test_endpoint(endpoint, method, requires_auth, payload, retry_auth=False)
+                return verdict('fail', error='Unauthorized - Check JWT token')
+            
+            if response.status_code == 500:
+                error_msg = 'Internal Server Error'
+                if isinstance(body, dict) and 'message' in body:
+                    error_msg += f": {body['message']}"
+                return verdict('fail', error=error_msg)
+            
+            if response.status_code >= 400:
+                # Check for ErrorResponse {success: false, message, timestamp, path}
+                if isinstance(body, dict) and body.get('success') == False:
+                    error_msg = body.get('message', 'Unknown error')
+                    return verdict('fail', error=f'Backend error: {error_msg}')
+                
+                return verdict('fail', error=f'HTTP {response.status_code}')
+            
+            # Check for HTML response when expecting JSON
+            content_type = response.headers.get('Content-Type', '')
+            if 'text/html' in content_type:
+                return verdict('fail', error='HTML response received (expected JSON) - Check CORS or server routing')
+            
+            # Check for 302 redirect
+            if response.status_code == 302:
+                return verdict('fail', error='Redirect detected - API should return JSON, not redirect')
+            
+            # Check response time against the endpoint's budget
+            warning = None
+            budget = self.budgets.for_key(f"{method} {endpoint}")
+            if response_time > budget['p99_ms']:
+                warning = f"Very slow response (>{budget['p99_ms']:g}ms p99 budget)"
+            elif response_time > budget['p95_ms']:
+                warning = f"Slow response (>{budget['p95_ms']:g}ms p95 budget)"
+            
+            # Validate JSON
+            if not json_valid:
+                return verdict('fail', error='Invalid JSON response')
+            
+            # Validate the response shape (a sampled fraction under load; not part of response_time)
+            validator = self.schemas.validator(f"{method} {endpoint}") if self.schemas is not None else None
+            if validator is not None and (self.validate_sample >= 1 or random.random() < self.validate_sample):
+                validate_start_ns = time.perf_counter_ns()
+                schema_error = validator(body)
+                timings['validate'] = (time.perf_counter_ns() - validate_start_ns) / 1_000_000
+                schema_valid = schema_error is None
+                if schema_error:
+                    return verdict('fail', error=f'Schema mismatch: {schema_error}')
+            
+            status = 'warning' if warning else 'pass'
+            return verdict(status, warning=warning)
+            
+        except requests.exceptions.Timeout:
+            return QAResult(endpoint, method, 'fail', error='Request timeout (>10s)', role=self.role)
+        except requests.exceptions.ConnectionError:
+            return QAResult(endpoint, method, 'fail', error='Connection failed - Is server running?', role=self.role)
+        except Exception as e:
+            return QAResult(endpoint, method, 'fail', error=str(e), role=self.role)
+    
+    def spawn(self, role: str = None) -> 'SGMSQASystem':
+        """Quiet, unauthenticated client with these settings and its own connection pool"""
+        client = SGMSQASystem(self.api_base_url, self.frontend_url, self.admin_email, self.admin_password,
+                              verbose=False, budgets=self.budgets, schemas=self.schemas,
+                              validate_sample=self.validate_sample)
+        client.role = role
+        client.catalog = self.catalog
+        return client
+    
+    def resolve(self, endpoint: str) -> str:
+        """Concrete path of a catalog endpoint
         
-        # 9. Cancel Assignment
-        if 'assignment' in created_ids:
-            print(f"\n{Colors.BOLD}Testing: Cancel Assignment{Colors.RESET}")
-            result = self.test_endpoint(f'/assignments/{created_ids["assignment"]}/cancel', 'POST', True)
-            self.print_result(result)
-            self.results.append(result)
+        Discovered routes get the path their probe used; the {userId}
+        placeholder is filled with this session's user id.
+        """
+        if self.catalog is not None and endpoint in self.catalog.probed:
+            return self.catalog.probed[endpoint][0]
+        return endpoint.replace('{userId}', str(self.user_id)) if '{userId}' in endpoint else endpoint
+    
+    def test_route(self, endpoint: str, method: str = 'GET', payload: dict = None) -> QAResult:
+        """Test a catalog endpoint, recorded under the endpoint as written in the catalog
         
-        # 10. Delete Site Post
-        if 'sitePost' in created_ids:
-            print(f"\n{Colors.BOLD}Testing: Delete Site Post{Colors.RESET}")
-            result = self.test_endpoint(f'/site-posts/{created_ids["sitePost"]}', 'DELETE', True)
-            self.print_result(result)
-            self.results.append(result)
+        Statistics, budgets and baselines then stay keyed by /sites/{id} or
+        /client/sites/{userId} whichever IDs the request was sent with.
+        """
+        result = self.test_endpoint(self.resolve(endpoint), method, True, payload)
+        result.endpoint = endpoint
+        return result
+    
+    def request_catalog(self) -> List[Tuple[str, str, str]]:
+        """(endpoint, method, role) catalog of load runs and the caching audit
+        
+        The discovered GET routes once discovery has run; otherwise the read
+        endpoints plus the role endpoints of ADMIN and every role the session
+        pool can serve.
+        """
+        if self.catalog is not None and self.catalog.targets:
+            return self.catalog.targets
+        if self.pool is not None:
+            return self.pool.catalog()
+        return [(endpoint, method, 'ADMIN') for endpoint, method, _ in self.READ_ENDPOINTS] + \
+            [entry for entry in self.ROLE_ENDPOINTS if entry[2] == 'ADMIN']
+    
+    def discover_catalog(self) -> Optional['EndpointCatalog']:
+        """Discover and probe the GET routes as the catalog of a load run, without recording the probes"""
+        with self.unrecorded():
+            if not self.token:
+                self.login_admin()
+            catalog = EndpointCatalog.discover(self)
+            if catalog is None or not catalog.routes:
+                return None
+            catalog.run(self.probe_workers)
+        self.catalog = catalog
+        print(f"{Colors.GREEN}✓ Endpoint catalog: {len(catalog.targets)} discovered GET endpoint(s)"
+              f"{f' ({len(catalog.skipped)} not resolvable)' if catalog.skipped else ''}{Colors.RESET}")
+        return catalog
+    
+    @staticmethod
+    def unwrap(body):
+        """Unwrap the ApiResponse {success, data, message} envelope of a parsed body"""
+        if isinstance(body, dict) and 'data' in body:
+            return body['data']
+        return body
+    
+    @classmethod
+    def response_data(cls, result: QAResult):
+        """Unwrap the ApiResponse envelope of a result body"""
+        return cls.unwrap(result.body)
+    
+    @classmethod
+    def created_id(cls, result: QAResult):
+        """ID of the resource returned by a successful create call"""
+        data = cls.response_data(result)
+        return data.get('id') if isinstance(data, dict) else None
+    
+    def login_admin(self) -> bool:
+        """Login as admin to get JWT token
+        
+        A still-valid token from the token cache is reused without calling
+        /auth/login; otherwise candidate credentials are tried in order.
+        """
+        self.print_header("AUTHENTICATION TEST")
+        
+        # Try credentials from .env if available, then fallback to defaults
+        login_payloads = []
+        
+        if self.admin_email and self.admin_password:
+            login_payloads.append({'email': self.admin_email, 'password': self.admin_password})
+            self.log(f"{Colors.BLUE}Using credentials from .env file{Colors.RESET}")
+        else:
+            self.log(f"{Colors.YELLOW}No .env credentials found, using defaults{Colors.RESET}")
+        
+        # Fallback credentials
+        login_payloads.extend([
+            {'email': 'admin@sgms.com', 'password': 'admin123'},
+            {'email': 'admin@test.com', 'password': 'admin123'},
+            {'email': 'test@admin.com', 'password': 'Test@123'},
+        ])
+        
+        if self.token_cache:
+            for payload in login_payloads:
+                token = self.token_cache.get(self.api_base_url, payload['email'])
+                if token:
+                    self.token = token
+                    self.auth_payload = payload
+                    self.token_from_cache = True
+                    self.role = 'ADMIN'
+                    expiry = TokenCache.decode_expiry(token)
+                    expires = datetime.fromtimestamp(expiry).strftime('%Y-%m-%d %H:%M:%S') if expiry else 'unknown'
+                    self.log(f"{Colors.GREEN}✓ Reusing cached JWT token for {payload['email']} "
+                             f"(expires {expires}){Colors.RESET}\n")
+                    return True
+        
+        for payload in login_payloads:
+            self.log(f"Attempting login: {payload['email']}")
+            if self.login(payload):
+                self.role = 'ADMIN'
+                self.log(f"{Colors.GREEN}✓ JWT token obtained{Colors.RESET}\n")
+                return True
+        
+        self.log(f"{Colors.YELLOW}⚠ Could not authenticate - Some tests will fail{Colors.RESET}\n")
+        return False
+    
+    def login(self, payload: dict) -> bool:
+        """POST /auth/login once and keep (and cache) the returned token"""
+        result = self.test_endpoint('/auth/login', method='POST', 
+                                   requires_auth=False, payload=payload)
+        self.record(result)
+        
+        if result.status == 'fail':
+            return False
+        
+        # Handle ApiResponse wrapper
+        data = self.response_data(result)
+        if not isinstance(data, dict) or not data.get('accessToken'):
+            self.log(f"{Colors.RED}Failed to extract token: no accessToken in response{Colors.RESET}\n")
+            return False
+        
+        self.token = data['accessToken']
+        self.auth_payload = payload
+        self.token_from_cache = False
+        user = data.get('user')
+        self.user_id = user.get('id') if isinstance(user, dict) else None
+        if self.token_cache:
+            self.token_cache.put(self.api_base_url, payload['email'], self.token,
+                                 data.get('expiresInSeconds'))
+        return True
+    
+    def login_with(self, payload: dict) -> bool:
+        """Authenticate as one account, reusing its cached token while still valid"""
+        token = self.token_cache.get(self.api_base_url, payload['email']) if self.token_cache else None
+        if token:
+            self.token = token
+            self.auth_payload = payload
+            self.token_from_cache = True
+            return True
+        return self.login(payload)
+    
+    def reauthenticate(self, rejected_token: str) -> bool:
+        """Replace a cached token the server rejected with a fresh login"""
+        with self.lock:
+            if self.token != rejected_token:
+                return True  # Another thread already refreshed it
+            if not self.auth_payload:
+                return False
+            self.log(f"{Colors.YELLOW}⚠ Cached token rejected (401) - logging in again{Colors.RESET}")
+            if self.token_cache:
+                self.token_cache.invalidate(self.api_base_url, self.auth_payload['email'])
+            return self.login(self.auth_payload)
+    
+    def test_backend_endpoints(self):
+        """Test all backend API endpoints
+        
+        GET endpoints are discovered from the controllers when the backend
+        sources are next to this script; otherwise READ_ENDPOINTS is used.
+        """
+        catalog = EndpointCatalog.discover(self) if self.discover_endpoints else None
+        if catalog is not None and catalog.routes:
+            self.print_header(f"BACKEND API TESTS - {len(catalog.routes)} DISCOVERED GET ENDPOINTS")
+            started = time.perf_counter()
+            catalog.run(self.probe_workers)
+            if self.verbose:
+                catalog.print_skipped()
+            self.log(f"Probed {len(catalog.routes) - len(catalog.skipped)} endpoint(s) in {catalog.rounds} "
+                     f"round(s), {time.perf_counter() - started:.2f}s")
+            self.catalog = catalog
+            return
+        
+        self.print_header("BACKEND API TESTS - READ OPERATIONS")
+        
+        for endpoint_data in self.READ_ENDPOINTS:
+            endpoint = endpoint_data[0]
+            method = endpoint_data[1] if len(endpoint_data) > 1 else 'GET'
+            requires_auth = endpoint_data[2] if len(endpoint_data) > 2 else True
+            
+            result = self.test_endpoint(endpoint, method, requires_auth)
+            self.record(result)
+    
+    def test_role_endpoints(self):
+        """Test the role-specific endpoints, each with a session of the role it requires
+        
+        Sessions come from the credentials pool; admin endpoints fall back to the
+        main admin session and roles without credentials are skipped.
+        """
+        self.print_header("BACKEND API TESTS - ROLE ENDPOINTS")
+        
+        clients = {}
+        skipped = set()
+        for endpoint, method, role in self.ROLE_ENDPOINTS:
+            if role not in clients:
+                if self.pool is not None and role in self.pool.roles():
+                    clients[role] = self.pool.client(role)
+                elif role == 'ADMIN':
+                    clients[role] = self
+                else:
+                    skipped.add(role)
+                    continue
+            client = clients[role]
+            self.record(client.test_route(endpoint, method))
+        
+        if skipped:
+            self.log(f"{Colors.YELLOW}⚠ No credentials for {', '.join(sorted(skipped))} - "
+                     f"their endpoints were skipped (see --credentials){Colors.RESET}")
+    
+    def test_crud_operations(self):
+        """Test create, update, delete operations
+        
+        The flow is declared as a DAG of scenario steps: client → site → site post
+        and guard both feed assignment → check-in → check-out → cancel. Independent
+        chains run concurrently on a worker pool.
+        """
+        self.print_header("BACKEND API TESTS - CRUD OPERATIONS")
+        
+        scheduler = ScenarioScheduler(self, self.crud_scenario_steps(), self.crud_workers)
+        scheduler.run()
+        scheduler.print_report()
+        return scheduler
+    
+    def crud_scenario_steps(self, tag: str = None) -> List['ScenarioStep']:
+        """CRUD integration scenario as scenario steps with explicit inputs and outputs"""
+        from datetime import date, timedelta
+        
+        # Test data for integration tests
+        timestamp = tag or str(int(time.time()))
+        
+        def create(endpoint: str, output: str, payload_fn):
+            def action(inputs):
+                result = self.test_endpoint(endpoint, 'POST', True, payload_fn(inputs))
+                outputs = {}
+                if result.status != 'fail':
+                    resource_id = self.created_id(result)
+                    if resource_id is not None:
+                        outputs[output] = resource_id
+                return result, outputs
+            return action
+        
+        def fetch_shift_type(inputs):
+            result = self.test_endpoint('/assignments/shift-types')
+            shifts = self.response_data(result) if result.status != 'fail' else None
+            outputs = {}
+            if isinstance(shifts, list) and shifts and isinstance(shifts[0], dict) and shifts[0].get('id'):
+                outputs['shiftType'] = shifts[0]['id']
+            return result, outputs
+        
+        def attendance(endpoint: str, output: str):
+            def action(inputs):
+                result = self.test_endpoint(endpoint, 'POST', True, {'guardId': inputs['guard']})
+                return result, ({output: True} if result.status != 'fail' else {})
+            return action
+        
+        def delete(endpoint_fn):
+            def action(inputs):
+                return self.test_endpoint(endpoint_fn(inputs), 'DELETE', True), {}
+            return action
+        
+        return [
+            ScenarioStep('Create Client', create('/clients', 'client', lambda i: {
+                'name': f'QA Test Client {timestamp}',
+                'status': 'ACTIVE'
+            }), provides=['client']),
+            ScenarioStep('Create Site', create('/sites', 'site', lambda i: {
+                'clientAccountId': i['client'],
+                'name': f'QA Test Site {timestamp}',
+                'address': '123 Test Street',
+                'status': 'ACTIVE'
+            }), requires=['client'], provides=['site']),
+            ScenarioStep('Create Site Post', create('/site-posts', 'sitePost', lambda i: {
+                'siteId': i['site'],
+                'postName': f'QA Gate {timestamp}',
+                'description': 'QA Test Post',
+                'requiredGuards': 1
+            }), requires=['site'], provides=['sitePost']),
+            ScenarioStep('Create Guard', create('/guards', 'guard', lambda i: {
+                'email': f'qaguard{timestamp}@test.com',
+                'password': 'Test@123',
+                'fullName': f'QA Guard {timestamp}',
+                'phone': '1234567890',
+                'employeeCode': f'QAG{timestamp}',
+                'firstName': 'QA',
+                'lastName': 'Guard',
+                'baseSalary': 25000.00,
+                'perDayRate': 1000.00,
+                'overtimeRate': 150.00
+            }), provides=['guard']),
+            ScenarioStep('Get Shift Types', fetch_shift_type, provides=['shiftType']),
+            ScenarioStep('Create Assignment', create('/assignments', 'assignment', lambda i: {
+                'guardId': i['guard'],
+                'sitePostId': i['sitePost'],
+                'shiftTypeId': i['shiftType'],
+                'effectiveFrom': str(date.today()),
+                'effectiveTo': str(date.today() + timedelta(days=30))
+            }), requires=['guard', 'sitePost', 'shiftType'], provides=['assignment']),
+            ScenarioStep('Check-in', attendance('/attendance/check-in', 'attendance'),
+                         requires=['guard', 'assignment'], provides=['attendance']),
+            ScenarioStep('Check-out', attendance('/attendance/check-out', 'checkedOut'),
+                         requires=['guard', 'attendance'], provides=['checkedOut']),
+            # Cleanup steps run once earlier steps settle, whether or not they passed
+            ScenarioStep('Cancel Assignment', delete(lambda i: f"/assignments/{i['assignment']}"),
+                         requires=['assignment'], after=['Check-in', 'Check-out']),
+            ScenarioStep('Delete Site Post', delete(lambda i: f"/site-posts/{i['sitePost']}"),
+                         requires=['sitePost'], after=['Cancel Assignment', 'Create Assignment']),
+        ]
     
     def test_frontend_routes(self):
-        """Test frontend routes"""
+        """Test frontend routes, then fetch and weigh the assets their HTML references"""
         self.print_header("FRONTEND ROUTES TEST")
+        waterfall = AssetWaterfall(self, self.network_profiles)
         
         routes = [
             '/portal',
@@ -488,31 +2812,50 @@ class SGMSQASystem:
         for route in routes:
             url = f"{self.frontend_url}{route}"
             try:
-                start_time = time.time()
-                response = requests.get(url, timeout=10)
-                response_time = (time.time() - start_time) * 1000
+                start_ns = time.perf_counter_ns()
+                response = self.session.get(url, timeout=10)
+                response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+                timings = request_timings(response, response_time)
+                sizes = response_sizes(response)
                 
                 if response.status_code == 200:
-                    result = QAResult(route, 'GET', 'pass', response.status_code, response_time)
+                    result = QAResult(route, 'GET', 'pass', response.status_code, response_time,
+                                      timings=timings, **sizes)
+                    if 'html' in response.headers.get('Content-Type', ''):
+                        waterfall.add_page(route, response.url, response.text, sizes)
                 elif response.status_code == 404:
                     result = QAResult(route, 'GET', 'fail', response.status_code, response_time,
-                                    error='Route not found - Check React Router config')
+                                    error='Route not found - Check React Router config', timings=timings, **sizes)
                 else:
                     result = QAResult(route, 'GET', 'fail', response.status_code, response_time,
-                                    error=f'HTTP {response.status_code}')
+                                    error=f'HTTP {response.status_code}', timings=timings, **sizes)
                 
-                self.print_result(result)
-                self.results.append(result)
+                self.record(result)
                 
             except requests.exceptions.ConnectionError:
                 result = QAResult(route, 'GET', 'fail', 
                                 error='Frontend server not running')
-                self.print_result(result)
-                self.results.append(result)
+                self.record(result)
             except Exception as e:
                 result = QAResult(route, 'GET', 'fail', error=str(e))
-                self.print_result(result)
-                self.results.append(result)
+                self.record(result)
+        
+        if waterfall.pages:
+            self.print_header("FRONTEND ASSETS")
+            waterfall.run()
+            if self.verbose:
+                print()
+                waterfall.print_report()
+            self.waterfall = waterfall
+    
+    def test_http_caching(self):
+        """Fetch every frontend asset and GET endpoint twice to audit their HTTP caching"""
+        self.print_header("HTTP CACHING AUDIT")
+        audit = CacheAudit(self, self.waterfall)
+        audit.run()
+        if self.verbose:
+            audit.print_report()
+        self.cache_audit = audit
     
     def diagnose_error(self, result: QAResult) -> str:
         """Diagnose probable source of error"""
@@ -536,13 +2879,19 @@ class SGMSQASystem:
         else:
             return "Unknown error → Check server logs"
     
-    def generate_html_report(self):
-        """Generate HTML report"""
-        passed = sum(1 for r in self.results if r.status == 'pass')
-        failed = sum(1 for r in self.results if r.status == 'fail')
-        warnings = sum(1 for r in self.results if r.status == 'warning')
-        total = len(self.results)
+    def generate_html_report(self, include_rows: bool = True):
+        """Generate HTML report by streaming over the results file
         
+        Soak runs pass include_rows=False and get the time-series chart instead
+        of one table row per request.
+        """
+        counts = self.sink.aggregate.status_counts
+        passed = counts.get('pass', 0)
+        failed = counts.get('fail', 0)
+        warnings = counts.get('warning', 0)
+        total = self.sink.aggregate.total
+        
+        out = open('qa_report.html', 'w', encoding='utf-8')
         html = f"""
 <!DOCTYPE html>
 <html lang="en">
@@ -685,6 +3034,11 @@ class SGMSQASystem:
         .response-time.fast {{ color: #4CAF50; }}
         .response-time.medium {{ color: #ff9800; }}
         .response-time.slow {{ color: #f44336; }}
+        h2 {{
+            color: #00C9FF;
+            font-size: 1.4em;
+            margin: 40px 0 10px;
+        }}
     </style>
 </head>
 <body>
@@ -723,21 +3077,26 @@ class SGMSQASystem:
             </thead>
             <tbody>
 """
+        out.write(html)
         
-        for result in self.results:
+        rows = 0
+        for record in (self.sink.iter_results() if include_rows else ()):
+            rows += 1
+            result = QAResult.from_dict(record)
             status_class = f"status-{result.status}"
             
             # Response time color
             rt_class = 'fast'
             if result.response_time:
-                if result.response_time > 5000:
+                budget = self.budgets.for_key(result.key)
+                if result.response_time > budget['p99_ms']:
                     rt_class = 'slow'
-                elif result.response_time > 2000:
+                elif result.response_time > budget['p95_ms']:
                     rt_class = 'medium'
             
             rt_display = f'{result.response_time:.0f}ms' if result.response_time else 'N/A'
             
-            html += f"""
+            out.write(f"""
                 <tr>
                     <td><code>{result.endpoint}</code></td>
                     <td><span class="method">{result.method}</span></td>
@@ -749,45 +3108,1781 @@ class SGMSQASystem:
                         {f'<div class="diagnosis">💡 {self.diagnose_error(result)}</div>' if result.status == 'fail' else ''}
                     </td>
                 </tr>
+""")
+        
+        if not rows and total and include_rows:
+            out.write("""
+                <tr><td colspan="5">Per-request rows are only available when results are streamed to a file (--results-file)</td></tr>
+""")
+        
+        out.write("""
+            </tbody>
+        </table>
+""")
+        out.write(self.latency_table_html())
+        out.write(self.phase_table_html())
+        out.write(self.payload_table_html())
+        out.write(self.asset_waterfall_html())
+        out.write(self.cache_audit_html())
+        out.write(self.timeseries_html())
+        out.write("""
+    </div>
+</body>
+</html>
+""")
+        out.close()
+        
+        print(f"\n{Colors.GREEN}✓ Report saved to qa_report.html{Colors.RESET}")
+    
+    def latency_table_html(self) -> str:
+        """Per-endpoint latency distribution table for the HTML report"""
+        if not self.histograms:
+            return ''
+        
+        columns = latency_columns()
+        header = ''.join(f'<th>{col}</th>' for col in columns)
+        html = f"""
+        <h2>Latency Distribution</h2>
+        <table>
+            <thead>
+                <tr><th>Endpoint</th><th>Samples</th>{header}</tr>
+            </thead>
+            <tbody>
+"""
+        for key in sorted(self.histograms):
+            summary = self.histograms[key].summary_ms()
+            cells = ''.join(
+                f'<td>{summary[col]:.1f}ms</td>' if summary[col] is not None else '<td>N/A</td>'
+                for col in columns
+            )
+            html += f"""
+                <tr><td><code>{key}</code></td><td>{summary['count']}</td>{cells}</tr>
+"""
+        html += """
+            </tbody>
+        </table>
+"""
+        return html
+    
+    def phase_table_html(self) -> str:
+        """Per-endpoint request phase breakdown for the HTML report"""
+        summary = self.sink.aggregate.phases.summary()
+        if not summary:
+            return ''
+        
+        header = ''.join(f'<th>{phase} p50 / p99</th>' for phase in REQUEST_PHASES)
+        html = f"""
+        <h2>Request Phases</h2>
+        <p>DNS, connect and TLS are only paid when a request opens a new connection.</p>
+        <table>
+            <thead>
+                <tr><th>Endpoint</th><th>Requests</th><th>Reused</th>{header}</tr>
+            </thead>
+            <tbody>
+"""
+        for key, entry in summary.items():
+            cells = ''.join(
+                f"<td>{entry[phase]['p50']:.1f} / {entry[phase]['p99']:.1f}ms</td>" if phase in entry else '<td>-</td>'
+                for phase in REQUEST_PHASES
+            )
+            reuse = entry['reused'] / (entry['requests'] or 1) * 100
+            html += f"""
+                <tr><td><code>{key}</code></td><td>{entry['requests']}</td><td>{reuse:.0f}%</td>{cells}</tr>
+"""
+        html += """
+            </tbody>
+        </table>
+"""
+        return html
+    
+    def payload_table_html(self) -> str:
+        """Endpoints ranked by bytes per request for the HTML report"""
+        summary = self.sink.aggregate.payload.summary()
+        if not summary:
+            return ''
+        
+        html = """
+        <h2>Payload Size</h2>
+        <table>
+            <thead>
+                <tr><th>Endpoint</th><th>Bytes/request</th><th>Max</th><th>Wire/request</th><th>Encoding</th>
+                    <th>Items</th><th>Bytes/item</th><th>JSON decode</th></tr>
+            </thead>
+            <tbody>
+"""
+        for key, entry in summary.items():
+            items = f"{entry['items_per_response']:.0f}" if entry['items_per_response'] is not None else '-'
+            encodings = ', '.join(sorted(entry['encodings']))
+            html += f"""
+                <tr><td><code>{key}</code></td><td>{format_bytes(entry['bytes_per_request'])}</td>
+                    <td>{format_bytes(entry['max_bytes'])}</td><td>{format_bytes(entry['transferred_per_request'])}</td>
+                    <td>{encodings}</td><td>{items}</td><td>{format_bytes(entry['bytes_per_item'])}</td>
+                    <td>{entry['json_decode_ms']:.2f}ms</td></tr>
+"""
+        html += """
+            </tbody>
+        </table>
+"""
+        return html
+    
+    def asset_waterfall_html(self) -> str:
+        """Frontend page weight and simulated load times for the HTML report"""
+        if self.waterfall is None:
+            return ''
+        summary = self.waterfall.summary()
+        profiles = summary['profiles']
+        
+        html = """
+        <h2>Frontend Assets</h2>
+        <table>
+            <thead>
+                <tr><th>Asset</th><th>Type</th><th>Size</th><th>Wire</th><th>Encoding</th><th>Time</th></tr>
+            </thead>
+            <tbody>
+"""
+        for url, entry in summary['assets'].items():
+            time_ms = f"{entry['time']:.0f}ms" if entry.get('time') is not None else 'failed'
+            html += f"""
+                <tr><td><code>{self.waterfall.label(url)}</code></td><td>{entry['kind']}{' *' if entry['critical'] else ''}</td>
+                    <td>{format_bytes(entry.get('size'))}</td><td>{format_bytes(entry.get('transferred'))}</td>
+                    <td>{entry.get('encoding') or '-'}</td><td>{time_ms}</td></tr>
+"""
+        header = ''.join(f"<th>{name} ({values['kbps']:g}kbit/s, {values['rtt_ms']:g}ms)</th>"
+                         for name, values in profiles.items())
+        html += f"""
+            </tbody>
+        </table>
+        <table>
+            <thead>
+                <tr><th>Route</th><th>Assets</th><th>Weight</th><th>Wire</th>{header}</tr>
+            </thead>
+            <tbody>
+"""
+        for route, page in summary['pages'].items():
+            cells = ''.join(f"<td>{page['critical_path_ms'][name] / 1000:.2f}s</td>" for name in profiles)
+            html += f"""
+                <tr><td><code>{route}</code></td><td>{page['assets']}</td><td>{format_bytes(page['bytes'])}</td>
+                    <td>{format_bytes(page['transferred'])}</td>{cells}</tr>
+"""
+        html += """
+            </tbody>
+        </table>
+"""
+        return html
+    
+    def cache_audit_html(self) -> str:
+        """HTTP caching policy, repeat-visit savings and findings for the HTML report"""
+        if self.cache_audit is None or not self.cache_audit.entries:
+            return ''
+        audit = self.cache_audit
+        sent, not_modified = audit.revalidation_counts()
+        
+        html = f"""
+        <h2>HTTP Caching</h2>
+        <p>Conditional requests: {sent} sent, {not_modified} answered 304</p>
+        <table>
+            <thead>
+                <tr><th>Resource</th><th>Kind</th><th>Cache-Control</th><th>ETag</th><th>Last-Modified</th>
+                    <th>Revisit</th><th>Saved</th><th>Time Saved</th></tr>
+            </thead>
+            <tbody>
+"""
+        for entry in sorted(audit.entries.values(), key=lambda entry: (entry['kind'] == 'api', entry['label'])):
+            if 'policy' not in entry:
+                problem = entry['first'].get('error') or f"HTTP {entry['first']['status_code']}"
+                html += f"""
+                <tr><td><code>{entry['label']}</code></td><td>{entry['kind']}</td><td colspan="6">{problem}</td></tr>
+"""
+                continue
+            html += f"""
+                <tr><td><code>{entry['label']}</code></td><td>{entry['kind']}</td>
+                    <td><code>{entry['cache_control'] or '-'}</code></td><td>{'yes' if entry['etag'] else 'no'}</td>
+                    <td>{'yes' if entry['last_modified'] else 'no'}</td><td>{audit.revisit(entry)}</td>
+                    <td>{format_bytes(entry['saved_bytes'])}</td><td>{entry['saved_ms']:.0f}ms</td></tr>
+"""
+        html += """
+            </tbody>
+        </table>
+        <table>
+            <thead>
+                <tr><th>Route</th><th>Resources</th><th>First Visit</th><th>Repeat Visit</th><th>Saved</th><th>Time Saved</th></tr>
+            </thead>
+            <tbody>
+"""
+        for route, cost in audit.route_costs().items():
+            html += f"""
+                <tr><td><code>{route}</code></td><td>{cost['resources']}</td><td>{format_bytes(cost['first_bytes'])}</td>
+                    <td>{format_bytes(cost['repeat_bytes'])}</td>
+                    <td>{format_bytes(cost['first_bytes'] - cost['repeat_bytes'])}</td>
+                    <td>{max(0.0, cost['first_ms'] - cost['repeat_ms']):.0f}ms</td></tr>
+"""
+        html += """
+            </tbody>
+        </table>
+"""
+        for finding in audit.findings:
+            css = 'error-msg' if finding['severity'] == 'error' else 'warning-msg'
+            html += f"""
+        <div class="{css}">{'❌' if finding['severity'] == 'error' else '⚠'} <code>{finding['resource']}</code>: {finding['message']}</div>
+"""
+        return html
+    
+    def timeseries_html(self) -> str:
+        """Soak-test time series (closed windows recorded in the results file)"""
+        windows = list(self.sink.iter_results('window'))
+        if not windows:
+            return ''
+        
+        html = f"""
+        <h2>Soak Time Series</h2>
+        {timeseries_svg(windows)}
+        <table>
+            <thead>
+                <tr><th>Offset</th><th>Requests</th><th>Req/s</th><th>p50</th><th>p95</th><th>p99</th><th>Error Rate</th></tr>
+            </thead>
+            <tbody>
+"""
+        for w in windows:
+            html += f"""
+                <tr><td>{w['offset'] / 60:.1f}m</td><td>{w['requests']}</td><td>{w['throughput']:.1f}</td>
+                    <td>{w['p50'] or 0:.0f}ms</td><td>{w['p95'] or 0:.0f}ms</td><td>{w['p99'] or 0:.0f}ms</td>
+                    <td>{w['error_rate'] * 100:.2f}%</td></tr>
 """
-        
         html += """
             </tbody>
         </table>
-    </div>
-</body>
-</html>
 """
+        return html
+    
+    def generate_json_report(self, path: str):
+        """Write results and per-endpoint latency distributions as JSON (streamed)"""
+        aggregate = self.sink.aggregate
+        header = {
+            'timestamp': datetime.now().isoformat(),
+            'api_base_url': self.api_base_url,
+            'summary': {
+                'total': aggregate.total,
+                'passed': aggregate.status_counts.get('pass', 0),
+                'failed': aggregate.status_counts.get('fail', 0),
+                'warnings': aggregate.status_counts.get('warning', 0),
+            },
+            'latency': {
+                key: {'summary_ms': histogram.summary_ms(), 'histogram': histogram.to_dict()}
+                for key, histogram in sorted(self.histograms.items())
+            },
+            'phases': aggregate.phases.summary(),
+            'payload': aggregate.payload.summary(),
+            'validation': aggregate.validation.summary(),
+            'roles': aggregate.roles.summary(),
+            'frontend_assets': self.waterfall.summary() if self.waterfall is not None else None,
+            'http_caching': self.cache_audit.summary() if self.cache_audit is not None else None,
+            'budget_violations': self.budgets.check(aggregate),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            # Emit the header object, then stream results into its 'results' array
+            f.write(json.dumps(header, indent=2)[:-2] + ',\n  "results": [')
+            for index, record in enumerate(self.sink.iter_results()):
+                record.pop('type', None)
+                f.write((',' if index else '') + '\n    ' + json.dumps(record))
+            f.write('\n  ]\n}\n')
         
-        with open('qa_report.html', 'w', encoding='utf-8') as f:
-            f.write(html)
-        
-        print(f"\n{Colors.GREEN}✓ Report saved to qa_report.html{Colors.RESET}")
+        print(f"{Colors.GREEN}✓ JSON report saved to {path}{Colors.RESET}")
     
     def print_summary(self):
         """Print test summary"""
         self.print_header("TEST SUMMARY")
         
-        passed = sum(1 for r in self.results if r.status == 'pass')
-        failed = sum(1 for r in self.results if r.status == 'fail')
-        warnings = sum(1 for r in self.results if r.status == 'warning')
-        total = len(self.results)
+        counts = self.sink.aggregate.status_counts
+        passed = counts.get('pass', 0)
+        failed = counts.get('fail', 0)
+        warnings = counts.get('warning', 0)
+        total = self.sink.aggregate.total
         
         print(f"Total Tests:  {total}")
         print(f"{Colors.GREEN}✔ Passed:     {passed}{Colors.RESET}")
         print(f"{Colors.RED}❌ Failed:     {failed}{Colors.RESET}")
         print(f"{Colors.YELLOW}⚠ Warnings:   {warnings}{Colors.RESET}")
+        
+        if self.histograms:
+            print(f"\n{Colors.BOLD}Latency by endpoint:{Colors.RESET}")
+            print_latency_table(self.histograms)
+            print(f"\n{Colors.BOLD}Request phases by endpoint:{Colors.RESET}")
+            print_phase_table(self.sink.aggregate.phases)
+            print(f"\n{Colors.BOLD}Payload by endpoint (heaviest first):{Colors.RESET}")
+            print_payload_table(self.sink.aggregate.payload)
+            print(f"\n{Colors.BOLD}Schema validation:{Colors.RESET}")
+            print_validation_table(self.sink.aggregate.validation, self.sink.aggregate.total)
+            if len(self.sink.aggregate.roles.histograms) > 1:
+                print(f"\n{Colors.BOLD}Latency by role:{Colors.RESET}")
+                print_role_table(self.sink.aggregate.roles)
     
     def run(self):
         """Run all QA tests"""
         self.login_admin()
         self.test_backend_endpoints()
+        self.test_role_endpoints()
         self.test_crud_operations()
         self.test_frontend_routes()
+        if self.audit_caching:
+            self.test_http_caching()
         self.print_summary()
         self.generate_html_report()
 
 
+class ScenarioStep:
+    """One step of a scenario DAG
+    
+    `action(inputs)` receives the outputs of earlier steps named in `requires`
+    and returns (QAResult, outputs). A step fails if its request fails or it does
+    not produce everything listed in `provides`. `after` names steps that must
+    settle first (pass, fail or skip) without their outputs being needed.
+    """
+    
+    def __init__(self, name: str, action, requires: List[str] = (), provides: List[str] = (),
+                 after: List[str] = ()):
+        self.name = name
+        self.action = action
+        self.requires = list(requires)
+        self.provides = list(provides)
+        self.after = list(after)
+        self.status = 'pending'  # 'pending', 'pass', 'fail', 'skipped'
+        self.result: Optional[QAResult] = None
+        self.error: Optional[str] = None
+        self.start = 0.0
+        self.end = 0.0
+    
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end - self.start)
+
+
+class ScenarioScheduler:
+    """Run scenario steps concurrently as soon as their inputs are available
+    
+    Dependents of failed or skipped steps are skipped. After the run, the
+    critical path (longest chain of dependent step durations) is reported so
+    wall time can be compared with the theoretical minimum.
+    """
+    
+    def __init__(self, qa: SGMSQASystem, steps: List[ScenarioStep], max_workers: int = 4):
+        self.qa = qa
+        self.steps = {step.name: step for step in steps}
+        self.order = [step.name for step in steps]
+        self.max_workers = max(1, max_workers)
+        self.outputs: Dict[str, object] = {}
+        self.wall_time = 0.0
+        
+        self.producers: Dict[str, str] = {}
+        for step in steps:
+            for output in step.provides:
+                if output in self.producers:
+                    raise ValueError(f"Output '{output}' provided by both {self.producers[output]} and {step.name}")
+                self.producers[output] = step.name
+        for step in steps:
+            missing = [i for i in step.requires if i not in self.producers]
+            missing += [a for a in step.after if a not in self.steps]
+            if missing:
+                raise ValueError(f"Step '{step.name}' depends on unknown inputs/steps: {missing}")
+        self._check_acyclic()
+    
+    def dependencies(self, step: ScenarioStep) -> List[str]:
+        """Names of the steps this step waits for"""
+        deps = [self.producers[i] for i in step.requires] + step.after
+        return list(dict.fromkeys(deps))
+    
+    def _check_acyclic(self):
+        visiting, done = set(), set()
+        
+        def visit(name, path):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Scenario dependency cycle: {' → '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self.dependencies(self.steps[name]):
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+        
+        for name in self.order:
+            visit(name, [])
+    
+    def _run_step(self, step: ScenarioStep, run_start: float):
+        step.start = time.perf_counter() - run_start
+        try:
+            inputs = {name: self.outputs[name] for name in step.requires}
+            step.result, outputs = step.action(inputs)
+        except Exception as e:
+            step.result, outputs = None, {}
+            step.error = str(e)
+        step.end = time.perf_counter() - run_start
+        return outputs
+    
+    def _finish(self, step: ScenarioStep, outputs: dict):
+        missing = [name for name in step.provides if name not in outputs]
+        if step.result is not None:
+            self.qa.record(step.result)
+        
+        if step.error or (step.result is not None and step.result.status == 'fail'):
+            step.status = 'fail'
+            step.error = step.error or step.result.error
+        elif missing:
+            step.status = 'fail'
+            step.error = f"No {', '.join(missing)} in response"
+        else:
+            step.status = 'pass'
+            self.outputs.update(outputs)
+        
+        with self.qa.lock:
+            for name in step.provides:
+                if name in outputs and name in self.outputs:
+                    self.qa.log(f"  {Colors.GREEN}{step.name}: {name} = {outputs[name]}{Colors.RESET}")
+            if step.status == 'fail' and step.error and step.result is None:
+                self.qa.log(f"  {Colors.RED}{step.name} failed: {step.error}{Colors.RESET}")
+            elif step.status == 'fail' and missing and step.result is not None and step.result.status != 'fail':
+                self.qa.log(f"  {Colors.RED}{step.name}: {step.error}{Colors.RESET}")
+    
+    def run(self):
+        """Execute all steps, running every ready step concurrently"""
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        
+        run_start = time.perf_counter()
+        running = {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scenario') as pool:
+            while True:
+                for name in self.order:
+                    step = self.steps[name]
+                    if step.status != 'pending' or name in running.values():
+                        continue
+                    deps = [self.steps[d] for d in self.dependencies(step)]
+                    if any(d.status in ('pending',) for d in deps):
+                        continue
+                    blocked = [self.producers[i] for i in step.requires
+                               if self.steps[self.producers[i]].status != 'pass']
+                    if blocked:
+                        step.status = 'skipped'
+                        step.error = f"Skipped - depends on failed step: {', '.join(dict.fromkeys(blocked))}"
+                        self.qa.log(f"{Colors.YELLOW}⏭ {step.name}: {step.error}{Colors.RESET}")
+                        continue
+                    running[pool.submit(self._run_step, step, run_start)] = name
+                
+                if not running:
+                    if any(self.steps[n].status == 'pending' for n in self.order):
+                        continue  # Skips above may have unblocked further steps
+                    break
+                
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self._finish(self.steps[running.pop(future)], future.result())
+        
+        self.wall_time = time.perf_counter() - run_start
+    
+    def critical_path(self) -> Tuple[List[str], float]:
+        """Longest chain of dependent step durations"""
+        memo: Dict[str, Tuple[float, List[str]]] = {}
+        
+        def longest(name):
+            if name not in memo:
+                step = self.steps[name]
+                best = (0.0, [])
+                for dep in self.dependencies(step):
+                    candidate = longest(dep)
+                    if candidate[0] > best[0]:
+                        best = candidate
+                memo[name] = (best[0] + step.duration, best[1] + [name])
+            return memo[name]
+        
+        duration, path = max((longest(name) for name in self.order), key=lambda item: item[0],
+                             default=(0.0, []))
+        return [name for name in path if self.steps[name].status != 'skipped'], duration
+    
+    def print_report(self):
+        """Print per-step timeline, critical path and wall time"""
+        if not self.qa.verbose:
+            return
+        status_color = {'pass': Colors.GREEN, 'fail': Colors.RED, 'skipped': Colors.YELLOW}
+        
+        print(f"\n{Colors.BOLD}Scenario timeline:{Colors.RESET}")
+        print(f"  {'Step':<22} {'Status':<8} {'Start':>9} {'Duration':>9}")
+        for name in sorted(self.order, key=lambda n: (self.steps[n].status == 'skipped', self.steps[n].start)):
+            step = self.steps[name]
+            color = status_color.get(step.status, '')
+            timing = f"{step.start * 1000:>7.0f}ms {step.duration * 1000:>7.0f}ms" if step.status != 'skipped' else ''
+            print(f"  {name:<22} {color}{step.status:<8}{Colors.RESET} {timing}")
+        
+        path, duration = self.critical_path()
+        serial = sum(step.duration for step in self.steps.values())
+        print(f"\n  Critical path: {' → '.join(path)}")
+        print(f"  Critical path duration: {duration * 1000:.0f}ms")
+        print(f"  Wall time:              {self.wall_time * 1000:.0f}ms "
+              f"(serial sum {serial * 1000:.0f}ms, {self.max_workers} workers)")
+
+
+def parse_duration(text: str) -> float:
+    """Seconds from '90', '90s', '30m', '8h' or '1d'"""
+    text = str(text).strip().lower()
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+    try:
+        if text and text[-1] in units:
+            return float(text[:-1]) * units[text[-1]]
+        return float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid duration: {text!r} (use e.g. 90s, 30m, 8h)")
+
+
+def mann_whitney_counts(tied_groups, n1: int, n2: int) -> float:
+    """One-sided Mann-Whitney U p-value from (early count, late count) per distinct value
+    
+    `tied_groups` must be in ascending value order. Uses the normal
+    approximation with tie correction.
+    """
+    if not n1 or not n2:
+        return 1.0
+    rank_sum_late = 0.0
+    tie_term = 0.0
+    position = 0
+    for early_count, late_count in tied_groups:
+        ties = early_count + late_count
+        rank_sum_late += late_count * (position + (ties + 1) / 2)
+        tie_term += ties ** 3 - ties
+        position += ties
+    u_late = rank_sum_late - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u_late - n1 * n2 / 2 - 0.5) / variance ** 0.5  # continuity correction
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def mann_whitney_greater(early: List[float], late: List[float]) -> float:
+    """One-sided Mann-Whitney U p-value that `late` is stochastically greater than `early`"""
+    groups: Dict[float, List[int]] = {}
+    for group, values in ((0, early), (1, late)):
+        for value in values:
+            groups.setdefault(value, [0, 0])[group] += 1
+    return mann_whitney_counts((groups[v] for v in sorted(groups)), len(early), len(late))
+
+
+def mann_whitney_histograms(early: LatencyHistogram, late: LatencyHistogram) -> float:
+    """Mann-Whitney p-value that `late` is slower, treating each histogram bucket as one tied value"""
+    groups: Dict[int, List[int]] = {}
+    for group, histogram in ((0, early), (1, late)):
+        for index, _, count in histogram.buckets():
+            groups.setdefault(index, [0, 0])[group] += count
+    return mann_whitney_counts((groups[i] for i in sorted(groups)), early.total_count, late.total_count)
+
+
+def proportion_increase_p(errors_early: int, total_early: int, errors_late: int, total_late: int) -> float:
+    """One-sided two-proportion z-test p-value that the late error rate is higher"""
+    if not total_early or not total_late:
+        return 1.0
+    pooled = (errors_early + errors_late) / (total_early + total_late)
+    se = (pooled * (1 - pooled) * (1 / total_early + 1 / total_late)) ** 0.5
+    if se == 0:
+        return 1.0
+    z = (errors_late / total_late - errors_early / total_early) / se
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def aggregate_report(stats: ResultAggregate, budgets: PerformanceBudgets) -> dict:
+    """JSON report sections of one run's aggregate: totals, per-endpoint latency and budget violations"""
+    return {
+        'requests': stats.total,
+        'errors': stats.errors,
+        'error_messages': stats.error_messages,
+        'endpoints': {
+            key: {
+                'requests': stats.endpoint_requests.get(key, 0),
+                'errors': stats.endpoint_errors.get(key, 0),
+                'summary_ms': histogram.summary_ms(),
+                'histogram': histogram.to_dict(),
+            }
+            for key, histogram in sorted(stats.histograms.items())
+        },
+        'phases': stats.phases.summary(),
+        'payload': stats.payload.summary(),
+        'validation': stats.validation.summary(),
+        'roles': stats.roles.summary(),
+        'budget_violations': budgets.check(stats),
+    }
+
+
+class LoadTester:
+    """Concurrent virtual-user load generator built on SGMSQASystem.test_endpoint
+    
+    Each virtual user gets its own requests.Session and JWT token and loops over
+    the request catalog - the discovered GET routes, or READ_ENDPOINTS - until
+    the test duration has elapsed. Users are started evenly across the ramp-up
+    period. Each endpoint is sent with a session of its role from the pool.
+    
+    Results go to the sink and to `stats`, an aggregate of this run only:
+    with --resume the sink's aggregate also holds the earlier run's results.
+    """
+    
+    title = "LOAD TEST"
+    
+    def __init__(self, qa: SGMSQASystem, users: int = 10, ramp_up: float = 10.0,
+                 duration: float = 60.0):
+        self.qa = qa
+        self.users = max(1, users)
+        self.ramp_up = max(0.0, ramp_up)
+        self.duration = duration
+        self.sink = qa.sink
+        self.stats = ResultAggregate()  # This run only, for reports, budgets and the exit status
+        self.lock = threading.Lock()
+        self.active_users = 0
+        self.elapsed = 0.0
+        self.catalog = qa.request_catalog()  # (endpoint, method, role)
+    
+    def create_virtual_user(self) -> SGMSQASystem:
+        """Create an independent, authenticated admin client for one virtual user"""
+        vu = self.qa.spawn()
+        vu.login_admin()
+        return vu
+    
+    def virtual_user(self, index: int, deadline: float, stop: threading.Event):
+        """Loop over the endpoint catalog until the deadline"""
+        pool = self.qa.pool
+        sessions = {role: pool.client(role, index) for role in pool.roles()} if pool is not None else {}
+        if 'ADMIN' not in sessions:
+            sessions['ADMIN'] = self.create_virtual_user()
+        with self.lock:
+            self.active_users += 1
+        
+        try:
+            while not stop.is_set() and time.time() < deadline:
+                for endpoint, method, role in self.catalog:
+                    if stop.is_set() or time.time() >= deadline:
+                        break
+                    client = sessions[role]
+                    self.record(client.test_route(endpoint, method))
+        finally:
+            for client in sessions.values():
+                client.session.close()
+    
+    def record(self, result: QAResult):
+        """Collect one virtual-user result"""
+        self.stats.add(self.sink.write(result))
+    
+    def run(self) -> ResultAggregate:
+        """Start virtual users across the ramp-up period and wait for them to finish"""
+        self.qa.print_header(f"{self.title} - {self.users} VIRTUAL USERS")
+        roles = sorted({role for _, _, role in self.catalog})
+        print(f"Ramp-up: {self.ramp_up:.0f}s, Duration: {self.duration:.0f}s, "
+              f"Endpoints: {len(self.catalog)}, Roles: {', '.join(roles)}")
+        
+        stop = threading.Event()
+        start_time = time.time()
+        deadline = start_time + self.ramp_up + self.duration
+        interval = self.ramp_up / self.users
+        threads = []
+        
+        try:
+            for index in range(self.users):
+                thread = threading.Thread(target=self.virtual_user, args=(index, deadline, stop),
+                                          name=f"vu-{index}", daemon=True)
+                thread.start()
+                threads.append(thread)
+                if interval and index < self.users - 1:
+                    stop.wait(interval)
+            
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1.0)
+        except KeyboardInterrupt:
+            print(f"\n{Colors.YELLOW}⚠ Interrupted - stopping virtual users{Colors.RESET}")
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=15)
+        
+        self.elapsed = time.time() - start_time
+        self.finish()
+        self.sink.flush()
+        return self.stats
+    
+    def finish(self):
+        """Hook for subclasses once all virtual users have stopped"""
+    
+    def print_report(self):
+        """Print throughput, error rate and per-endpoint latency percentiles"""
+        self.qa.print_header("LOAD TEST SUMMARY")
+        stats = self.stats
+        throughput = stats.total / self.elapsed if self.elapsed else 0.0
+        error_rate = (stats.errors / stats.total * 100) if stats.total else 0.0
+        error_color = Colors.GREEN if stats.errors == 0 else Colors.RED
+        
+        print(f"Virtual Users:  {self.active_users}/{self.users}")
+        print(f"Elapsed:        {self.elapsed:.1f}s")
+        print(f"Requests:       {stats.total}")
+        print(f"Throughput:     {throughput:.1f} req/s")
+        print(f"{error_color}Error Rate:     {error_rate:.2f}% ({stats.errors}){Colors.RESET}")
+        
+        print()
+        print_latency_table(stats.histograms, stats.endpoint_errors, stats.endpoint_requests)
+        print()
+        print_phase_table(stats.phases)
+        print()
+        print_payload_table(stats.payload)
+        print()
+        print_validation_table(stats.validation, stats.total)
+        if len(stats.roles.histograms) > 1:
+            print()
+            print_role_table(stats.roles)
+        
+        if stats.error_messages:
+            print(f"\n{Colors.RED}Errors:{Colors.RESET}")
+            for message, count in sorted(stats.error_messages.items(), key=lambda item: -item[1]):
+                print(f"  {count:>6} × {message}")
+    
+    def generate_json_report(self, path: str):
+        """Write load-test aggregates and latency distributions as JSON"""
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'api_base_url': self.qa.api_base_url,
+            'users': self.users,
+            'ramp_up': self.ramp_up,
+            'duration': self.duration,
+            'elapsed': self.elapsed,
+            'throughput': self.stats.total / self.elapsed if self.elapsed else 0.0,
+            **aggregate_report(self.stats, self.qa.budgets),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        
+        print(f"{Colors.GREEN}✓ JSON report saved to {path}{Colors.RESET}")
+
+
+class SoakTester(LoadTester):
+    """Long-running steady load with fixed time-window aggregation
+    
+    Each window keeps its own latency histogram while open; once closed it is
+    reduced to a compact summary row (and appended to the results file), so
+    memory stays flat for multi-hour runs. Early and late windows are compared
+    to flag statistically significant upward drift in p95 latency or error rate.
+    """
+    
+    title = "SOAK TEST"
+    # Window p95s compared per third: with 3 against 3 even a 100x slowdown gives
+    # only p = 0.040 (2 against 2: 0.123); 4 against 4 reaches 0.015
+    MIN_WINDOWS_PER_THIRD = 4
+    
+    def __init__(self, qa: SGMSQASystem, users: int = 10, ramp_up: float = 10.0,
+                 duration: float = 3600.0, window: float = 60.0, alpha: float = 0.05,
+                 min_drift: float = 0.10):
+        super().__init__(qa, users, ramp_up, duration)
+        self.window = max(1.0, window)
+        self.alpha = alpha
+        self.min_drift = min_drift
+        self.start_time = time.time()
+        self.open_windows: Dict[int, dict] = {}
+        self.windows: List[dict] = []
+        self.window_lock = threading.Lock()
+        self.drift: Dict[str, dict] = {}
+    
+    def run(self) -> ResultAggregate:
+        self.start_time = time.time()
+        return super().run()
+    
+    def record(self, result: QAResult):
+        super().record(result)
+        index = int((time.time() - self.start_time) // self.window)
+        with self.window_lock:
+            window = self.open_windows.get(index)
+            if window is None:
+                window = {'histogram': LatencyHistogram(significant_digits=2), 'requests': 0, 'errors': 0}
+                self.open_windows[index] = window
+                # Results can straddle a boundary; keep the previous window open one more period
+                for stale in [i for i in self.open_windows if i < index - 1]:
+                    self._close_window(stale)
+            window['requests'] += 1
+            if result.status == 'fail':
+                window['errors'] += 1
+            if result.response_time is not None:
+                window['histogram'].record_ms(result.response_time)
+    
+    def _close_window(self, index: int):
+        window = self.open_windows.pop(index)
+        summary = window['histogram'].summary_ms()
+        row = {
+            'type': 'window',
+            'index': index,
+            'start': datetime.fromtimestamp(self.start_time + index * self.window).isoformat(),
+            'offset': index * self.window,
+            'requests': window['requests'],
+            'errors': window['errors'],
+            'error_rate': window['errors'] / window['requests'] if window['requests'] else 0.0,
+            'throughput': window['requests'] / self.window,
+            'p50': summary['p50'],
+            'p95': summary['p95'],
+            'p99': summary['p99'],
+            'max': summary['max'],
+        }
+        self.windows.append(row)
+        self.sink.write_event(row)
+        print(f"  [{row['offset'] / 60:>6.1f}m] {row['requests']:>7} req "
+              f"{row['throughput']:>7.1f} req/s  p95 {row['p95'] or 0:>7.0f}ms  "
+              f"err {row['error_rate'] * 100:>5.2f}%")
+    
+    def finish(self):
+        with self.window_lock:
+            for index in sorted(self.open_windows):
+                self._close_window(index)
+        self.windows.sort(key=lambda row: row['index'])
+        self.drift = self.detect_drift(self.windows)
+    
+    def detect_drift(self, windows: List[dict]) -> Dict[str, dict]:
+        """Compare the first and last third of windows for upward p95 / error-rate drift"""
+        # The first window includes ramp-up; the last may be partial
+        usable = [w for w in windows if w['requests']]
+        if len(usable) > 4:
+            usable = usable[1:-1]
+        third = len(usable) // 3
+        if third < self.MIN_WINDOWS_PER_THIRD:
+            return {'insufficient': {'windows': len(usable), 'needed': 3 * self.MIN_WINDOWS_PER_THIRD}}
+        early, late = usable[:third], usable[-third:]
+        
+        early_p95 = [w['p95'] for w in early if w['p95'] is not None]
+        late_p95 = [w['p95'] for w in late if w['p95'] is not None]
+        p95_before = statistics.median(early_p95) if early_p95 else None
+        p95_after = statistics.median(late_p95) if late_p95 else None
+        p95_change = (p95_after / p95_before - 1) if p95_before else 0.0
+        p95_p = mann_whitney_greater(early_p95, late_p95)
+        
+        early_errors, early_total = sum(w['errors'] for w in early), sum(w['requests'] for w in early)
+        late_errors, late_total = sum(w['errors'] for w in late), sum(w['requests'] for w in late)
+        err_before = early_errors / early_total if early_total else 0.0
+        err_after = late_errors / late_total if late_total else 0.0
+        err_p = proportion_increase_p(early_errors, early_total, late_errors, late_total)
+        
+        return {
+            'p95': {
+                'early': p95_before, 'late': p95_after, 'change': p95_change, 'p_value': p95_p,
+                'drift': p95_p < self.alpha and p95_change >= self.min_drift,
+            },
+            'error_rate': {
+                'early': err_before, 'late': err_after, 'change': err_after - err_before, 'p_value': err_p,
+                'drift': err_p < self.alpha and err_after > err_before,
+            },
+            'windows_compared': third,
+        }
+    
+    def print_report(self):
+        super().print_report()
+        print(f"\n{Colors.BOLD}Drift ({self.window:.0f}s windows):{Colors.RESET}")
+        if 'insufficient' in self.drift:
+            insufficient = self.drift['insufficient']
+            print(f"{Colors.YELLOW}⚠ Not enough windows for drift detection "
+                  f"({insufficient['windows']}, need {insufficient['needed']}) - "
+                  f"run longer or use a smaller --window{Colors.RESET}")
+            return
+        
+        p95, err = self.drift['p95'], self.drift['error_rate']
+        color = Colors.RED if p95['drift'] else Colors.GREEN
+        print(f"{color}  p95:        {p95['early'] or 0:.0f}ms → {p95['late'] or 0:.0f}ms "
+              f"({p95['change'] * 100:+.1f}%, p={p95['p_value']:.4f})"
+              f"{'  DRIFT' if p95['drift'] else ''}{Colors.RESET}")
+        color = Colors.RED if err['drift'] else Colors.GREEN
+        print(f"{color}  Error rate: {err['early'] * 100:.2f}% → {err['late'] * 100:.2f}% "
+              f"(p={err['p_value']:.4f}){'  DRIFT' if err['drift'] else ''}{Colors.RESET}")
+    
+    @property
+    def drift_detected(self) -> bool:
+        return any(isinstance(d, dict) and d.get('drift') for d in self.drift.values())
+    
+    def generate_json_report(self, path: str):
+        super().generate_json_report(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        report['window_seconds'] = self.window
+        report['windows'] = [{k: v for k, v in w.items() if k != 'type'} for w in self.windows]
+        report['drift'] = self.drift
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+class OpenLoopTester:
+    """Open-loop, constant-arrival-rate load generator
+    
+    Requests are scheduled at fixed intended send times (start + i / rate)
+    whatever the server does, and latency is measured from the intended send
+    time. When the server stalls, queued requests keep accruing latency
+    instead of silently not being sent (coordinated omission). Schedule lag -
+    how late each request actually left the generator - is reported separately
+    so a saturated generator cannot pass for a fast server.
+    
+    `request_fn(i)` returns (endpoint, method, payload) for the i-th request,
+    optionally followed by the role whose pooled session should send it.
+    As in LoadTester, `stats` aggregates this run's results only.
+    """
+    
+    title = "OPEN-LOOP TEST"
+    
+    def __init__(self, qa: SGMSQASystem, rate: float, duration: float, request_fn=None,
+                 max_inflight: int = 256):
+        self.qa = qa
+        self.rate = max(0.001, rate)
+        self.duration = max(0.0, duration)
+        self.max_inflight = max(1, max_inflight)
+        self.request_fn = request_fn or self.catalog_requests(qa.request_catalog())
+        self.sink = qa.sink
+        self.stats = ResultAggregate()  # This run only, for reports, budgets and the exit status
+        self.lag = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.workers = 0
+        self.scheduled = 0
+        self.completed = 0
+        self.late = 0
+        self.elapsed = 0.0
+        self.dispatch_elapsed = 0.0
+    
+    @staticmethod
+    def catalog_requests(endpoints):
+        """Round-robin over (endpoint, method, requires_auth or role) tuples"""
+        def request_fn(index):
+            endpoint, method, role = endpoints[index % len(endpoints)]
+            return endpoint, method, None, role if isinstance(role, str) else None
+        return request_fn
+    
+    def client(self, role: str = None) -> SGMSQASystem:
+        """Per-worker client for `role` with its own connection pool
+        
+        Roles served by the session pool get one of the role's pooled tokens;
+        anything else shares the main (admin) token.
+        """
+        clients = getattr(self.local, 'clients', None)
+        if clients is None:
+            clients = self.local.clients = {}
+            with self.lock:
+                self.local.slot = self.workers
+                self.workers += 1
+        if role not in clients:
+            pool = self.qa.pool
+            if role is not None and pool is not None and role in pool.roles():
+                client = pool.client(role, self.local.slot)
+            else:
+                client = self.qa.spawn(self.qa.role)
+                client.token = self.qa.token
+                client.user_id = self.qa.user_id
+            clients[role] = client
+        return clients[role]
+    
+    def send(self, index: int, intended: float):
+        """Send one request and record latency measured from its intended send time
+        
+        Runs on the executor, whose futures are never inspected: anything that
+        raises is recorded as a failed request instead of vanishing.
+        """
+        started = time.perf_counter()
+        endpoint, method = f"#{index}", 'GET'
+        try:
+            endpoint, method, payload, *role = self.request_fn(index)
+            client = self.client(role[0] if role else None)
+            result = client.test_route(endpoint, method, payload)
+        except Exception as e:
+            result = QAResult(endpoint, method, 'fail', error=f"Request generator error: {e}")
+        finished = time.perf_counter()
+        
+        lag_ms = (started - intended) * 1000
+        service_ms = result.response_time
+        result.timings['schedule_lag'] = lag_ms
+        result.timings['service_time'] = service_ms
+        if service_ms is not None:
+            result.response_time = (finished - intended) * 1000
+        
+        with self.lock:
+            self.completed += 1
+            self.lag.record_ms(max(0.0, lag_ms))
+            if service_ms is not None:
+                self.service.record_ms(service_ms)
+            if lag_ms > 10:
+                self.late += 1
+        self.record(result)
+    
+    def record(self, result: QAResult):
+        self.stats.add(self.sink.write(result))
+    
+    def run(self) -> ResultAggregate:
+        """Dispatch requests on schedule until the duration has elapsed"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if not self.qa.token:
+            with self.qa.unrecorded():
+                self.qa.login_admin()
+        
+        total = int(round(self.rate * self.duration))
+        self.qa.print_header(f"{self.title} - {self.rate:g} REQ/S")
+        print(f"Duration: {self.duration:.0f}s, Scheduled requests: {total}, Max in-flight: {self.max_inflight}")
+        
+        start = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=self.max_inflight, thread_name_prefix='open-loop')
+        try:
+            for index in range(total):
+                intended = start + index / self.rate
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self.send, index, intended)
+                self.scheduled += 1
+            self.dispatch_elapsed = time.perf_counter() - start
+            pool.shutdown(wait=True)
+        except KeyboardInterrupt:
+            print(f"\n{Colors.YELLOW}⚠ Interrupted - cancelling queued requests{Colors.RESET}")
+            self.dispatch_elapsed = time.perf_counter() - start
+            pool.shutdown(wait=True, cancel_futures=True)
+        
+        self.elapsed = time.perf_counter() - start
+        self.finish()
+        self.sink.flush()
+        return self.stats
+    
+    def finish(self):
+        """Hook for subclasses once all requests have completed"""
+    
+    def print_report(self):
+        """Print achieved rates, schedule lag and corrected latency percentiles"""
+        self.qa.print_header(f"{self.title} SUMMARY")
+        stats = self.stats
+        send_rate = self.scheduled / self.dispatch_elapsed if self.dispatch_elapsed else 0.0
+        throughput = self.completed / self.elapsed if self.elapsed else 0.0
+        error_rate = (stats.errors / stats.total * 100) if stats.total else 0.0
+        lag = self.lag.summary_ms()
+        late_pct = self.late / self.completed * 100 if self.completed else 0.0
+        
+        print(f"Target rate:    {self.rate:g} req/s")
+        print(f"Send rate:      {send_rate:.1f} req/s ({self.scheduled} scheduled)")
+        print(f"Throughput:     {throughput:.1f} req/s ({self.completed} completed in {self.elapsed:.1f}s)")
+        print(f"{Colors.GREEN if stats.errors == 0 else Colors.RED}Error Rate:     "
+              f"{error_rate:.2f}% ({stats.errors}){Colors.RESET}")
+        
+        lag_color = Colors.GREEN if late_pct < 1 else Colors.YELLOW if late_pct < 10 else Colors.RED
+        print(f"{lag_color}Schedule lag:   p50 {lag['p50'] or 0:.1f}ms, p99 {lag['p99'] or 0:.1f}ms, "
+              f"max {lag['max'] or 0:.1f}ms; {late_pct:.1f}% sent >10ms late{Colors.RESET}")
+        if late_pct >= 10:
+            print(f"{Colors.YELLOW}⚠ Generator fell behind its schedule - raise --max-inflight or "
+                  f"lower --rate; latencies below still count the delay{Colors.RESET}")
+        
+        print(f"\n{Colors.BOLD}Latency from intended send time:{Colors.RESET}")
+        print_latency_table(stats.histograms, stats.endpoint_errors, stats.endpoint_requests)
+        print(f"\n{Colors.BOLD}Service time (send to response, hides queueing):{Colors.RESET}")
+        print_latency_table({'all endpoints': self.service})
+        print(f"\n{Colors.BOLD}Request phases by endpoint:{Colors.RESET}")
+        print_phase_table(stats.phases)
+        print(f"\n{Colors.BOLD}Payload by endpoint (heaviest first):{Colors.RESET}")
+        print_payload_table(stats.payload)
+        print(f"\n{Colors.BOLD}Schema validation:{Colors.RESET}")
+        print_validation_table(stats.validation, stats.total)
+        if len(stats.roles.histograms) > 1:
+            print(f"\n{Colors.BOLD}Latency by role:{Colors.RESET}")
+            print_role_table(stats.roles)
+    
+    def generate_json_report(self, path: str):
+        """Write this run's rates, schedule lag and latency distributions as JSON"""
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'api_base_url': self.qa.api_base_url,
+            **self.rates(),
+            **aggregate_report(self.stats, self.qa.budgets),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        
+        print(f"{Colors.GREEN}✓ JSON report saved to {path}{Colors.RESET}")
+    
+    def rates(self) -> dict:
+        """Target and achieved rates, schedule lag and service time of this run"""
+        return {
+            'rate': self.rate,
+            'duration': self.duration,
+            'max_inflight': self.max_inflight,
+            'scheduled': self.scheduled,
+            'completed': self.completed,
+            'elapsed': self.elapsed,
+            'send_rate': self.scheduled / self.dispatch_elapsed if self.dispatch_elapsed else 0.0,
+            'throughput': self.completed / self.elapsed if self.elapsed else 0.0,
+            'late': self.late,
+            'schedule_lag_ms': self.lag.summary_ms(),
+            'service_time_ms': self.service.summary_ms(),
+        }
+
+
+class BurstPhase(OpenLoopTester):
+    """One open-loop phase of a shift-change burst with its own aggregates
+    
+    Results are also folded into `run_stats`, the aggregate of the whole burst.
+    """
+    
+    def __init__(self, qa: SGMSQASystem, title: str, rate: float, duration: float, request_fn,
+                 max_inflight: int = 256, run_stats: ResultAggregate = None):
+        super().__init__(qa, rate, duration, request_fn, max_inflight)
+        self.title = title
+        self.run_stats = run_stats
+    
+    def record(self, result: QAResult):
+        record = self.sink.write(result)
+        self.stats.add(record)
+        if self.run_stats is not None:
+            self.run_stats.add(record)
+
+
+class ShiftChangeSimulator:
+    """Shift-change burst: every guard checks in, then out, within a short window
+    
+    N guards with assignments are provisioned up front through the CRUD
+    scenario step actions. Check-ins are then released open-loop, evenly over
+    the burst window, followed by check-outs, while /attendance/today-summary
+    is polled to show what a dashboard sees during the burst. Assignments are
+    cancelled afterwards. `stats` aggregates the burst and poll requests of
+    this run; provisioning and cleanup traffic is not recorded.
+    """
+    
+    SHARED_STEPS = ['Create Client', 'Create Site', 'Create Site Post', 'Get Shift Types']
+    
+    def __init__(self, qa: SGMSQASystem, guards: int, window: float, max_inflight: int = 256,
+                 poll_interval: float = 1.0):
+        self.qa = qa
+        self.guard_count = max(1, guards)
+        self.window = max(0.1, window)
+        self.max_inflight = max_inflight
+        self.poll_interval = poll_interval
+        self.setup = SGMSQASystem(qa.api_base_url, qa.frontend_url, verbose=False, budgets=qa.budgets)
+        self.tag = str(int(time.time()))
+        self.shared: Dict[str, object] = {}
+        self.guards: List[Tuple[object, object]] = []
+        self.provision_time = 0.0
+        self.phases: List[BurstPhase] = []
+        self.stats = ResultAggregate()
+        self.summary = LatencyHistogram()
+        self.summary_errors = 0
+    
+    def steps(self, tag: str) -> Dict[str, ScenarioStep]:
+        return {step.name: step for step in self.setup.crud_scenario_steps(tag)}
+    
+    def provision_guard(self, index: int) -> Optional[Tuple[object, object]]:
+        """Create one guard and its assignment; returns (guardId, assignmentId)"""
+        steps = self.steps(f"{self.tag}{index:05d}")
+        _, guard = steps['Create Guard'].action({})
+        if 'guard' not in guard:
+            return None
+        _, assigned = steps['Create Assignment'].action({**self.shared, **guard})
+        if 'assignment' not in assigned:
+            return None
+        return guard['guard'], assigned['assignment']
+    
+    def provision(self) -> bool:
+        """Create the shared site and N assigned guards"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self.qa.print_header(f"SHIFT CHANGE - PROVISIONING {self.guard_count} GUARDS")
+        start = time.perf_counter()
+        self.setup.token = self.qa.token
+        
+        steps = self.steps(self.tag)
+        scheduler = ScenarioScheduler(self.setup, [steps[name] for name in self.SHARED_STEPS])
+        scheduler.run()
+        failed = [name for name in self.SHARED_STEPS if scheduler.steps[name].status != 'pass']
+        if failed:
+            for name in failed:
+                print(f"{Colors.RED}✗ {name}: {scheduler.steps[name].error}{Colors.RESET}")
+            return False
+        self.shared = dict(scheduler.outputs)
+        
+        with ThreadPoolExecutor(max_workers=self.qa.crud_workers, thread_name_prefix='provision') as pool:
+            for provisioned in pool.map(self.provision_guard, range(self.guard_count)):
+                if provisioned:
+                    self.guards.append(provisioned)
+        
+        self.provision_time = time.perf_counter() - start
+        color = Colors.GREEN if len(self.guards) == self.guard_count else Colors.YELLOW
+        print(f"{color}Provisioned {len(self.guards)}/{self.guard_count} guards with assignments "
+              f"in {self.provision_time:.1f}s{Colors.RESET}")
+        for message, count in sorted(self.setup.sink.aggregate.error_messages.items(), key=lambda kv: -kv[1])[:5]:
+            print(f"  {Colors.RED}{count:>5} × {message}{Colors.RESET}")
+        return bool(self.guards)
+    
+    def poll_summary(self, stop: threading.Event):
+        """Poll the attendance summary until the burst is over"""
+        client = self.qa.spawn(self.qa.role)
+        client.token = self.qa.token
+        while not stop.is_set():
+            result = client.test_endpoint('/attendance/today-summary')
+            if result.response_time is not None:
+                self.summary.record_ms(result.response_time)
+            if result.status == 'fail':
+                self.summary_errors += 1
+            self.stats.add(self.qa.sink.write(result))
+            stop.wait(self.poll_interval)
+    
+    def run(self) -> int:
+        """Provision, run the check-in and check-out bursts, clean up; returns failure count"""
+        if not self.qa.token:
+            with self.qa.unrecorded():
+                self.qa.login_admin()
+        if not self.qa.token:
+            print(f"{Colors.RED}✗ Authentication failed - cannot provision guards{Colors.RESET}")
+            return 1
+        
+        try:
+            if not self.provision():
+                return 1
+            
+            stop = threading.Event()
+            poller = threading.Thread(target=self.poll_summary, args=(stop,), daemon=True)
+            poller.start()
+            rate = len(self.guards) / self.window
+            try:
+                for title, endpoint in (("CHECK-IN BURST", '/attendance/check-in'),
+                                        ("CHECK-OUT BURST", '/attendance/check-out')):
+                    phase = BurstPhase(self.qa, title, rate, self.window,
+                                       lambda i, e=endpoint: (e, 'POST', {'guardId': self.guards[i][0]}),
+                                       self.max_inflight, self.stats)
+                    self.phases.append(phase)
+                    phase.run()
+            finally:
+                stop.set()
+                poller.join()
+        finally:
+            self.cleanup()
+        self.qa.sink.flush()
+        return sum(phase.stats.errors for phase in self.phases)
+    
+    def cleanup(self):
+        """Cancel the provisioned assignments and delete the site post"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if not self.guards and 'sitePost' not in self.shared:
+            return
+        with ThreadPoolExecutor(max_workers=self.qa.crud_workers, thread_name_prefix='cleanup') as pool:
+            list(pool.map(lambda g: self.setup.test_endpoint(f"/assignments/{g[1]}", 'DELETE'), self.guards))
+        if 'sitePost' in self.shared:
+            self.setup.test_endpoint(f"/site-posts/{self.shared['sitePost']}", 'DELETE')
+    
+    def print_report(self):
+        """Print throughput, tail latency and failures for each burst phase"""
+        self.qa.print_header("SHIFT CHANGE SUMMARY")
+        print(f"Guards: {len(self.guards)}, Burst window: {self.window:g}s per phase, "
+              f"Provisioning: {self.provision_time:.1f}s")
+        
+        for phase in self.phases:
+            stats = phase.stats
+            throughput = phase.completed / phase.elapsed if phase.elapsed else 0.0
+            latency = LatencyHistogram()
+            for histogram in stats.histograms.values():
+                latency.merge(histogram)
+            summary = latency.summary_ms()
+            lag = phase.lag.summary_ms()
+            color = Colors.GREEN if stats.errors == 0 else Colors.RED
+            
+            print(f"\n{Colors.BOLD}{phase.title}{Colors.RESET}")
+            print(f"  Throughput:   {throughput:.1f} req/s ({phase.completed} in {phase.elapsed:.1f}s)")
+            print(f"  Latency:      p50 {summary['p50'] or 0:.0f}ms, p99 {summary['p99'] or 0:.0f}ms, "
+                  f"max {summary['max'] or 0:.0f}ms (from intended send time)")
+            print(f"  Schedule lag: p99 {lag['p99'] or 0:.1f}ms")
+            print(f"  {color}Failures:     {stats.errors}/{stats.total}{Colors.RESET}")
+            for message, count in sorted(stats.error_messages.items(), key=lambda kv: -kv[1]):
+                print(f"    {Colors.RED}{count:>5} × {message}{Colors.RESET}")
+        
+        summary = self.summary.summary_ms()
+        print(f"\n{Colors.BOLD}GET /attendance/today-summary during burst{Colors.RESET}")
+        if summary['count']:
+            color = Colors.GREEN if self.summary_errors == 0 else Colors.RED
+            print(f"  {summary['count']} polls: p50 {summary['p50']:.0f}ms, p99 {summary['p99']:.0f}ms, "
+                  f"max {summary['max']:.0f}ms {color}({self.summary_errors} failed){Colors.RESET}")
+        else:
+            print("  No polls completed")
+        
+        print(f"\n{Colors.BOLD}Request phases by endpoint:{Colors.RESET}")
+        print_phase_table(self.stats.phases)
+        print(f"\n{Colors.BOLD}Payload by endpoint (heaviest first):{Colors.RESET}")
+        print_payload_table(self.stats.payload)
+        print(f"\n{Colors.BOLD}Schema validation:{Colors.RESET}")
+        print_validation_table(self.stats.validation, self.stats.total)
+    
+    def generate_json_report(self, path: str):
+        """Write this run's burst phases, summary polls and latency distributions as JSON"""
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'api_base_url': self.qa.api_base_url,
+            'guards': len(self.guards),
+            'burst_window': self.window,
+            'provision_time': self.provision_time,
+            'bursts': [{'title': phase.title, **phase.rates(), 'requests': phase.stats.total,
+                        'errors': phase.stats.errors, 'error_messages': phase.stats.error_messages}
+                       for phase in self.phases],
+            'summary_polls': {'summary_ms': self.summary.summary_ms(), 'errors': self.summary_errors},
+            **aggregate_report(self.stats, self.qa.budgets),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        
+        print(f"{Colors.GREEN}✓ JSON report saved to {path}{Colors.RESET}")
+
+
+def timeseries_svg(windows: List[dict], width: int = 1100, height: int = 260) -> str:
+    """Inline SVG chart of per-window p50/p95/p99 latency and error rate"""
+    if not windows:
+        return ''
+    pad_left, pad_right, pad_top, pad_bottom = 60, 60, 20, 30
+    plot_w, plot_h = width - pad_left - pad_right, height - pad_top - pad_bottom
+    max_latency = max((w.get('p99') or w.get('p95') or 0) for w in windows) or 1.0
+    max_error = max(w['error_rate'] for w in windows) or 0.01
+    count = len(windows)
+    
+    def x(i):
+        return pad_left + (plot_w * i / (count - 1) if count > 1 else plot_w / 2)
+    
+    def line(values, scale, color, dash=''):
+        points = ' '.join(f"{x(i):.1f},{pad_top + plot_h - (v or 0) / scale * plot_h:.1f}"
+                          for i, v in enumerate(values))
+        return f'<polyline fill="none" stroke="{color}" stroke-width="2" {dash} points="{points}"/>'
+    
+    svg = [f'<svg viewBox="0 0 {width} {height}" width="100%" xmlns="http://www.w3.org/2000/svg">']
+    svg.append(f'<rect x="{pad_left}" y="{pad_top}" width="{plot_w}" height="{plot_h}" '
+               f'fill="none" stroke="rgba(255,255,255,0.15)"/>')
+    svg.append(line([w['p50'] for w in windows], max_latency, '#4CAF50'))
+    svg.append(line([w['p95'] for w in windows], max_latency, '#00C9FF'))
+    svg.append(line([w['p99'] for w in windows], max_latency, '#ff9800'))
+    svg.append(line([w['error_rate'] for w in windows], max_error, '#f44336', 'stroke-dasharray="4 3"'))
+    svg.append(f'<text x="{pad_left - 8}" y="{pad_top + 10}" fill="#999" font-size="11" text-anchor="end">{max_latency:.0f}ms</text>')
+    svg.append(f'<text x="{pad_left - 8}" y="{pad_top + plot_h}" fill="#999" font-size="11" text-anchor="end">0</text>')
+    svg.append(f'<text x="{width - pad_right + 8}" y="{pad_top + 10}" fill="#f44336" font-size="11">{max_error * 100:.1f}%</text>')
+    svg.append(f'<text x="{pad_left}" y="{height - 8}" fill="#999" font-size="11">{windows[0]["offset"] / 60:.0f}m</text>')
+    svg.append(f'<text x="{width - pad_right}" y="{height - 8}" fill="#999" font-size="11" text-anchor="end">{windows[-1]["offset"] / 60:.0f}m</text>')
+    legend = [('p50', '#4CAF50'), ('p95', '#00C9FF'), ('p99', '#ff9800'), ('error rate', '#f44336')]
+    for i, (label, color) in enumerate(legend):
+        svg.append(f'<text x="{pad_left + 10 + i * 90}" y="{pad_top + 14}" fill="{color}" font-size="12">■ {label}</text>')
+    svg.append('</svg>')
+    return '\n'.join(svg)
+
+
+def t_critical(confidence: float, df: int) -> float:
+    """Two-sided Student t critical value (Cornish-Fisher expansion of the normal quantile)"""
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    if df <= 0:
+        return float('inf')
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+
+class BenchmarkStats:
+    """Descriptive statistics for a set of benchmark samples (milliseconds)"""
+    
+    def __init__(self, samples: List[float], confidence: float = 0.95):
+        self.samples = sorted(samples)
+        self.confidence = confidence
+        self.n = len(self.samples)
+        self.mean = statistics.fmean(self.samples) if self.samples else None
+        self.stddev = statistics.stdev(self.samples) if self.n > 1 else 0.0
+        self.median = statistics.median(self.samples) if self.samples else None
+        self.ci_low, self.ci_high = self.mean_confidence_interval(self.samples)
+        
+        # Tukey fences: mild beyond 1.5×IQR, severe beyond 3×IQR
+        if self.n >= 4:
+            q1, _, q3 = statistics.quantiles(self.samples, n=4, method='inclusive')
+        else:
+            q1 = q3 = self.median or 0.0
+        iqr = q3 - q1
+        self.q1, self.q3 = q1, q3
+        self.outliers = {'low_severe': 0, 'low_mild': 0, 'high_mild': 0, 'high_severe': 0}
+        for value in self.samples:
+            if value < q1 - 3 * iqr:
+                self.outliers['low_severe'] += 1
+            elif value < q1 - 1.5 * iqr:
+                self.outliers['low_mild'] += 1
+            elif value > q3 + 3 * iqr:
+                self.outliers['high_severe'] += 1
+            elif value > q3 + 1.5 * iqr:
+                self.outliers['high_mild'] += 1
+        
+        inliers = [v for v in self.samples if q1 - 1.5 * iqr <= v <= q3 + 1.5 * iqr]
+        self.trimmed_mean = statistics.fmean(inliers) if inliers else self.mean
+    
+    def mean_confidence_interval(self, samples: List[float]) -> Tuple[Optional[float], Optional[float]]:
+        """Confidence interval of the mean using the Student t distribution"""
+        if len(samples) < 2:
+            return self.mean, self.mean
+        margin = t_critical(self.confidence, len(samples) - 1) * self.stddev / (len(samples) ** 0.5)
+        return self.mean - margin, self.mean + margin
+    
+    @property
+    def outlier_count(self) -> int:
+        return sum(self.outliers.values())
+    
+    @property
+    def relative_margin(self) -> float:
+        """Half-width of the confidence interval relative to the mean"""
+        if not self.mean or self.ci_high is None:
+            return 0.0
+        return (self.ci_high - self.mean) / self.mean
+
+
+class EndpointBenchmark:
+    """Warmed-up, repeated timing of a single endpoint for regression detection
+    
+    Warmup iterations absorb JIT/Hibernate warmup and connection setup on the
+    Spring backend and are discarded. Timed iterations use perf_counter_ns via
+    test_endpoint; failed iterations are counted and excluded from statistics.
+    Every timed iteration is written to the results file and to `results`, the
+    aggregate budgets and baselines are checked against.
+    """
+    
+    def __init__(self, qa: SGMSQASystem, endpoint: str, warmup: int = 10,
+                 iterations: int = 100, confidence: float = 0.95):
+        self.qa = qa
+        self.endpoint = endpoint if endpoint.startswith('/') else f'/{endpoint}'
+        self.warmup = max(0, warmup)
+        self.iterations = max(2, iterations)
+        self.confidence = confidence
+        self.failures: Dict[str, int] = {}
+        self.histogram = LatencyHistogram()
+        self.phases = PhaseStats()
+        self.results = ResultAggregate()
+        self.stats: Optional[BenchmarkStats] = None
+    
+    def run(self) -> BenchmarkStats:
+        """Run warmup then timed iterations"""
+        with self.qa.unrecorded():
+            self.qa.login_admin()
+        self.qa.print_header(f"BENCHMARK - GET {self.endpoint}")
+        
+        print(f"Warmup: {self.warmup} iterations")
+        for _ in range(self.warmup):
+            self.qa.test_endpoint(self.endpoint)
+        
+        print(f"Measuring: {self.iterations} iterations")
+        samples = []
+        for _ in range(self.iterations):
+            result = self.qa.test_endpoint(self.endpoint)
+            self.results.add(self.qa.sink.write(result))
+            if result.status == 'fail' or result.response_time is None:
+                message = result.error or 'Unknown error'
+                self.failures[message] = self.failures.get(message, 0) + 1
+                continue
+            samples.append(result.response_time)
+            self.histogram.record_ms(result.response_time)
+            self.phases.add(result.key, result.timings)
+        
+        self.stats = BenchmarkStats(samples, self.confidence)
+        return self.stats
+    
+    def print_report(self):
+        """Print mean, spread, confidence interval and outliers"""
+        stats = self.stats
+        self.qa.print_header("BENCHMARK RESULTS")
+        print(f"Endpoint:    GET {self.endpoint}")
+        print(f"Samples:     {stats.n}/{self.iterations} (warmup {self.warmup} discarded)")
+        
+        if not stats.n:
+            print(f"{Colors.RED}No successful iterations{Colors.RESET}")
+        else:
+            ci_pct = self.confidence * 100
+            print(f"Mean:        {stats.mean:.3f}ms ± {stats.stddev:.3f}ms (stddev)")
+            print(f"{ci_pct:g}% CI:      [{stats.ci_low:.3f}ms, {stats.ci_high:.3f}ms] "
+                  f"(±{stats.relative_margin * 100:.1f}%)")
+            print(f"Median:      {stats.median:.3f}ms (IQR {stats.q1:.3f}–{stats.q3:.3f}ms)")
+            print(f"Trimmed:     {stats.trimmed_mean:.3f}ms (mean without outliers)")
+            
+            outlier_color = Colors.GREEN if stats.outlier_count == 0 else Colors.YELLOW
+            print(f"{outlier_color}Outliers:    {stats.outlier_count} "
+                  f"({stats.outlier_count / stats.n * 100:.1f}%){Colors.RESET}")
+            for kind, count in stats.outliers.items():
+                if count:
+                    print(f"  {count:>6} {kind.replace('_', ' ')}")
+            
+            print()
+            print_latency_table({f"GET {self.endpoint}": self.histogram})
+            print()
+            print_phase_table(self.phases)
+            
+            if stats.relative_margin > 0.05:
+                print(f"\n{Colors.YELLOW}⚠ Confidence interval wider than ±5% - "
+                      f"increase --iterations to resolve small regressions{Colors.RESET}")
+        
+        if self.failures:
+            print(f"\n{Colors.RED}Failed iterations:{Colors.RESET}")
+            for message, count in sorted(self.failures.items(), key=lambda item: -item[1]):
+                print(f"  {count:>6} × {message}")
+    
+    def generate_json_report(self, path: str):
+        """Write benchmark statistics and the latency distribution as JSON"""
+        stats = self.stats
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'api_base_url': self.qa.api_base_url,
+            'endpoint': f"GET {self.endpoint}",
+            'warmup': self.warmup,
+            'iterations': self.iterations,
+            'confidence': self.confidence,
+            'samples': stats.n,
+            'mean_ms': stats.mean,
+            'stddev_ms': stats.stddev,
+            'median_ms': stats.median,
+            'ci_ms': [stats.ci_low, stats.ci_high],
+            'relative_margin': stats.relative_margin,
+            'trimmed_mean_ms': stats.trimmed_mean,
+            'outliers': stats.outliers,
+            'summary_ms': self.histogram.summary_ms(),
+            'histogram': self.histogram.to_dict(),
+            'phases': self.phases.summary(),
+            'failures': self.failures,
+            'budget_violations': self.qa.budgets.check(self.results),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        
+        print(f"{Colors.GREEN}✓ JSON report saved to {path}{Colors.RESET}")
+
+
+def log_log_slope(sizes: List[float], values: List[float]) -> Optional[float]:
+    """Least-squares slope of log(value) against log(size) - the growth exponent"""
+    import math
+    points = [(math.log(x), math.log(y)) for x, y in zip(sizes, values) if x > 0 and y and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+
+
+def growth_class(slope: Optional[float]) -> str:
+    """constant / sublinear / linear / superlinear from a log-log growth exponent"""
+    if slope is None:
+        return 'unknown'
+    if slope < 0.2:
+        return 'constant'
+    if slope < 0.75:
+        return 'sublinear'
+    if slope < 1.25:
+        return 'linear'
+    return 'superlinear'
+
+
+class ScalingBenchmark:
+    """Latency and payload of the list endpoints as the dataset grows
+    
+    The backend is seeded up to each size in turn (clients, sites, site posts,
+    guards and assignments, created through the CRUD scenario step actions),
+    and every list endpoint is measured at each size. A log-log fit of median
+    latency and payload against row count gives each endpoint's growth
+    exponent; linear or worse growth usually means an unpaginated collection.
+    Fixed per-request overhead flattens the fit at small sizes, so endpoints
+    are classified by the exponent between the two largest sizes.
+    Seeded rows are deleted afterwards unless `keep` is set. Timed requests
+    (not warmups or seeding) are written to the results file and to
+    `results`, the aggregate budgets are checked against.
+    """
+    
+    LIST_ENDPOINTS = ['/guards', '/clients', '/sites', '/site-posts', '/assignments']
+    # Seeded row keys and their endpoints, in reverse dependency order for cleanup
+    RESOURCES = (('assignment', '/assignments'), ('sitePost', '/site-posts'), ('site', '/sites'),
+                 ('client', '/clients'), ('guard', '/guards'))
+    
+    def __init__(self, qa: SGMSQASystem, sizes: List[int], iterations: int = 15, warmup: int = 2,
+                 keep: bool = False):
+        self.qa = qa
+        self.sizes = sorted(set(max(1, size) for size in sizes))
+        self.iterations = max(1, iterations)
+        self.warmup = max(0, warmup)
+        self.keep = keep
+        self.client = SGMSQASystem(qa.api_base_url, qa.frontend_url, verbose=False, budgets=qa.budgets)
+        self.tag = str(int(time.time()))
+        self.shift_type = None
+        self.seeded: List[Dict[str, object]] = []  # Complete rows
+        self.partial: List[Dict[str, object]] = []  # IDs created by rows that failed midway, for cleanup
+        self.attempted = 0
+        self.seed_failures: Dict[str, int] = {}
+        self.initial: Dict[str, int] = {}
+        # endpoint -> list of {size, items, p50, p95, bytes, failures} per level
+        self.levels: Dict[str, List[dict]] = {endpoint: [] for endpoint in self.LIST_ENDPOINTS}
+        self.fits: Dict[str, dict] = {}
+        self.results = ResultAggregate()
+    
+    def seed_row(self, index: int) -> Optional[Dict[str, object]]:
+        """Create one client → site → site post chain plus a guard assigned to the post
+        
+        Returns None if a step fails; whatever it created is kept in `partial`.
+        """
+        steps = {step.name: step for step in self.client.crud_scenario_steps(f"{self.tag}{index:06d}")}
+        row: Dict[str, object] = {'shiftType': self.shift_type}
+        for name in ('Create Client', 'Create Site', 'Create Site Post', 'Create Guard', 'Create Assignment'):
+            step = steps[name]
+            result, outputs = step.action({key: row[key] for key in step.requires})
+            if not all(output in outputs for output in step.provides):
+                message = f"{name}: {result.error or 'no id in response'}"
+                with self.qa.lock:
+                    self.seed_failures[message] = self.seed_failures.get(message, 0) + 1
+                    if any(key in row for key, _ in self.RESOURCES):
+                        self.partial.append(row)
+                return None
+            row.update(outputs)
+        return row
+    
+    def seed_to(self, size: int):
+        """Attempt rows until `size` rows have been attempted in this run"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        start = time.perf_counter()
+        first, seeded = self.attempted, len(self.seeded)
+        with ThreadPoolExecutor(max_workers=self.qa.crud_workers, thread_name_prefix='seed') as pool:
+            for row in pool.map(self.seed_row, range(first, size)):
+                if row:
+                    self.seeded.append(row)
+        self.attempted = max(first, size)
+        print(f"Seeded {len(self.seeded) - seeded} rows in {time.perf_counter() - start:.1f}s"
+              + (f" ({sum(self.seed_failures.values())} failures so far)" if self.seed_failures else ''))
+    
+    def created(self, endpoint: str) -> int:
+        """Rows this run actually created behind a list endpoint, including those of failed seeds"""
+        key = dict((endpoint, key) for key, endpoint in self.RESOURCES)[endpoint]
+        return sum(1 for row in self.seeded + self.partial if key in row)
+    
+    def measure(self, endpoint: str, size: int) -> dict:
+        """Median/p95 latency, payload bytes and item count of one endpoint at one size"""
+        histogram = LatencyHistogram()
+        sizes, items, failures = [], None, 0
+        for _ in range(self.warmup):
+            self.client.test_endpoint(endpoint)
+        for _ in range(self.iterations):
+            result = self.client.test_endpoint(endpoint)
+            self.results.add(self.qa.sink.write(result))
+            if result.status == 'fail' or result.response_time is None:
+                failures += 1
+                continue
+            histogram.record_ms(result.response_time)
+            if result.size is not None:
+                sizes.append(result.size)
+            items = result.items
+        summary = histogram.summary_ms()
+        return {'size': size, 'items': items, 'p50': summary['p50'], 'p95': summary['p95'],
+                'bytes': statistics.mean(sizes) if sizes else None, 'failures': failures}
+    
+    def run(self) -> Dict[str, dict]:
+        """Seed and measure every size, then fit growth curves"""
+        if not self.qa.token:
+            with self.qa.unrecorded():
+                self.qa.login_admin()
+        self.client.token = self.qa.token
+        
+        _, outputs = {s.name: s for s in self.client.crud_scenario_steps(self.tag)}['Get Shift Types'].action({})
+        self.shift_type = outputs.get('shiftType')
+        if self.shift_type is None:
+            print(f"{Colors.RED}✗ No shift types available - cannot seed assignments{Colors.RESET}")
+            return {}
+        
+        for endpoint in self.LIST_ENDPOINTS:
+            self.initial[endpoint] = self.client.test_endpoint(endpoint).items or 0
+        
+        try:
+            for size in self.sizes:
+                self.qa.print_header(f"SCALING - {size} SEEDED ROWS")
+                self.seed_to(size)
+                for endpoint in self.LIST_ENDPOINTS:
+                    level = self.measure(endpoint, self.initial[endpoint] + self.created(endpoint))
+                    self.levels[endpoint].append(level)
+                    print(f"  GET {endpoint:<16} p50 {level['p50'] or 0:>8.1f}ms  "
+                          f"{(level['bytes'] or 0) / 1024:>9.1f}KB  items {level['items']}")
+        except KeyboardInterrupt:
+            print(f"\n{Colors.YELLOW}⚠ Interrupted - fitting the sizes measured so far{Colors.RESET}")
+        finally:
+            if not self.keep:
+                self.cleanup()
+        
+        for endpoint, levels in self.levels.items():
+            sizes = [level['size'] for level in levels]
+            latency = [level['p50'] for level in levels]
+            payload = [level['bytes'] for level in levels]
+            fit = {
+                'latency_slope': log_log_slope(sizes, latency),
+                'bytes_slope': log_log_slope(sizes, payload),
+                'latency_tail_slope': log_log_slope(sizes[-2:], latency[-2:]),
+                'bytes_tail_slope': log_log_slope(sizes[-2:], payload[-2:]),
+                'paginated': len({level['items'] for level in levels}) == 1 and len(levels) > 1,
+            }
+            fit['latency_growth'] = growth_class(fit['latency_tail_slope'])
+            fit['payload_growth'] = growth_class(fit['bytes_tail_slope'])
+            fit['scales_badly'] = fit['latency_growth'] in ('linear', 'superlinear') or \
+                fit['payload_growth'] in ('linear', 'superlinear')
+            self.fits[endpoint] = fit
+        return self.fits
+    
+    def cleanup(self):
+        """Delete seeded rows in reverse dependency order"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        rows = self.seeded + self.partial
+        if not rows:
+            return
+        print(f"Deleting {len(self.seeded)} seeded rows"
+              + (f" and {len(self.partial)} partial ones" if self.partial else '') + "...")
+        for key, endpoint in self.RESOURCES:
+            ids = [row[key] for row in rows if key in row]
+            with ThreadPoolExecutor(max_workers=self.qa.crud_workers, thread_name_prefix='cleanup') as pool:
+                list(pool.map(lambda resource_id: self.client.test_endpoint(f"{endpoint}/{resource_id}", 'DELETE'), ids))
+    
+    def print_report(self):
+        """Print per-size latency/payload and the fitted growth class per endpoint"""
+        self.qa.print_header("DATA-VOLUME SCALING SUMMARY")
+        colors = {'constant': Colors.GREEN, 'sublinear': Colors.GREEN, 'linear': Colors.YELLOW,
+                  'superlinear': Colors.RED, 'unknown': ''}
+        
+        print(f"{'Endpoint':<18}" + ''.join(f" {f'~{size} rows':>18}" for size in self.sizes)
+              + f" {'latency growth':>18} {'payload growth':>18}")
+        for endpoint, levels in self.levels.items():
+            row = f"GET {endpoint:<14}"
+            for level in levels:
+                cell = f"{level['p50'] or 0:.0f}ms/{(level['bytes'] or 0) / 1024:.0f}KB"
+                row += f" {cell:>18}"
+            row += f" {'':>18}" * (len(self.sizes) - len(levels))
+            fit = self.fits.get(endpoint, {})
+            for kind in ('latency', 'bytes'):
+                slope = fit.get(f'{kind}_tail_slope')
+                growth = fit.get('latency_growth' if kind == 'latency' else 'payload_growth', 'unknown')
+                cell = f"{growth} (n^{slope:.2f})" if slope is not None else growth
+                row += f" {colors.get(growth, '')}{cell:>18}{Colors.RESET}"
+            if fit.get('paginated'):
+                row += "  paginated"
+            print(row)
+        
+        flagged = [endpoint for endpoint, fit in self.fits.items() if fit['scales_badly']]
+        if flagged:
+            print(f"\n{Colors.RED}✗ Scales badly (linear or worse): {', '.join(flagged)} - "
+                  f"consider pagination or narrower DTOs{Colors.RESET}")
+        else:
+            print(f"\n{Colors.GREEN}✓ All list endpoints scale sublinearly{Colors.RESET}")
+        if self.seed_failures:
+            print(f"\n{Colors.RED}Seeding failures:{Colors.RESET}")
+            for message, count in sorted(self.seed_failures.items(), key=lambda kv: -kv[1]):
+                print(f"  {count:>6} × {message}")
+    
+    def generate_json_report(self, path: str):
+        """Write per-size measurements and growth fits as JSON"""
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'api_base_url': self.qa.api_base_url,
+            'sizes': self.sizes,
+            'iterations': self.iterations,
+            'endpoints': {
+                endpoint: {'levels': self.levels[endpoint], 'fit': self.fits.get(endpoint)}
+                for endpoint in self.LIST_ENDPOINTS
+            },
+            'seed_failures': self.seed_failures,
+            'budget_violations': self.qa.budgets.check(self.results),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        
+        print(f"{Colors.GREEN}✓ JSON report saved to {path}{Colors.RESET}")
+
+
 def main():
     """Main entry point"""
     # Load .env if available
@@ -810,18 +4905,253 @@ def main():
                        help='Frontend URL')
     parser.add_argument('--no-frontend', action='store_true',
                        help='Skip frontend tests')
+    parser.add_argument('--network-profiles', default='slow-3g,fast-3g,4g', metavar='PROFILES',
+                       help='Comma-separated networks for simulated frontend load times: '
+                            f"{', '.join(NETWORK_PROFILES)} or NAME:KBPS:RTT_MS (default: slow-3g,fast-3g,4g)")
+    parser.add_argument('--no-cache-audit', action='store_true',
+                       help='Skip the HTTP caching audit (second, conditional fetch of every asset and GET endpoint)')
+    parser.add_argument('--token-cache', metavar='PATH',
+                       default=os.getenv('QA_TOKEN_CACHE', str(TokenCache.DEFAULT_PATH)),
+                       help='JWT token cache file (default: .qa_token_cache.json)')
+    parser.add_argument('--no-token-cache', action='store_true',
+                       help='Always log in instead of reusing cached tokens')
+    parser.add_argument('--credentials', metavar='PATH',
+                       help='Per-role accounts JSON for the session pool used by audit, load, soak and '
+                            'open-loop runs (default: qa_credentials.json next to this script, if present)')
+    parser.add_argument('--budgets', metavar='PATH',
+                       help='Performance budgets JSON file (default: qa_budgets.json next to this script)')
+    parser.add_argument('--validate-sample', type=float, default=0.0, metavar='FRACTION',
+                       help='Fraction of responses schema-validated in load, soak, open-loop, bench and '
+                            'scale modes (default: 0; functional audits validate every response)')
+    parser.add_argument('--save-baseline', metavar='NAME',
+                       help='Save per-endpoint latency distributions and payload sizes as baseline NAME')
+    parser.add_argument('--compare', metavar='NAME',
+                       help='Compare this run against baseline NAME and flag significant regressions')
+    parser.add_argument('--baseline-dir', metavar='PATH', default=str(BaselineStore.DEFAULT_DIR),
+                       help='Directory baselines are stored in (default: qa_baselines/)')
+    parser.add_argument('--noise-tolerance', type=float, default=0.10,
+                       help='Median change below this fraction is never a regression (default: 0.10)')
+    parser.add_argument('--no-discovery', action='store_true',
+                       help='Use the built-in read endpoint list instead of the GET routes discovered '
+                            'from the backend controllers (audit, load, soak and open-loop modes)')
+    parser.add_argument('--probe-workers', type=int, default=8,
+                       help='Concurrent requests when probing discovered endpoints (default: 8)')
+    parser.add_argument('--crud-workers', type=int, default=4,
+                       help='Worker threads for the CRUD scenario DAG (default: 4)')
+    parser.add_argument('--json-report', metavar='PATH',
+                       help='Also write results and latency percentiles as JSON')
+    parser.add_argument('--results-file', metavar='PATH', default='qa_results.ndjson',
+                       help='Append-only NDJSON file results are streamed to (default: qa_results.ndjson)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Append to an existing results file and include its results in the reports')
+    parser.add_argument('--report-from', metavar='PATH',
+                       help='Only build reports from an existing results file (e.g. of a killed run)')
+    parser.add_argument('--load', action='store_true',
+                       help='Run concurrent virtual-user load test instead of the functional audit')
+    parser.add_argument('--users', type=int, default=10,
+                       help='Number of virtual users in load mode (default: 10)')
+    parser.add_argument('--ramp-up', type=float, default=10.0,
+                       help='Seconds over which virtual users are started (default: 10)')
+    parser.add_argument('--duration', type=float, default=60.0,
+                       help='Seconds to keep load after ramp-up (default: 60)')
+    parser.add_argument('--soak', metavar='DURATION', type=parse_duration,
+                       help='Run a steady soak test for DURATION (e.g. 30m, 8h) with drift detection')
+    parser.add_argument('--window', metavar='DURATION', type=parse_duration, default=60.0,
+                       help='Soak-test aggregation window (default: 60s)')
+    parser.add_argument('--rate', type=float,
+                       help='Open-loop mode: send requests at this constant rate (req/s) for --duration')
+    parser.add_argument('--target', metavar='ENDPOINT', action='append',
+                       help='GET endpoint for open-loop mode (repeatable; default: read endpoint catalog)')
+    parser.add_argument('--max-inflight', type=int, default=256,
+                       help='Maximum concurrent requests in open-loop mode (default: 256)')
+    parser.add_argument('--shift-change', type=int, metavar='GUARDS',
+                       help='Shift-change burst: provision GUARDS assigned guards, then burst check-ins and check-outs')
+    parser.add_argument('--burst-window', type=float, default=60,
+                       help='Seconds over which each shift-change burst is released (default: 60)')
+    parser.add_argument('--bench', metavar='ENDPOINT',
+                       help='Benchmark a single GET endpoint (e.g. /dashboard/admin-summary)')
+    parser.add_argument('--warmup', type=int, default=10,
+                       help='Discarded warmup iterations in bench mode (default: 10)')
+    parser.add_argument('--iterations', type=int, default=100,
+                       help='Timed iterations in bench mode (default: 100)')
+    parser.add_argument('--scale', action='store_true',
+                       help='Data-volume scaling benchmark of the list endpoints (seeds the backend!)')
+    parser.add_argument('--scale-sizes', default='100,1000,10000',
+                       help='Comma-separated seeded row counts for --scale (default: 100,1000,10000)')
+    parser.add_argument('--scale-iterations', type=int, default=15,
+                       help='Timed requests per endpoint and size in --scale mode (default: 15)')
+    parser.add_argument('--keep-seed', action='store_true',
+                       help='Do not delete rows seeded by --scale')
+    parser.add_argument('--confidence', type=float, default=0.95,
+                       help='Confidence level for bench mode intervals (default: 0.95)')
     
     args = parser.parse_args()
+    if not 0.0 <= args.validate_sample <= 1.0:
+        parser.error(f"--validate-sample must be between 0 and 1: {args.validate_sample}")
+    if args.scale and (args.compare or args.save_baseline):
+        parser.error("--compare and --save-baseline do not apply to --scale: "
+                     "its per-endpoint latencies mix every seeded size")
+    try:
+        network_profiles = parse_network_profiles(args.network_profiles)
+    except ValueError as e:
+        parser.error(f"--network-profiles: {e}")
     
     admin_email = os.getenv('QA_ADMIN_EMAIL')
     admin_password = os.getenv('QA_ADMIN_PASSWORD')
     
-    qa = SGMSQASystem(args.api_url, args.frontend_url, admin_email, admin_password)
+    budgets_path = args.budgets or (PerformanceBudgets.DEFAULT_PATH if PerformanceBudgets.DEFAULT_PATH.exists() else None)
+    try:
+        budgets = PerformanceBudgets.load(budgets_path) if budgets_path else PerformanceBudgets()
+    except (OSError, ValueError) as e:
+        print(f"{Colors.RED}✗ Cannot load budgets file {budgets_path}: {e}{Colors.RESET}")
+        sys.exit(1)
+    
+    baselines = BaselineStore(args.baseline_dir)
+    baseline = None
+    if args.compare:
+        try:
+            baseline = baselines.load(args.compare)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.RED}✗ Cannot load baseline '{args.compare}': {e}{Colors.RESET}")
+            sys.exit(1)
+    
+    run_info = {'mode': 'report', 'api_base_url': args.api_url}
+    
+    def check_performance(aggregate: ResultAggregate) -> bool:
+        """Check budgets, compare with/save baselines; True if anything breached"""
+        print(f"\n{Colors.BOLD}Performance budgets{' (' + str(budgets_path) + ')' if budgets_path else ''}:{Colors.RESET}")
+        violations = budgets.check(aggregate)
+        print_budget_violations(violations)
+        
+        regressions = []
+        if baseline is not None:
+            print(f"\n{Colors.BOLD}Comparison with baseline '{args.compare}' "
+                  f"({baseline.get('created', '?')[:19]}):{Colors.RESET}")
+            rows = compare_to_baseline(baseline, aggregate, args.noise_tolerance)
+            print_baseline_comparison(args.compare, rows, args.noise_tolerance)
+            regressions = [row for row in rows if row['verdict'] == 'regression']
+        
+        if args.save_baseline:
+            path = baselines.save(args.save_baseline, aggregate, run_info)
+            print(f"{Colors.GREEN}✓ Baseline '{args.save_baseline}' saved to {path}{Colors.RESET}")
+        return bool(violations or regressions)
+    
+    if args.report_from:
+        qa = SGMSQASystem(args.api_url, args.frontend_url, sink=ResultSink.load(args.report_from),
+                          budgets=budgets)
+        is_soak = next(qa.sink.iter_results('window'), None) is not None
+        qa.print_summary()
+        breached = check_performance(qa.sink.aggregate)
+        qa.generate_html_report(include_rows=not is_soak)
+        if args.json_report:
+            qa.generate_json_report(args.json_report)
+        sys.exit(exit_status(qa.sink.aggregate.errors > 0, breached))
+    
+    mode = 'scale' if args.scale else 'bench' if args.bench else 'shift-change' if args.shift_change else 'open-loop' if args.rate else 'soak' if args.soak else 'load' if args.load else 'audit'
+    run_info['mode'] = mode
+    sink = ResultSink(args.results_file, resume=args.resume, run_info=run_info)
+    token_cache = None if args.no_token_cache else TokenCache(args.token_cache)
+    qa = SGMSQASystem(args.api_url, args.frontend_url, admin_email, admin_password,
+                      token_cache=token_cache, sink=sink, budgets=budgets, schemas=ResponseSchemas(),
+                      validate_sample=1.0 if mode == 'audit' else args.validate_sample)
+    qa.crud_workers = args.crud_workers
+    qa.discover_endpoints = not args.no_discovery
+    qa.probe_workers = args.probe_workers
+    qa.network_profiles = network_profiles
+    qa.audit_caching = not args.no_cache_audit
+    
+    credentials_path = args.credentials or (SessionPool.DEFAULT_PATH if SessionPool.DEFAULT_PATH.exists() else None)
+    if credentials_path and mode in ('audit', 'load', 'soak', 'open-loop'):
+        try:
+            qa.pool = SessionPool.load(qa, credentials_path)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.RED}✗ Cannot load credentials file {credentials_path}: {e}{Colors.RESET}")
+            sys.exit(1)
+        ready = qa.pool.authenticate()
+        print(f"\n{Colors.BOLD}Session pool ({credentials_path}): {ready} session(s){Colors.RESET}")
+        qa.pool.print_status()
+    
+    if mode in ('load', 'soak', 'open-loop') and qa.discover_endpoints and not args.target:
+        qa.discover_catalog()
+    
+    if args.scale:
+        try:
+            sizes = [int(size) for size in args.scale_sizes.split(',') if size.strip()]
+        except ValueError:
+            parser.error(f"--scale-sizes must be comma-separated integers: {args.scale_sizes}")
+        scaling = ScalingBenchmark(qa, sizes, args.scale_iterations, keep=args.keep_seed)
+        fits = scaling.run()
+        scaling.print_report()
+        breached = check_performance(scaling.results)
+        if args.json_report:
+            scaling.generate_json_report(args.json_report)
+        sink.close()
+        sys.exit(exit_status(not fits or bool(scaling.seed_failures),
+                             breached or any(fit['scales_badly'] for fit in fits.values())))
+    
+    if args.bench:
+        bench = EndpointBenchmark(qa, args.bench, args.warmup, args.iterations, args.confidence)
+        stats = bench.run()
+        bench.print_report()
+        breached = check_performance(bench.results)
+        if args.json_report:
+            bench.generate_json_report(args.json_report)
+        sink.close()
+        sys.exit(exit_status(stats.n == 0 or bool(bench.failures), breached))
+    
+    if args.shift_change:
+        simulator = ShiftChangeSimulator(qa, args.shift_change, args.burst_window, args.max_inflight)
+        failures = simulator.run()
+        simulator.print_report()
+        breached = check_performance(simulator.stats)
+        if args.json_report:
+            simulator.generate_json_report(args.json_report)
+        sink.close()
+        sys.exit(exit_status(failures > 0, breached))
+    
+    if args.rate:
+        targets = [(t if t.startswith('/') else f'/{t}', 'GET', True) for t in args.target or []]
+        request_fn = OpenLoopTester.catalog_requests(targets) if targets else None
+        tester = OpenLoopTester(qa, args.rate, args.duration, request_fn, args.max_inflight)
+        stats = tester.run()
+        tester.print_report()
+        breached = check_performance(stats)
+        if args.json_report:
+            tester.generate_json_report(args.json_report)
+        sink.close()
+        sys.exit(exit_status(stats.errors > 0 or stats.total == 0, breached))
+    
+    if args.soak:
+        soak = SoakTester(qa, args.users, args.ramp_up, args.soak, args.window)
+        stats = soak.run()
+        soak.print_report()
+        breached = check_performance(stats)
+        qa.generate_html_report(include_rows=False)
+        if args.json_report:
+            soak.generate_json_report(args.json_report)
+        sink.close()
+        sys.exit(exit_status(stats.errors > 0 or stats.total == 0 or soak.drift_detected, breached))
+    
+    if args.load:
+        tester = LoadTester(qa, args.users, args.ramp_up, args.duration)
+        stats = tester.run()
+        tester.print_report()
+        breached = check_performance(stats)
+        if args.json_report:
+            tester.generate_json_report(args.json_report)
+        sink.close()
+        sys.exit(exit_status(stats.errors > 0 or stats.total == 0, breached))
+    
     qa.run()
+    breached = check_performance(qa.stats)
+    if args.json_report:
+        qa.generate_json_report(args.json_report)
+    
+    sink.close()
     
-    # Exit with error code if tests failed
-    failed = sum(1 for r in qa.results if r.status == 'fail')
-    sys.exit(1 if failed > 0 else 0)
+    # Exit with error code if tests failed or budgets were breached
+    failed = qa.stats.errors
+    sys.exit(exit_status(failed > 0, breached))
 
 
 if __name__ == '__main__':
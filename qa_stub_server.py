@@ -0,0 +1,922 @@
+#!/usr/bin/env python3
+"""
+SGMS Stub API Server
+====================
+In-memory stand-in for the Spring Boot /api contract exercised by qa_audit.py,
+for developing load modes and measuring harness overhead without a running
+backend and Postgres.
+
+Features:
+- ApiResponse {success, data, message, timestamp} and ErrorResponse envelopes
+- /auth/login issuing signed JWT-shaped tokens with an exp claim, /auth/me
+- CRUD for clients, sites, site posts, guards and assignments
+- Attendance check-in/check-out with the backend's duplicate rules, today-summary
+- Dashboard summaries, guard self-service and site-access lookups with
+  @PreAuthorize-equivalent role checks
+- Frontend shell referencing a content-hashed Vite-like JS/CSS bundle and a service
+  worker, gzip-encoded on request, with Cache-Control, ETag and 304 revalidation
+- Configurable latency, error rate and payload size
+- Measures the harness's maximum request rate on one core (--measure-harness)
+
+Usage:
+    python qa_stub_server.py
+    python qa_stub_server.py --port 18080 --latency 20 --jitter 10 --error-rate 0.01 --pad 2048
+    python qa_audit.py --api-url http://127.0.0.1:18080/api --frontend-url http://127.0.0.1:18080
+    python qa_stub_server.py --measure-harness 10
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import secrets
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, date, timezone
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+# ANSI color codes for terminal output
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+
+
+# Default accounts: email -> (password, role)
+DEFAULT_USERS = {
+    'admin@sgms.com': ('admin123', 'ADMIN'),
+    'supervisor@sgms.com': ('super123', 'SUPERVISOR'),
+    'client@sgms.com': ('client123', 'CLIENT'),
+    'guard@sgms.com': ('guard123', 'GUARD'),
+}
+
+# Frontend routes served as a minimal HTML shell so full qa_audit runs pass
+FRONTEND_ROUTES = ('/', '/portal', '/login/admin', '/login/manager', '/login/client', '/login/guard')
+
+
+def build_frontend_assets() -> Dict[str, Tuple[str, bytes]]:
+    """Vite-build-like shell, content-hashed bundle and service worker: path -> (content type, body)"""
+    rng = random.Random(42)
+    words = ['const', 'return', 'function', 'useState', 'props', 'React', 'createElement', 'className',
+             'onClick', 'guard', 'site', 'shift', 'attendance', 'dashboard', 'await', 'fetch']
+    js = lambda n: '\n'.join(f"function f{i}(a,b){{return {' '.join(rng.choices(words, k=12))};}}"
+                              for i in range(n)).encode()
+    css = '\n'.join(f".c{i}{{margin:{i % 16}px;color:#{rng.randrange(0xffffff):06x}}}" for i in range(800)).encode()
+    bundle = {'index.js': js(1200), 'vendor.js': js(2500), 'index.css': css}
+    # Rollup-style names: name-<8 base64url characters of the content hash>.ext
+    hashed = {}
+    for name, data in bundle.items():
+        stem, ext = name.rsplit('.', 1)
+        digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).decode()[:8]
+        hashed[name] = f"/assets/{stem}-{digest}.{ext}"
+    shell = ('<!doctype html><html><head><title>SGMS</title>'
+             f'<link rel="stylesheet" href="{hashed["index.css"]}">'
+             f'<link rel="modulepreload" href="{hashed["vendor.js"]}">'
+             f'<script type="module" src="{hashed["index.js"]}"></script>'
+             '</head><body><div id="root"></div></body></html>').encode()
+    types = {'js': 'application/javascript', 'css': 'text/css'}
+    assets = {'shell': ('text/html', shell),
+              '/service-worker.js': ('application/javascript', b"self.addEventListener('fetch', () => {});\n")}
+    for name, path in hashed.items():
+        assets[path] = (types[name.rsplit('.', 1)[1]], bundle[name])
+    return assets
+
+
+FRONTEND_ASSETS = build_frontend_assets()
+FRONTEND_ETAGS = {path: f'W/"{hashlib.sha1(data).hexdigest()[:16]}"' for path, (_, data) in FRONTEND_ASSETS.items()}
+FRONTEND_MODIFIED = formatdate(time.time(), usegmt=True)  # Build time: when the stub started
+
+
+class StubError(Exception):
+    """Error rendered as the backend's ErrorResponse"""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+class StubProfile:
+    """Latency, error-rate and payload-size behaviour of the stub"""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 pad_bytes: int = 0):
+        self.latency_ms = max(0.0, latency_ms)
+        self.jitter_ms = max(0.0, jitter_ms)
+        self.error_rate = min(max(0.0, error_rate), 1.0)
+        self.pad_bytes = max(0, pad_bytes)
+        self.padding = 'x' * self.pad_bytes
+
+    def delay(self) -> float:
+        """Seconds to wait before answering (normal around latency, never negative)"""
+        if not self.latency_ms and not self.jitter_ms:
+            return 0.0
+        return max(0.0, random.gauss(self.latency_ms, self.jitter_ms)) / 1000
+
+    def inject_error(self) -> bool:
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+
+class StubStore:
+    """Thread-safe in-memory tables shaped like the backend's response DTOs"""
+
+    RESOURCES = ('clients', 'sites', 'site-posts', 'guards', 'assignments', 'attendance')
+
+    def __init__(self, users: Dict[str, Tuple[str, str]] = None, token_ttl: int = 3600):
+        self.lock = threading.Lock()
+        self.secret = secrets.token_bytes(32)
+        self.token_ttl = token_ttl
+        self.next_id = 1
+        self.tables: Dict[str, Dict[int, dict]] = {name: {} for name in self.RESOURCES}
+        self.users: Dict[str, dict] = {}
+        for email, (password, role) in (users or DEFAULT_USERS).items():
+            self.users[email] = {'id': self._id(), 'email': email, 'password': password, 'role': role,
+                                 'fullName': email.split('@')[0].title(), 'phone': None}
+        # GUARD accounts get a guard profile, which /guards/me and the guard dashboard require
+        for user in self.users.values():
+            if user['role'] == 'GUARD':
+                row = self._guard_row({'email': user['email'], 'employeeCode': f"G-{user['id']:04d}",
+                                       'firstName': user['fullName']}, user['id'])
+                self.tables['guards'][row['id']] = row
+        created = now_iso()
+        self.shift_types = [
+            {'id': 1, 'name': 'DAY', 'startTime': '06:00:00', 'endTime': '18:00:00',
+             'description': 'Day shift', 'createdAt': created},
+            {'id': 2, 'name': 'NIGHT', 'startTime': '18:00:00', 'endTime': '06:00:00',
+             'description': 'Night shift', 'createdAt': created},
+        ]
+
+    def _id(self) -> int:
+        value = self.next_id
+        self.next_id += 1
+        return value
+
+    # Tokens
+
+    @staticmethod
+    def _b64(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+    def issue_token(self, user: dict) -> str:
+        header = self._b64(json.dumps({'alg': 'HS256', 'typ': 'JWT'}).encode())
+        claims = {'sub': user['email'], 'role': user['role'], 'exp': int(time.time()) + self.token_ttl}
+        payload = self._b64(json.dumps(claims).encode())
+        signature = hmac.new(self.secret, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+        return f"{header}.{payload}.{self._b64(signature)}"
+
+    def verify_token(self, token: str) -> Optional[dict]:
+        """User of a valid, unexpired token issued by this process"""
+        try:
+            header, payload, signature = token.split('.')
+            expected = hmac.new(self.secret, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+            if not hmac.compare_digest(self._b64(expected), signature):
+                return None
+            claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        except (ValueError, TypeError):
+            return None
+        if claims.get('exp', 0) < time.time():
+            return None
+        return self.users.get(claims.get('sub'))
+
+    def login(self, email: str, password: str) -> dict:
+        user = self.users.get(email or '')
+        if user is None or user['password'] != password:
+            raise StubError(401, 'Invalid credentials')
+        return {'accessToken': self.issue_token(user), 'tokenType': 'Bearer',
+                'expiresInSeconds': self.token_ttl, 'user': self.user_response(user)}
+
+    @staticmethod
+    def user_response(user: dict) -> dict:
+        return {'id': user['id'], 'email': user['email'], 'phone': user['phone'],
+                'fullName': user['fullName'], 'roles': [user['role']]}
+
+    # Generic table access
+
+    def get(self, table: str, resource_id: int) -> dict:
+        row = self.tables[table].get(resource_id)
+        if row is None:
+            raise StubError(404, f"{table.rstrip('s').replace('-', ' ').title()} not found with id: {resource_id}")
+        return row
+
+    def rows(self, table: str, **filters) -> List[dict]:
+        with self.lock:
+            return [row for row in self.tables[table].values()
+                    if all(row.get(key) == value for key, value in filters.items())]
+
+    def delete(self, table: str, resource_id: int):
+        with self.lock:
+            self.get(table, resource_id)
+            del self.tables[table][resource_id]
+
+    @staticmethod
+    def require(payload: dict, *fields):
+        missing = [field for field in fields if payload.get(field) in (None, '')]
+        if missing:
+            raise StubError(400, 'Validation failed: ' + ', '.join(f"{field}: must not be null" for field in missing))
+
+    # Resource creation (response shapes follow the backend DTOs)
+
+    def create_client(self, payload: dict) -> dict:
+        self.require(payload, 'name')
+        with self.lock:
+            row = {'id': self._id(), 'name': payload['name'], 'status': payload.get('status', 'ACTIVE'),
+                   'createdAt': now_iso(), 'deletedAt': None}
+            self.tables['clients'][row['id']] = row
+        return row
+
+    def create_site(self, payload: dict) -> dict:
+        self.require(payload, 'clientAccountId', 'name')
+        with self.lock:
+            client = self.get('clients', payload['clientAccountId'])
+            created = now_iso()
+            row = {'id': self._id(), 'clientAccountId': client['id'], 'clientAccountName': client['name'],
+                   'name': payload['name'], 'address': payload.get('address'),
+                   'latitude': payload.get('latitude'), 'longitude': payload.get('longitude'),
+                   'status': payload.get('status', 'ACTIVE'), 'createdAt': created, 'updatedAt': created,
+                   'deletedAt': None}
+            self.tables['sites'][row['id']] = row
+        return row
+
+    def create_site_post(self, payload: dict) -> dict:
+        self.require(payload, 'siteId', 'postName')
+        with self.lock:
+            site = self.get('sites', payload['siteId'])
+            created = now_iso()
+            row = {'id': self._id(), 'siteId': site['id'], 'siteName': site['name'],
+                   'postName': payload['postName'], 'description': payload.get('description'),
+                   'requiredGuards': payload.get('requiredGuards', 1), 'status': 'ACTIVE',
+                   'createdAt': created, 'updatedAt': created, 'deletedAt': None}
+            self.tables['site-posts'][row['id']] = row
+        return row
+
+    def create_guard(self, payload: dict) -> dict:
+        self.require(payload, 'email', 'employeeCode')
+        with self.lock:
+            if any(g['email'] == payload['email'] for g in self.tables['guards'].values()):
+                raise StubError(400, f"Email already registered: {payload['email']}")
+            row = self._guard_row(payload, self._id())
+            self.tables['guards'][row['id']] = row
+        return row
+
+    def _guard_row(self, payload: dict, user_id: int) -> dict:
+        return {'id': self._id(), 'userId': user_id, 'email': payload['email'],
+                'supervisorId': None, 'supervisorName': None, 'employeeCode': payload['employeeCode'],
+                'firstName': payload.get('firstName'), 'lastName': payload.get('lastName'),
+                'phone': payload.get('phone'), 'status': 'ACTIVE', 'hireDate': str(date.today()),
+                'baseSalary': payload.get('baseSalary'), 'perDayRate': payload.get('perDayRate'),
+                'overtimeRate': payload.get('overtimeRate')}
+
+    def guard_of(self, user: dict) -> dict:
+        guard = next((g for g in self.tables['guards'].values() if g['userId'] == user['id']), None)
+        if guard is None:
+            raise StubError(404, 'Guard profile not found')
+        return guard
+
+    def _active_assignment(self, guard_id: int) -> Optional[dict]:
+        return next((a for a in self.tables['assignments'].values()
+                     if a['guardId'] == guard_id and a['status'] == 'ACTIVE'), None)
+
+    def guard_details(self, user: dict) -> dict:
+        with self.lock:
+            return self._guard_detail(self.guard_of(user), user['fullName'])
+
+    def detailed_guards(self) -> List[dict]:
+        with self.lock:
+            return [self._guard_detail(guard, f"{guard['firstName'] or ''} {guard['lastName'] or ''}".strip())
+                    for guard in self.tables['guards'].values()]
+
+    def _guard_detail(self, guard: dict, full_name: str) -> dict:
+        assignment = self._active_assignment(guard['id']) or {}
+        return {'id': guard['id'], 'userId': guard['userId'], 'fullName': full_name,
+                'email': guard['email'], 'phone': guard['phone'], 'employeeCode': guard['employeeCode'],
+                'firstName': guard['firstName'], 'lastName': guard['lastName'],
+                'active': guard['status'] == 'ACTIVE', 'status': guard['status'], 'hireDate': guard['hireDate'],
+                'supervisorId': guard['supervisorId'], 'supervisorName': guard['supervisorName'],
+                'baseSalary': guard['baseSalary'], 'perDayRate': guard['perDayRate'],
+                'overtimeRate': guard['overtimeRate'], 'assignmentId': assignment.get('id'),
+                'sitePostId': assignment.get('sitePostId'), 'currentPost': assignment.get('sitePostName'),
+                'siteId': assignment.get('siteId'), 'currentSite': assignment.get('siteName'),
+                'clientId': assignment.get('clientId'), 'clientName': assignment.get('clientName'),
+                'shiftTypeId': assignment.get('shiftTypeId'), 'shiftType': assignment.get('shiftTypeName'),
+                'assignmentEffectiveFrom': assignment.get('effectiveFrom'),
+                'assignmentEffectiveTo': assignment.get('effectiveTo'),
+                'assignmentStatus': assignment.get('status'), 'licenseNumber': None}
+
+    def create_assignment(self, payload: dict, user: dict) -> dict:
+        self.require(payload, 'guardId', 'sitePostId', 'shiftTypeId', 'effectiveFrom')
+        with self.lock:
+            guard = self.get('guards', payload['guardId'])
+            post = self.get('site-posts', payload['sitePostId'])
+            site = self.get('sites', post['siteId'])
+            shift = next((s for s in self.shift_types if s['id'] == payload['shiftTypeId']), None)
+            if shift is None:
+                raise StubError(400, f"Shift type not found with id: {payload['shiftTypeId']}")
+            created = now_iso()
+            row = {'id': self._id(), 'guardId': guard['id'], 'guardEmployeeCode': guard['employeeCode'],
+                   'guardName': f"{guard['firstName'] or ''} {guard['lastName'] or ''}".strip(),
+                   'sitePostId': post['id'], 'sitePostName': post['postName'], 'siteId': site['id'],
+                   'siteName': site['name'], 'clientId': site['clientAccountId'],
+                   'clientName': site['clientAccountName'], 'shiftTypeId': shift['id'],
+                   'shiftTypeName': shift['name'], 'shiftStartTime': shift['startTime'],
+                   'shiftEndTime': shift['endTime'], 'effectiveFrom': payload['effectiveFrom'],
+                   'effectiveTo': payload.get('effectiveTo'), 'status': 'ACTIVE', 'notes': payload.get('notes'),
+                   'createdAt': created, 'updatedAt': created, 'createdByUserId': user['id'],
+                   'createdByEmail': user['email']}
+            self.tables['assignments'][row['id']] = row
+        return row
+
+    def cancel_assignment(self, resource_id: int):
+        with self.lock:
+            self.get('assignments', resource_id)['status'] = 'CANCELLED'
+
+    # Attendance
+
+    def _today_attendance(self, guard_id: int) -> Optional[dict]:
+        today = str(date.today())
+        return next((a for a in self.tables['attendance'].values()
+                     if a['guardId'] == guard_id and a['attendanceDate'] == today), None)
+
+    def check_in(self, payload: dict) -> dict:
+        self.require(payload, 'guardId')
+        with self.lock:
+            guard = self.tables['guards'].get(payload['guardId'])
+            if guard is None or guard['status'] != 'ACTIVE':
+                raise StubError(400, f"Guard not found or inactive with id: {payload['guardId']}")
+            assignment = self._active_assignment(guard['id'])
+            if assignment is None:
+                raise StubError(400, 'No active assignment found for guard today. Cannot check in.')
+            if self._today_attendance(guard['id']) is not None:
+                raise StubError(409, 'Attendance already recorded for today. Cannot check in again.')
+            created = now_iso()
+            row = {'attendanceId': self._id(), 'attendanceDate': str(date.today()), 'checkInTime': created,
+                   'checkOutTime': None, 'status': 'PRESENT', 'lateMinutes': 0, 'earlyLeaveMinutes': 0,
+                   'notes': None, 'guardId': guard['id'], 'guardFirstName': guard['firstName'],
+                   'guardLastName': guard['lastName'], 'guardFullName': assignment['guardName'],
+                   'employeeCode': guard['employeeCode'], 'assignmentId': assignment['id'],
+                   'sitePostId': assignment['sitePostId'], 'postName': assignment['sitePostName'],
+                   'siteId': assignment['siteId'], 'siteName': assignment['siteName'],
+                   'clientId': assignment['clientId'], 'clientName': assignment['clientName'],
+                   'shiftName': assignment['shiftTypeName'], 'shiftStart': assignment['shiftStartTime'][:5],
+                   'shiftEnd': assignment['shiftEndTime'][:5], 'createdAt': created, 'updatedAt': created}
+            self.tables['attendance'][row['attendanceId']] = row
+        return row
+
+    def check_out(self, payload: dict) -> dict:
+        self.require(payload, 'guardId')
+        with self.lock:
+            if payload['guardId'] not in self.tables['guards']:
+                raise StubError(404, f"Guard not found with id: {payload['guardId']}")
+            row = self._today_attendance(payload['guardId'])
+            if row is None:
+                raise StubError(400, 'No check-in record found for today. Please check in first.')
+            if row['checkOutTime'] is not None:
+                raise StubError(409, 'Already checked out today. Cannot check out again.')
+            row['checkOutTime'] = row['updatedAt'] = now_iso()
+        return row
+
+    # Dashboards
+
+    def admin_summary(self) -> dict:
+        with self.lock:
+            guards = list(self.tables['guards'].values())
+            return {'totalGuards': len(guards),
+                    'activeGuards': sum(1 for g in guards if g['status'] == 'ACTIVE'),
+                    'totalSites': len(self.tables['sites']),
+                    'activeAssignments': sum(1 for a in self.tables['assignments'].values() if a['status'] == 'ACTIVE'),
+                    'todayAttendance': sum(1 for a in self.tables['attendance'].values()
+                                           if a['attendanceDate'] == str(date.today()))}
+
+    def manager_summary(self) -> dict:
+        with self.lock:
+            today = [a for a in self.tables['attendance'].values() if a['attendanceDate'] == str(date.today())]
+            return {'guardsOnDuty': sum(1 for a in today if a['checkOutTime'] is None),
+                    'sitesManaged': len(self.tables['sites']),
+                    'lateToday': sum(1 for a in today if a['status'] == 'LATE'),
+                    'absentToday': 0}
+
+    def guard_summary(self, user: dict) -> dict:
+        with self.lock:
+            guard = self.guard_of(user)
+            assignment = self._active_assignment(guard['id']) or {}
+            attendance = self._today_attendance(guard['id']) or {}
+            # LocalTime of the ISO instants, as the backend reports them
+            check_in, check_out = attendance.get('checkInTime'), attendance.get('checkOutTime')
+            return {'todayShift': assignment.get('shiftTypeName'), 'siteName': assignment.get('siteName'),
+                    'postName': assignment.get('sitePostName'),
+                    'checkInTime': check_in[11:19] if check_in else None,
+                    'checkOutTime': check_out[11:19] if check_out else None,
+                    'status': attendance.get('status', 'NOT_CHECKED_IN')}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Routes /api requests to the store; role rules mirror the controllers' @PreAuthorize"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    ADMIN = ('ADMIN',)
+    STAFF = ('ADMIN', 'SUPERVISOR')
+    ATTENDANCE = ('ADMIN', 'SUPERVISOR', 'GUARD')
+
+    # (method, path regex, allowed roles or None for public, handler name)
+    ROUTES = [
+        ('POST', r'/auth/login', None, 'login'),
+        ('GET', r'/auth/me', (), 'me'),
+        ('POST', r'/clients', ADMIN, 'create_client'),
+        ('GET', r'/clients', ADMIN, 'list_clients'),
+        ('GET', r'/clients/(\d+)', ADMIN, 'get_client'),
+        ('DELETE', r'/clients/(\d+)', ADMIN, 'delete_client'),
+        ('POST', r'/sites', ADMIN, 'create_site'),
+        ('GET', r'/sites', ADMIN, 'list_sites'),
+        ('GET', r'/sites/(\d+)', ADMIN, 'get_site'),
+        ('DELETE', r'/sites/(\d+)', ADMIN, 'delete_site'),
+        ('POST', r'/site-posts', STAFF, 'create_site_post'),
+        ('GET', r'/site-posts', STAFF, 'list_site_posts'),
+        ('GET', r'/site-posts/(\d+)', STAFF, 'get_site_post'),
+        ('GET', r'/site-posts/site/(\d+)', STAFF, 'site_posts_by_site'),
+        ('DELETE', r'/site-posts/(\d+)', ADMIN, 'delete_site_post'),
+        ('POST', r'/guards', ADMIN, 'create_guard'),
+        ('GET', r'/guards', STAFF, 'list_guards'),
+        ('GET', r'/guards/detailed', STAFF, 'detailed_guards'),
+        ('GET', r'/guards/me', ('GUARD',), 'current_guard'),
+        ('GET', r'/guards/(\d+)', STAFF, 'get_guard'),
+        ('DELETE', r'/guards/(\d+)', ADMIN, 'delete_guard'),
+        ('POST', r'/assignments', STAFF, 'create_assignment'),
+        ('GET', r'/assignments', STAFF, 'list_assignments'),
+        ('GET', r'/assignments/shift-types', STAFF, 'shift_types'),
+        ('GET', r'/assignments/(\d+)', STAFF, 'get_assignment'),
+        ('GET', r'/assignments/guard/(\d+)', STAFF, 'assignments_by_guard'),
+        ('GET', r'/assignments/site-post/(\d+)', STAFF, 'assignments_by_site_post'),
+        ('DELETE', r'/assignments/(\d+)', STAFF, 'cancel_assignment'),
+        ('POST', r'/attendance/check-in', ATTENDANCE, 'check_in'),
+        ('POST', r'/attendance/check-out', ATTENDANCE, 'check_out'),
+        ('GET', r'/attendance/today-summary', STAFF, 'today_summary'),
+        ('GET', r'/attendance/guard/(\d+)', STAFF, 'attendance_by_guard'),
+        ('GET', r'/attendance/site/(\d+)', STAFF, 'attendance_by_site'),
+        ('GET', r'/attendance/(\d+)', STAFF, 'get_attendance'),
+        ('GET', r'/dashboard/admin-summary', ADMIN, 'admin_summary'),
+        ('GET', r'/dashboard/manager-summary', ('SUPERVISOR',), 'manager_summary'),
+        ('GET', r'/dashboard/guard-summary', ('GUARD',), 'guard_summary'),
+        ('GET', r'/client/sites/(\d+)', ('ADMIN', 'CLIENT'), 'client_sites'),
+        ('GET', r'/client/site/(\d+)/clients', ADMIN, 'site_clients'),
+        ('GET', r'/supervisor/sites/(\d+)', STAFF, 'supervisor_sites'),
+        ('GET', r'/supervisor/site/(\d+)/supervisors', ADMIN, 'site_supervisors'),
+    ]
+    COMPILED = [(method, re.compile(f"^/api{pattern}$"), roles, name) for method, pattern, roles, name in ROUTES]
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def do_DELETE(self):
+        self.dispatch('DELETE')
+
+    def send_json(self, status: int, body: Optional[dict]):
+        data = json.dumps(body, separators=(',', ':')).encode() if body is not None else b''
+        self.send_response(status)
+        if body is not None:
+            self.send_header('Content-Type', 'application/json')
+        # Spring Security's default cache headers for every API response
+        self.send_header('Cache-Control', 'no-cache, no-store, max-age=0, must-revalidate')
+        self.send_header('Pragma', 'no-cache')
+        self.send_header('Expires', '0')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def ok(self, data, message: str = None, status: int = 200):
+        # Padding rides in the envelope message so DTOs keep the backend's shape
+        padding = self.server.profile.padding
+        self.send_json(status, {'success': True, 'data': data,
+                                'message': f"{message or ''}{padding}" or None, 'timestamp': now_iso()})
+
+    def error(self, status: int, message: str):
+        self.send_json(status, {'success': False, 'message': message, 'timestamp': now_iso(),
+                                'path': urlsplit(self.path).path})
+
+    def dispatch(self, method: str):
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        self.query = parse_qs(url.query)
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+
+        route_name = 'not_found'
+        try:
+            if not url.path.startswith('/api'):
+                route_name = 'frontend'
+                return self.frontend(method, url.path)
+
+            match = None
+            for route_method, pattern, roles, name in self.COMPILED:
+                if route_method == method:
+                    match = pattern.match(url.path)
+                    if match:
+                        route_name = name
+                        break
+            if not match:
+                raise StubError(404, f"No endpoint {method} {url.path}")
+
+            delay = self.server.profile.delay()
+            if delay:
+                time.sleep(delay)
+            if self.server.profile.inject_error():
+                raise StubError(500, 'Injected stub failure')
+
+            user = None
+            if roles is not None:
+                auth = self.headers.get('Authorization', '')
+                user = self.server.store.verify_token(auth[7:]) if auth.startswith('Bearer ') else None
+                if user is None:
+                    raise StubError(401, 'Unauthorized')
+                if roles and user['role'] not in roles:
+                    raise StubError(403, 'You do not have permission to access this resource')
+            try:
+                payload = json.loads(raw) if raw else {}
+            except ValueError:
+                raise StubError(400, 'Malformed JSON request body')
+            getattr(self, name)(*[int(group) for group in match.groups()], payload=payload, user=user)
+        except StubError as e:
+            self.error(e.status, e.message)
+        finally:
+            self.server.count(route_name, time.perf_counter() - started)
+
+    def frontend(self, method: str, path: str):
+        if method != 'GET':
+            raise StubError(404, f"No route {path}")
+        if path in FRONTEND_ASSETS:
+            key = path
+        elif path.rstrip('/') in [route.rstrip('/') for route in FRONTEND_ROUTES]:
+            key = 'shell'
+        else:
+            raise StubError(404, f"No route {path}")
+        content_type, data = FRONTEND_ASSETS[key]
+        # Hashed assets never change under their URL; the shell and service worker must revalidate
+        cache_control = 'public, max-age=31536000, immutable' if path.startswith('/assets/') else 'no-cache'
+        etag = FRONTEND_ETAGS[key]
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # Weak comparison (RFC 9110): W/ prefixes are ignored
+            opaque = etag[2:] if etag.startswith('W/') else etag
+            not_modified = any(tag.strip() in (etag, opaque, '*') or tag.strip()[2:] == opaque
+                               for tag in if_none_match.split(','))
+        else:
+            not_modified = self.headers.get('If-Modified-Since') == FRONTEND_MODIFIED
+        if not_modified:
+            self.send_response(304)
+            self.send_header('Cache-Control', cache_control)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        encoding = 'gzip' if 'gzip' in self.headers.get('Accept-Encoding', '') else None
+        if encoding:
+            data = gzip.compress(data, 6, mtime=0)
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', FRONTEND_MODIFIED)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # Route handlers
+
+    def login(self, payload, user):
+        self.ok(self.server.store.login(payload.get('email'), payload.get('password')))
+
+    def me(self, payload, user):
+        self.ok(StubStore.user_response(user))
+
+    def create_client(self, payload, user):
+        self.ok(self.server.store.create_client(payload), 'Client account created successfully', 201)
+
+    def list_clients(self, payload, user):
+        self.ok(self.server.store.rows('clients'))
+
+    def get_client(self, resource_id, payload, user):
+        self.ok(self.server.store.get('clients', resource_id))
+
+    def delete_client(self, resource_id, payload, user):
+        self.server.store.delete('clients', resource_id)
+        self.ok(None, 'Client account deleted successfully')
+
+    def create_site(self, payload, user):
+        self.ok(self.server.store.create_site(payload), 'Site created successfully', 201)
+
+    def list_sites(self, payload, user):
+        client_id = self.query.get('clientId', [None])[0]
+        filters = {'clientAccountId': int(client_id)} if client_id else {}
+        self.ok(self.server.store.rows('sites', **filters))
+
+    def get_site(self, resource_id, payload, user):
+        self.ok(self.server.store.get('sites', resource_id))
+
+    def delete_site(self, resource_id, payload, user):
+        self.server.store.delete('sites', resource_id)
+        self.ok(None, 'Site deleted successfully')
+
+    def create_site_post(self, payload, user):
+        self.ok(self.server.store.create_site_post(payload), 'Site post created successfully', 201)
+
+    def list_site_posts(self, payload, user):
+        self.ok(self.server.store.rows('site-posts'))
+
+    def get_site_post(self, resource_id, payload, user):
+        self.ok(self.server.store.get('site-posts', resource_id))
+
+    def site_posts_by_site(self, site_id, payload, user):
+        self.ok(self.server.store.rows('site-posts', siteId=site_id))
+
+    def delete_site_post(self, resource_id, payload, user):
+        self.server.store.delete('site-posts', resource_id)
+        self.ok(None, 'Site post deleted successfully')
+
+    def create_guard(self, payload, user):
+        self.ok(self.server.store.create_guard(payload), 'Guard created successfully', 201)
+
+    def list_guards(self, payload, user):
+        self.ok(self.server.store.rows('guards'))
+
+    def detailed_guards(self, payload, user):
+        self.ok(self.server.store.detailed_guards())
+
+    def current_guard(self, payload, user):
+        self.ok(self.server.store.guard_details(user))
+
+    def get_guard(self, resource_id, payload, user):
+        self.ok(self.server.store.get('guards', resource_id))
+
+    def delete_guard(self, resource_id, payload, user):
+        self.server.store.delete('guards', resource_id)
+        self.ok(None, 'Guard deleted successfully')
+
+    def create_assignment(self, payload, user):
+        self.ok(self.server.store.create_assignment(payload, user), 'Assignment created successfully', 201)
+
+    def list_assignments(self, payload, user):
+        self.ok(self.server.store.rows('assignments'))
+
+    def shift_types(self, payload, user):
+        self.ok(self.server.store.shift_types)
+
+    def get_assignment(self, resource_id, payload, user):
+        self.ok(self.server.store.get('assignments', resource_id))
+
+    def assignments_by_guard(self, guard_id, payload, user):
+        self.ok(self.server.store.rows('assignments', guardId=guard_id))
+
+    def assignments_by_site_post(self, site_post_id, payload, user):
+        self.ok(self.server.store.rows('assignments', sitePostId=site_post_id))
+
+    def cancel_assignment(self, resource_id, payload, user):
+        self.server.store.cancel_assignment(resource_id)
+        self.send_json(204, None)
+
+    def check_in(self, payload, user):
+        self.ok(self.server.store.check_in(payload), 'Check-in successful', 201)
+
+    def check_out(self, payload, user):
+        self.ok(self.server.store.check_out(payload), 'Check-out successful')
+
+    def today_summary(self, payload, user):
+        self.ok(self.server.store.rows('attendance', attendanceDate=str(date.today())))
+
+    def attendance_by_guard(self, guard_id, payload, user):
+        self.ok(self.server.store.rows('attendance', guardId=guard_id))
+
+    def attendance_by_site(self, site_id, payload, user):
+        day = self.query.get('date', [str(date.today())])[0]
+        self.ok(self.server.store.rows('attendance', siteId=site_id, attendanceDate=day))
+
+    def get_attendance(self, resource_id, payload, user):
+        self.ok(self.server.store.get('attendance', resource_id))
+
+    def admin_summary(self, payload, user):
+        self.ok(self.server.store.admin_summary())
+
+    def manager_summary(self, payload, user):
+        self.ok(self.server.store.manager_summary())
+
+    def guard_summary(self, payload, user):
+        self.ok(self.server.store.guard_summary(user))
+
+    # The stub grants no site access, so these mappings are always empty
+
+    def client_sites(self, client_user_id, payload, user):
+        self.ok([])
+
+    def site_clients(self, site_id, payload, user):
+        self.ok([])
+
+    def supervisor_sites(self, supervisor_user_id, payload, user):
+        self.ok([])
+
+    def site_supervisors(self, site_id, payload, user):
+        self.ok([])
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the store, profile and per-route counters"""
+
+    daemon_threads = True
+
+    def __init__(self, address, store: StubStore, profile: StubProfile, verbose: bool = False):
+        super().__init__(address, StubHandler)
+        self.store = store
+        self.profile = profile
+        self.verbose = verbose
+        self.stats_lock = threading.Lock()
+        self.route_counts: Dict[str, int] = {}
+        self.route_time: Dict[str, float] = {}
+        self.started = time.time()
+
+    def count(self, route: str, elapsed: float):
+        with self.stats_lock:
+            self.route_counts[route] = self.route_counts.get(route, 0) + 1
+            self.route_time[route] = self.route_time.get(route, 0.0) + elapsed
+
+    def print_stats(self):
+        """Print requests served per route"""
+        total = sum(self.route_counts.values())
+        uptime = time.time() - self.started
+        print(f"\n{Colors.BOLD}Served {total} requests in {uptime:.1f}s "
+              f"({total / uptime if uptime else 0:.1f} req/s){Colors.RESET}")
+        for route in sorted(self.route_counts, key=lambda r: -self.route_counts[r]):
+            count = self.route_counts[route]
+            print(f"  {route:<24} {count:>8}  avg {self.route_time[route] / count * 1000:.2f}ms")
+
+
+def wait_for_port(host: str, port: int, timeout: float = 10.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def measure_harness(seconds: float, port: int):
+    """Measure how many requests per second the harness itself can drive from one core
+
+    A zero-latency stub runs in a child process (pinned to another core when
+    there is one) while this process, pinned to a single core, loops for
+    `seconds` per stage over: a bare requests.Session GET, test_endpoint, and
+    test_endpoint plus the NDJSON result sink. CPU time per request of this
+    process gives the one-core ceiling of each stage independently of the
+    stub's own speed.
+    """
+    import tempfile
+    sys.path.insert(0, str(Path(__file__).parent))
+    import requests
+    from qa_audit import SGMSQASystem, ResultSink
+
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+    server = subprocess.Popen([sys.executable, __file__, '--port', str(port), '--quiet'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if len(cpus) > 1:
+            os.sched_setaffinity(server.pid, cpus[1:])
+            os.sched_setaffinity(0, cpus[:1])
+        if not wait_for_port('127.0.0.1', port):
+            print(f"{Colors.RED}✗ Stub server did not start on port {port}{Colors.RESET}")
+            return
+
+        api = f"http://127.0.0.1:{port}/api"
+        qa = SGMSQASystem(api, f"http://127.0.0.1:{port}", verbose=False)
+        if not qa.login_admin():
+            print(f"{Colors.RED}✗ Could not log in to the stub server{Colors.RESET}")
+            return
+        sink_dir = tempfile.mkdtemp(prefix='qa_stub_')
+        sink = ResultSink(os.path.join(sink_dir, 'results.ndjson'))
+        session = requests.Session()
+        headers = {'Authorization': f'Bearer {qa.token}'}
+        endpoints = [endpoint for endpoint, _, _ in SGMSQASystem.READ_ENDPOINTS]
+
+        stages = [
+            ('requests.Session.get', lambda e: session.get(f"{api}{e}", headers=headers, timeout=10).content),
+            ('test_endpoint', qa.test_endpoint),
+            ('test_endpoint + result sink', lambda e: sink.write(qa.test_endpoint(e))),
+        ]
+
+        print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}")
+        print(f"{Colors.BOLD}{Colors.BLUE}HARNESS THROUGHPUT - ONE CORE{Colors.RESET}")
+        print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}\n")
+        if len(cpus) < 2:
+            print(f"{Colors.YELLOW}⚠ Only one CPU available - stub and harness share it; "
+                  f"wall-clock rates include stub time, CPU/request does not{Colors.RESET}\n")
+        print(f"{'Stage':<30} {'Requests':>9} {'Wall req/s':>11} {'CPU µs/req':>11} {'1-core max':>11}")
+
+        baseline_cpu = None
+        for label, call in stages:
+            for endpoint in endpoints:
+                call(endpoint)  # warm up connections and code paths
+            count = 0
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            deadline = wall_start + seconds
+            while time.perf_counter() < deadline:
+                call(endpoints[count % len(endpoints)])
+                count += 1
+            wall = time.perf_counter() - wall_start
+            cpu_per_request = (time.process_time() - cpu_start) / count if count else 0.0
+            ceiling = 1 / cpu_per_request if cpu_per_request else 0.0
+            overhead = '' if baseline_cpu is None else f"  (+{(cpu_per_request - baseline_cpu) * 1e6:.0f}µs)"
+            baseline_cpu = baseline_cpu if baseline_cpu is not None else cpu_per_request
+            print(f"{label:<30} {count:>9} {count / wall:>11.0f} {cpu_per_request * 1e6:>11.0f} "
+                  f"{ceiling:>8.0f}/s{overhead}")
+        sink.close()
+        print(f"\nLoad above the '1-core max' of the stage a mode uses needs more client processes "
+              f"or cores, or the harness - not the server - is what gets measured.")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def parse_user(text: str) -> Tuple[str, Tuple[str, str]]:
+    try:
+        email, password, role = text.split(':')
+    except ValueError:
+        raise argparse.ArgumentTypeError('expected EMAIL:PASSWORD:ROLE')
+    return email, (password, role.upper())
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='SGMS Stub API Server')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=18080, help='Port (default: 18080)')
+    parser.add_argument('--latency', type=float, default=0.0,
+                       help='Mean added latency per API request in ms (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                       help='Standard deviation of the added latency in ms (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                       help='Fraction of API requests answered with HTTP 500 (default: 0)')
+    parser.add_argument('--pad', type=int, default=0,
+                       help='Extra bytes added to every successful API response (default: 0)')
+    parser.add_argument('--token-ttl', type=int, default=3600,
+                       help='Lifetime of issued tokens in seconds (default: 3600)')
+    parser.add_argument('--user', type=parse_user, action='append', metavar='EMAIL:PASSWORD:ROLE',
+                       help='Account to accept instead of the defaults (repeatable)')
+    parser.add_argument('--quiet', action='store_true', help='Do not print banner or statistics')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    parser.add_argument('--measure-harness', type=float, metavar='SECONDS', nargs='?', const=5.0,
+                       help="Measure qa_audit.py's own max request rate on one core (default: 5s per stage)")
+
+    args = parser.parse_args()
+
+    if args.measure_harness:
+        measure_harness(args.measure_harness, args.port)
+        return
+
+    store = StubStore(dict(args.user) if args.user else None, args.token_ttl)
+    profile = StubProfile(args.latency, args.jitter, args.error_rate, args.pad)
+    server = StubServer((args.host, args.port), store, profile, verbose=args.verbose)
+
+    if not args.quiet:
+        print(f"{Colors.GREEN}✓ SGMS stub API listening on http://{args.host}:{args.port}/api{Colors.RESET}")
+        print(f"  Latency {profile.latency_ms:g}±{profile.jitter_ms:g}ms, error rate {profile.error_rate:.1%}, "
+              f"padding {profile.pad_bytes}B")
+        for email, user in store.users.items():
+            print(f"  {user['role']:<11} {email} / {user['password']}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if not args.quiet:
+            server.print_stats()
+
+
+if __name__ == '__main__':
+    main()
@@ -4,19 +4,564 @@ SGMS Project Auditor
 =====================
 Comprehensive system auditor to identify missing components, errors, and required actions.
 
-Usage: python sgms_auditor.py
+Checks run concurrently: each declares a resource class (CPU-heavy build, I/O,
+network/DB) and the checks it depends on, and a bounded pool schedules them.
+The report keeps the declared check order regardless of completion order.
+
+The Maven and npm build checks are skipped when a content hash of their input
+files matches the previous audit, reusing the cached verdict
+(.sgms_audit_cache.json; --no-cache rebuilds).
+
+The static checks share one walk of the project (SourceIndex) that skips build
+output and reads each file at most once.
+
+The controllers' route table (method, path, path variables, @PreAuthorize
+roles, returned DTO) is persisted to .sgms_routes.json and refreshed by file
+mtime; --routes prints it.
+
+Usage: python sgms_auditor.py [--jobs N] [--no-cache] [--routes]
 """
 
 import os
 import json
+import hashlib
+import multiprocessing
+import shutil
 import subprocess
 import re
+import sys
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from fnmatch import fnmatch
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class AuditCheck:
+    """One auditor check: the method it runs, its resource class and the checks it must follow"""
+    
+    def __init__(self, name: str, method: str, resource: str, requires: Tuple[str, ...] = ()):
+        self.name = name
+        self.method = method
+        self.resource = resource  # "cpu", "io" or "network"
+        self.requires = tuple(requires)
+        self.status = "pending"  # pending, running, done, failed, skipped
+        self.cached = False  # Verdict reused from the build cache
+        self.started: Optional[float] = None  # Seconds after the audit started
+        self.seconds: Optional[float] = None
+        self.issues: List[Tuple[str, dict]] = []  # (level, issue) logged while the check ran
+
+
+class SourceFile:
+    """One indexed file: size and mtime from the walk, content read on first use"""
+    
+    _lock = threading.Lock()
+    
+    def __init__(self, path: Path, size: int, mtime: float):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.reads = 0
+        self._text: Optional[str] = None
+    
+    @property
+    def name(self) -> str:
+        return self.path.name
+    
+    @property
+    def loaded(self) -> bool:
+        return self._text is not None
+    
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self.load(self.path.read_text(encoding="utf-8", errors="replace"))
+        return self._text
+    
+    def load(self, text: str):
+        """Keep content read elsewhere (e.g. by a pool worker), counting it as one read"""
+        with self._lock:
+            self.reads += 1
+            if self._text is None:
+                self._text = text
+
+
+def _findall_in_file(job: Tuple[str, str]) -> Tuple[str, str, List[str]]:
+    """Process-pool worker: (path, regex) -> (path, content, matches)"""
+    path, regex = job
+    text = Path(path).read_text(encoding="utf-8", errors="replace")
+    return path, text, re.findall(regex, text)
+
+
+class SourceIndex:
+    """One filesystem walk of the project shared by all static checks
+    
+    Records every file's path, size and mtime, skipping VCS metadata,
+    dependencies and build output (target/, node_modules/, dist/, ...).
+    Content is loaded lazily and kept, so each file is read at most once no
+    matter how many checks look at it; reads are counted per file. Regex
+    scans over more than PARALLEL_FILES files run on a process pool.
+    """
+    
+    IGNORED_DIRS = {".git", "node_modules", "target", "dist", "build", "out", "coverage",
+                    "__pycache__", ".idea", ".vscode", ".gradle", ".pytest_cache"}
+    PARALLEL_FILES = 500
+    
+    def __init__(self, root: Path):
+        self.root = root
+        self.files: Dict[Path, SourceFile] = {}
+        self.dirs = set()
+        start = time.perf_counter()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(name for name in dirnames if name not in self.IGNORED_DIRS)
+            directory = Path(dirpath)
+            self.dirs.add(directory)
+            for name in sorted(filenames):
+                path = directory / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                self.files[path] = SourceFile(path, stat.st_size, stat.st_mtime)
+        self.walk_seconds = time.perf_counter() - start
+    
+    def exists(self, path: Path) -> bool:
+        return path in self.files or path in self.dirs
+    
+    def is_dir(self, path: Path) -> bool:
+        return path in self.dirs
+    
+    def query(self, under: Path = None, name: str = "*") -> List[SourceFile]:
+        """Indexed files below `under` whose name matches the glob `name`, in path order"""
+        return [file for path, file in self.files.items()
+                if (under is None or under in path.parents) and fnmatch(file.name, name)]
+    
+    def findall(self, regex: str, files: List[SourceFile]) -> Dict[Path, List[str]]:
+        """re.findall over each file's content"""
+        results = {file.path: re.findall(regex, file.text) for file in files if file.loaded}
+        unread = [file for file in files if not file.loaded]
+        if len(files) > self.PARALLEL_FILES:
+            # Workers read the files and send their content back, so later checks
+            # reuse it. Spawned, not forked: this runs on CheckScheduler threads
+            by_path = {str(file.path): file for file in unread}
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+                jobs = [(path, regex) for path in by_path]
+                for path, text, matches in pool.map(_findall_in_file, jobs, chunksize=64):
+                    by_path[path].load(text)
+                    results[Path(path)] = matches
+        else:
+            results.update({file.path: re.findall(regex, file.text) for file in unread})
+        return results
+    
+    def stats(self) -> dict:
+        read = [file for file in self.files.values() if file.reads]
+        return {
+            "files": len(self.files),
+            "bytes": sum(file.size for file in self.files.values()),
+            "walk_seconds": self.walk_seconds,
+            "files_read": len(read),
+            "reads": {file.path.relative_to(self.root).as_posix(): file.reads for file in read},
+        }
+
+
+class RouteIndex:
+    """Route table of the Spring controllers, persisted and refreshed by file mtime
+    
+    Every @GetMapping/@PostMapping/@PutMapping/@DeleteMapping/@PatchMapping (or
+    method-level @RequestMapping) is combined with its class-level
+    @RequestMapping prefix and recorded with its path variables, query
+    parameters, request body, @PreAuthorize roles and returned DTO. Routes are
+    stored per source file together with the file's mtime and size; update()
+    re-parses only files that changed, so refreshing is a stat per file and
+    other tools can load the JSON without touching the sources.
+    """
+    
+    DEFAULT_PATH = Path(__file__).parent / ".sgms_routes.json"
+    SOURCE_DIR = Path("backend/src/main/java/com/sgms")  # Controllers, relative to the project root
+    VERSION = 2  # Bumped when parsing changes, so persisted tables are rebuilt
+    
+    STRING = r'"(?:\\.|[^"\\])*"'
+    CODE_TOKENS = re.compile(rf'{STRING}|/\*.*?\*/|//[^\n]*', re.S)
+    MAPPING = re.compile(rf'@(Get|Post|Put|Delete|Patch|Request)Mapping\b(\s*\((?:[^()"]|{STRING})*\))?')
+    CLASS = re.compile(r'\b(?:class|interface)\s+(\w+)')
+    SIGNATURE = re.compile(r'(?:public|protected|private)\s+(?:(?:static|final|synchronized)\s+)*'
+                           r'([\w.?<>\[\], ]+?)\s+(\w+)\s*\(')
+    PRE_AUTHORIZE = re.compile(rf'@PreAuthorize\s*\(\s*(?:value\s*=\s*)?({STRING})\s*\)')
+    ROLE_CHECK = re.compile(r"has(?:Any)?(?:Role|Authority)\s*\(([^)]*)\)")
+    PARAMETER = re.compile(r'@(PathVariable|RequestParam|RequestBody)\b(\s*\([^)]*\))?\s+'
+                           r'(?:@\w+(?:\([^)]*\))?\s+|final\s+)*([\w.?<>\[\], ]+?)\s+(\w+)\s*(?:,|$)')
+    WRAPPERS = ("ApiResponse", "ResponseEntity")
+    
+    def __init__(self, root: Path, path: Path = None, files: Dict[str, dict] = None):
+        self.root = root
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.files = files or {}  # relative path -> {"mtime", "size", "routes"}
+    
+    @classmethod
+    def load(cls, root: Path, path: Path = None) -> "RouteIndex":
+        """Persisted route table, or an empty one if missing, unreadable or outdated"""
+        path = Path(path) if path else cls.DEFAULT_PATH
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        files = data.get("files") if data.get("version") == cls.VERSION else None
+        return cls(root, path, files)
+    
+    @property
+    def routes(self) -> List[dict]:
+        """All routes ordered by path, then method"""
+        routes = [route for entry in self.files.values() for route in entry["routes"]]
+        return sorted(routes, key=lambda route: (route["path"], route["method"]))
+    
+    def update(self, index: SourceIndex, source_root: Path) -> Tuple[int, int]:
+        """Re-parse new or changed Java files under source_root; returns (parsed, unchanged)"""
+        files = {}
+        parsed = 0
+        for file in index.query(source_root, "*.java"):
+            relative = file.path.relative_to(self.root).as_posix()
+            known = self.files.get(relative)
+            if known and known["mtime"] == file.mtime and known["size"] == file.size:
+                files[relative] = known
+                continue
+            routes = self.parse(file.text)
+            for route in routes:
+                route["file"] = relative
+            files[relative] = {"mtime": file.mtime, "size": file.size, "routes": routes}
+            parsed += 1
+        self.files = files  # Deleted files drop out
+        return parsed, len(files) - parsed
+    
+    def save(self):
+        data = {"version": self.VERSION, "generated": datetime.now().isoformat(),
+                "routes": len(self.routes), "files": self.files}
+        temporary = self.path.with_suffix(".tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(temporary, self.path)  # Readers never see a half-written table
+    
+    @classmethod
+    def strip_comments(cls, source: str) -> str:
+        """Blank out comments (keeping line numbers) so Javadoc cannot look like annotations"""
+        return cls.CODE_TOKENS.sub(
+            lambda m: m.group(0) if m.group(0).startswith('"') else re.sub(r"[^\n]", " ", m.group(0)), source)
+    
+    @classmethod
+    def annotation_paths(cls, arguments: Optional[str]) -> List[str]:
+        """Paths of a mapping annotation's value/path attribute ('' if it has none)"""
+        inner = (arguments or "").strip()[1:-1]
+        value = rf'(\{{[^}}]*\}}|{cls.STRING})'
+        match = re.search(rf'\b(?:value|path)\s*=\s*{value}', inner) or re.match(rf'\s*{value}', inner)
+        if not match:
+            return [""]
+        return [json.loads(f'"{path}"') for path in re.findall(r'"((?:\\.|[^"\\])*)"', match.group(1))] or [""]
+    
+    @classmethod
+    def roles(cls, expression: Optional[str]) -> List[str]:
+        """Roles named by hasRole/hasAnyRole/hasAuthority checks of a @PreAuthorize expression"""
+        roles = []
+        for arguments in cls.ROLE_CHECK.findall(expression or ""):
+            for role in re.findall(r"'([^']+)'", arguments):
+                role = role[5:] if role.startswith("ROLE_") else role
+                if role not in roles:
+                    roles.append(role)
+        return roles
+    
+    @classmethod
+    def unwrap(cls, type_name: str) -> str:
+        """ApiResponse<List<X>> / ResponseEntity<ApiResponse<X>> -> the DTO type inside"""
+        type_name = type_name.replace(" ", "")
+        while True:
+            match = re.fullmatch(r"(\w+)<(.+)>", type_name)
+            if not match or match.group(1) not in cls.WRAPPERS:
+                return type_name
+            type_name = match.group(2)
+    
+    @staticmethod
+    def parameter_list(code: str, start: int) -> str:
+        """Text of a method's parameter list, from just after its '('"""
+        depth = 1
+        for position in range(start, len(code)):
+            depth += {"(": 1, ")": -1}.get(code[position], 0)
+            if depth == 0:
+                return code[start:position]
+        return code[start:]
+    
+    @classmethod
+    def parse(cls, source: str) -> List[dict]:
+        """Routes declared by one controller source file"""
+        code = cls.strip_comments(source)
+        declaration = cls.CLASS.search(code)
+        if not declaration:
+            return []
+        header = code[:declaration.start()]
+        if "@RestController" not in header and "@Controller" not in header:
+            return []
+        
+        prefixes = [""]
+        for match in cls.MAPPING.finditer(header):
+            if match.group(1) == "Request":
+                prefixes = cls.annotation_paths(match.group(2))
+        class_guard = cls.PRE_AUTHORIZE.search(header)
+        
+        routes = []
+        for match in cls.MAPPING.finditer(code, declaration.end()):
+            signature = cls.SIGNATURE.search(code, match.end())
+            if not signature:
+                continue
+            # Annotations between the previous member and this method's signature
+            block = code[max(code.rfind(char, 0, match.start()) for char in ";{}") + 1:signature.start()]
+            guard = cls.PRE_AUTHORIZE.search(block) or class_guard
+            expression = json.loads(guard.group(1)) if guard else None
+            
+            if match.group(1) == "Request":
+                methods = re.findall(r"RequestMethod\.(\w+)", match.group(2) or "") or ["ANY"]
+            else:
+                methods = [match.group(1).upper()]
+            
+            path_types, query, body = {}, [], None
+            for kind, arguments, type_name, name in cls.PARAMETER.findall(
+                    cls.parameter_list(code, signature.end()) + ","):
+                # Only a bare string or name/value names the parameter, not e.g. defaultValue = "0"
+                declared = re.search(r'(?:^\(\s*|\b(?:name|value)\s*=\s*)"([^"]+)"', (arguments or "").strip())
+                name = declared.group(1) if declared else name
+                if kind == "PathVariable":
+                    path_types[name] = type_name.strip()
+                elif kind == "RequestParam":
+                    query.append({"name": name, "type": type_name.strip(),
+                                  "required": not re.search(r"required\s*=\s*false|defaultValue", arguments or "")})
+                else:
+                    body = type_name.strip()
+            
+            line = code.count("\n", 0, match.start()) + 1
+            for prefix in prefixes:
+                for suffix in cls.annotation_paths(match.group(2)):
+                    path = "/" + "/".join(part.strip("/") for part in (prefix, suffix) if part.strip("/"))
+                    variables = re.findall(r"\{(\w+)(?::[^}]*)?\}", path)
+                    for method in methods:
+                        routes.append({
+                            "method": method,
+                            "path": path,
+                            "path_variables": [{"name": name, "type": path_types.get(name)} for name in variables],
+                            "query_params": query,
+                            "request_body": body,
+                            "preauthorize": expression,
+                            "roles": cls.roles(expression),
+                            "returns": cls.unwrap(signature.group(1)),
+                            "controller": declaration.group(1),
+                            "handler": signature.group(2),
+                            "line": line
+                        })
+        return routes
+    
+    def print_table(self):
+        routes = self.routes
+        width = max([len(route["path"]) for route in routes] + [4])
+        print(f"{'Method':<7} {'Path':<{width}}  {'Roles':<28} Returns")
+        for route in routes:
+            roles = ", ".join(route["roles"]) or ("(expression)" if route["preauthorize"] else "-")
+            print(f"{route['method']:<7} {route['path']:<{width}}  {roles:<28} {route['returns']}")
+
+
+class BuildCache:
+    """Last verdict of each build check, keyed by a content hash of its input files
+    
+    A file is re-hashed only when its size or mtime changed since it was last
+    hashed, so fingerprinting an unchanged tree costs one stat per file.
+    """
+    
+    DEFAULT_PATH = Path(__file__).parent / ".sgms_audit_cache.json"
+    
+    def __init__(self, path: Path = None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.lock = threading.Lock()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        self.files: Dict[str, list] = data.get("files", {})  # relative path -> [size, mtime_ns, sha256]
+        self.results: Dict[str, dict] = data.get("results", {})  # check -> fingerprint, issues, timestamp
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+        self.seen = set()  # Files fingerprinted this run; the others are dropped on save
+    
+    def file_digest(self, root: Path, path: Path) -> str:
+        relative = path.relative_to(root).as_posix()
+        stat = path.stat()
+        with self.lock:
+            self.seen.add(relative)
+            known = self.files.get(relative)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        with self.lock:
+            self.files[relative] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+    
+    def fingerprint(self, root: Path, patterns: List[str], extra: List[str] = ()) -> str:
+        """Hash of the paths and contents of all files matching the patterns, plus extra strings"""
+        paths = sorted({path for pattern in patterns for path in root.glob(pattern) if path.is_file()})
+        hasher = hashlib.sha256()
+        for path in paths:
+            hasher.update(f"{path.relative_to(root).as_posix()}\0{self.file_digest(root, path)}\n".encode())
+        for item in extra:
+            hasher.update(f"{item}\n".encode())
+        return hasher.hexdigest()
+    
+    def get(self, check: str, fingerprint: str) -> Optional[List[Tuple[str, dict]]]:
+        entry = self.results.get(check)
+        if entry and entry["fingerprint"] == fingerprint:
+            return [(level, dict(issue)) for level, issue in entry["issues"]]
+        return None
+    
+    def put(self, check: str, fingerprint: str, issues: List[Tuple[str, dict]]):
+        with self.lock:
+            self.results[check] = {
+                "fingerprint": fingerprint,
+                "issues": issues,
+                "timestamp": datetime.now().isoformat()
+            }
+    
+    def save(self):
+        files = {path: entry for path, entry in self.files.items() if path in self.seen}
+        temporary = self.path.with_suffix(".tmp")
+        try:
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump({"files": files, "results": self.results}, f)
+            os.replace(temporary, self.path)  # An interrupted save keeps the previous cache
+        except OSError as e:
+            print(f"⚠️  Could not save build cache {self.path}: {e}")
+
+
+class CheckOutput:
+    """sys.stdout stand-in that holds a running check's output until it finishes
+    
+    Concurrent checks would otherwise interleave their progress lines; each
+    check's output is written as one block when the check completes.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is not None:
+            buffer.append(text)
+        else:
+            with self.lock:
+                self.stream.write(text)
+        return len(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def capture(self):
+        self.local.buffer = []
+    
+    def release(self):
+        text, self.local.buffer = "".join(self.local.buffer or []), None
+        with self.lock:
+            self.stream.write(text)
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class CheckScheduler:
+    """Runs checks on a bounded thread pool, respecting dependencies and resource limits
+    
+    A check starts once every check it requires has finished and a slot of its
+    resource class is free; among ready checks, declaration order wins. Checks
+    whose dependencies failed or were skipped are skipped.
+    """
+    
+    def __init__(self, checks: List[AuditCheck], limits: Dict[str, int], workers: int = 4):
+        self.checks = checks
+        self.limits = limits
+        self.workers = max(1, workers)
+        by_name = {check.name: check for check in checks}
+        for check in checks:
+            if check.resource not in limits:
+                raise ValueError(f"Check '{check.name}' has unknown resource class '{check.resource}'")
+            for name in check.requires:
+                if name not in by_name:
+                    raise ValueError(f"Check '{check.name}' requires unknown check '{name}'")
+                if checks.index(by_name[name]) > checks.index(check):
+                    raise ValueError(f"Check '{check.name}' must be declared after '{name}'")
+        self.by_name = by_name
+    
+    def run(self, execute: Callable[[AuditCheck], bool]):
+        """Run every check through execute(check), which returns False if the check crashed"""
+        start = time.perf_counter()
+        in_use = {resource: 0 for resource in self.limits}
+        running = {}
+        
+        def task(check: AuditCheck) -> bool:
+            check.started = time.perf_counter() - start
+            try:
+                return execute(check)
+            finally:
+                check.seconds = time.perf_counter() - start - check.started
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                for check in self.checks:
+                    if check.status != "pending":
+                        continue
+                    states = [self.by_name[name].status for name in check.requires]
+                    if any(state in ("failed", "skipped") for state in states):
+                        check.status = "skipped"
+                    elif all(state == "done" for state in states) and len(running) < self.workers \
+                            and in_use[check.resource] < self.limits[check.resource]:
+                        check.status = "running"
+                        in_use[check.resource] += 1
+                        running[pool.submit(task, check)] = check
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    check = running.pop(future)
+                    in_use[check.resource] -= 1
+                    check.status = "done" if future.result() else "failed"
+
 
 class SGMSAuditor:
-    def __init__(self):
+    # (name, method, resource class, required checks); the report follows this order
+    CHECKS = [
+        ("environment", "check_environment_variables", "io", ()),
+        ("migrations", "check_database_migrations", "io", ()),
+        ("backend_build", "check_backend_compilation", "cpu", ()),
+        ("frontend_build", "check_frontend_dependencies", "cpu", ()),
+        ("api_endpoints", "check_api_endpoints", "io", ()),
+        ("dto_usage", "check_dto_usage", "io", ("api_endpoints",)),
+        ("routes", "build_route_index", "io", ()),
+        ("security", "check_security_configuration", "io", ()),
+        ("database", "check_database_connection", "network", ("environment",)),
+        ("structure", "analyze_code_structure", "io", ()),
+    ]
+    
+    # Input files of the cacheable build checks (globs relative to the project root)
+    # and the tool whose location is part of the fingerprint
+    CACHED_INPUTS = {
+        "backend_build": (["backend/pom.xml", "backend/src/**/*"], "mvn"),
+        "frontend_build": (["package.json", "package-lock.json", "node_modules/.package-lock.json",
+                            "index.html", "*.config.js", "src/**/*", "public/**/*"], "npm"),
+    }
+    
+    # Concurrent checks per resource class; builds are multi-threaded themselves
+    RESOURCE_LIMITS = {
+        "cpu": max(1, min(2, os.cpu_count() or 1)),
+        "io": 4,
+        "network": 2,
+    }
+
+    def __init__(self, jobs: int = 4, use_cache: bool = True, cache: BuildCache = None):
         self.project_root = Path(__file__).parent
         self.backend_root = self.project_root / "backend"
         self.frontend_root = self.project_root / "src"
@@ -33,6 +578,23 @@ class SGMSAuditor:
             "backend_files": 0,
             "frontend_files": 0
         }
+        self.jobs = jobs
+        self.cache = cache or BuildCache()
+        self.use_cache = use_cache  # False still refreshes the cache, it just never reuses it
+        self.checks: List[AuditCheck] = []
+        self.wall_time: Optional[float] = None
+        self._local = threading.local()  # Check running on this thread, if any
+        self._index: Optional[SourceIndex] = None
+        self.routes: Optional[RouteIndex] = None
+        self._index_lock = threading.Lock()
+
+    @property
+    def index(self) -> SourceIndex:
+        """Project source index, built by the first check that needs it"""
+        with self._index_lock:
+            if self._index is None:
+                self._index = SourceIndex(self.project_root)
+        return self._index
 
     def log_issue(self, level: str, category: str, message: str, fix: str = None):
         """Log an issue with optional fix suggestion"""
@@ -42,6 +604,19 @@ class SGMSAuditor:
             "fix": fix,
             "timestamp": datetime.now().isoformat()
         }
+        check = getattr(self._local, "check", None)
+        if check is not None:
+            # Held back until the audit ends so the report keeps the declared check order
+            check.issues.append((level, issue))
+            return
+        self.commit_issue(level, issue)
+
+    def skip_cache(self):
+        """Keep the running check's result out of the build cache (e.g. a timeout)"""
+        self._local.cacheable = False
+
+    def commit_issue(self, level: str, issue: dict):
+        """Add an issue to the report and the statistics"""
         self.issues[level].append(issue)
         self.stats["total_issues"] += 1
         if level == "critical":
@@ -93,7 +668,7 @@ class SGMSAuditor:
         
         migration_dir = self.backend_root / "src" / "main" / "resources" / "db" / "migration"
         
-        if not migration_dir.exists():
+        if not self.index.is_dir(migration_dir):
             self.log_issue(
                 "critical",
                 "Database",
@@ -102,7 +677,8 @@ class SGMSAuditor:
             )
             return
         
-        migrations = sorted(migration_dir.glob("V*.sql"))
+        migrations = [file.path for file in self.index.query(migration_dir, "V*.sql")
+                      if file.path.parent == migration_dir]
         
         if len(migrations) == 0:
             self.log_issue(
@@ -165,6 +741,7 @@ class SGMSAuditor:
                     f"Maven errors:\n{result.stderr}"
                 )
         except subprocess.TimeoutExpired:
+            self.skip_cache()
             self.log_issue("warning", "Backend", "Compilation timeout (>2 min)")
         except FileNotFoundError:
             self.log_issue(
@@ -220,6 +797,7 @@ class SGMSAuditor:
                     f"Build errors:\n{result.stderr}"
                 )
         except subprocess.TimeoutExpired:
+            self.skip_cache()
             self.log_issue("warning", "Frontend", "Build timeout (>2 min)")
         except FileNotFoundError:
             self.log_issue(
@@ -235,11 +813,11 @@ class SGMSAuditor:
         
         controllers_dir = self.backend_root / "src" / "main" / "java" / "com" / "sgms"
         
-        if not controllers_dir.exists():
+        if not self.index.is_dir(controllers_dir):
             self.log_issue("critical", "API", "Source directory not found")
             return
         
-        controllers = list(controllers_dir.rglob("*Controller.java"))
+        controllers = self.index.query(controllers_dir, "*Controller.java")
         
         if len(controllers) == 0:
             self.log_issue(
@@ -253,7 +831,7 @@ class SGMSAuditor:
             
             # Check for @RestController and @RequestMapping
             for controller in controllers:
-                content = controller.read_text(encoding='utf-8')
+                content = controller.text
                 
                 if "@RestController" not in content:
                     self.log_issue(
@@ -275,17 +853,16 @@ class SGMSAuditor:
         
         controllers_dir = self.backend_root / "src" / "main" / "java" / "com" / "sgms"
         
-        if not controllers_dir.exists():
+        if not self.index.is_dir(controllers_dir):
             return
         
-        controllers = list(controllers_dir.rglob("*Controller.java"))
+        controllers = self.index.query(controllers_dir, "*Controller.java")
+        matches = self.index.findall(r'return\s+\w+Entity', controllers)
         entity_exposure_count = 0
         
         for controller in controllers:
-            content = controller.read_text(encoding='utf-8')
-            
             # Check for Entity returns (bad pattern)
-            entity_returns = re.findall(r'return\s+\w+Entity', content)
+            entity_returns = matches[controller.path]
             if entity_returns:
                 entity_exposure_count += len(entity_returns)
                 self.log_issue(
@@ -298,13 +875,58 @@ class SGMSAuditor:
         if entity_exposure_count == 0:
             self.log_issue("success", "Architecture", "✓ No entity exposure detected")
 
+    def build_route_index(self):
+        """Extract the controllers' route table and persist it for other tools"""
+        print("\n🔍 Indexing API Routes...")
+        
+        source_root = self.project_root / RouteIndex.SOURCE_DIR
+        if not self.index.is_dir(source_root):
+            self.log_issue("warning", "API", "Java source directory not found - route table not built")
+            return
+        
+        routes = RouteIndex.load(self.project_root)
+        parsed, unchanged = routes.update(self.index, source_root)
+        routes.save()
+        self.routes = routes
+        
+        table = routes.routes
+        controllers = {route["controller"] for route in table}
+        self.log_issue(
+            "success",
+            "API",
+            f"✓ Route table: {len(table)} routes in {len(controllers)} controllers saved to "
+            f"{routes.path.name} ({parsed} file(s) parsed, {unchanged} unchanged)"
+        )
+        
+        seen = {}
+        for route in table:
+            key = (route["method"], route["path"])
+            if key in seen:
+                self.log_issue(
+                    "warning",
+                    "API",
+                    f"Duplicate route {route['method']} {route['path']}: "
+                    f"{seen[key]} and {route['controller']}.{route['handler']}",
+                    "Spring refuses to start with ambiguous mappings"
+                )
+            seen[key] = f"{route['controller']}.{route['handler']}"
+        
+        unguarded = [f"{route['method']} {route['path']}" for route in table if not route["preauthorize"]]
+        if unguarded:
+            self.log_issue(
+                "info",
+                "API",
+                f"{len(unguarded)} route(s) without @PreAuthorize: {', '.join(unguarded)}",
+                "Confirm SecurityConfig covers them"
+            )
+
     def check_security_configuration(self):
         """Check security configuration"""
         print("\n🔍 Checking Security Configuration...")
         
         security_dir = self.backend_root / "src" / "main" / "java" / "com" / "sgms" / "security"
         
-        if not security_dir.exists():
+        if not self.index.is_dir(security_dir):
             self.log_issue(
                 "critical",
                 "Security",
@@ -320,7 +942,7 @@ class SGMSAuditor:
         ]
         
         for file in required_files:
-            if not (security_dir / file).exists():
+            if not self.index.exists(security_dir / file):
                 self.log_issue(
                     "warning",
                     "Security",
@@ -385,12 +1007,12 @@ class SGMSAuditor:
         """Analyze overall code structure"""
         print("\n🔍 Analyzing Code Structure...")
         
-        # Count Java files
-        java_files = list(self.backend_root.rglob("*.java"))
+        # Count Java files (build output such as target/ is not indexed)
+        java_files = self.index.query(self.backend_root, "*.java")
         self.stats["backend_files"] = len(java_files)
         
         # Count React files
-        jsx_files = list(self.frontend_root.rglob("*.jsx")) if self.frontend_root.exists() else []
+        jsx_files = self.index.query(self.frontend_root, "*.jsx")
         self.stats["frontend_files"] = len(jsx_files)
         
         self.log_issue("info", "Structure", f"Backend: {len(java_files)} Java files")
@@ -404,7 +1026,7 @@ class SGMSAuditor:
         
         for package in expected_packages:
             package_dir = self.backend_root / "src" / "main" / "java" / "com" / "sgms" / package
-            if package_dir.exists():
+            if self.index.is_dir(package_dir):
                 self.log_issue("success", "Structure", f"✓ {package}/ package exists")
             else:
                 self.log_issue(
@@ -430,6 +1052,30 @@ class SGMSAuditor:
         print(f"  Warnings: {self.stats['warning_count']}")
         print(f"  Backend Files: {self.stats['backend_files']} Java files")
         print(f"  Frontend Files: {self.stats['frontend_files']} JSX files")
+        if self._index is not None:
+            index = self._index.stats()
+            most = max(index["reads"].values(), default=0)
+            print(f"  Source Index: {index['files']} files ({index['bytes'] / 1048576:.1f} MB) "
+                  f"walked in {index['walk_seconds'] * 1000:.0f}ms; {index['files_read']} read, "
+                  f"at most {most} time(s) each")
+        if self.use_cache:
+            hits, total = len(self.cache.hits), len(self.cache.hits) + len(self.cache.misses)
+            print(f"  Build Cache: {hits}/{total} hit(s)"
+                  f"{' (' + ', '.join(self.cache.hits) + ')' if hits else ''}")
+        else:
+            print("  Build Cache: disabled (--no-cache), results refreshed")
+        
+        # Check timings
+        if self.checks:
+            print("\n⏱️  CHECK TIMINGS:")
+            for check in self.checks:
+                seconds = f"{check.seconds:6.1f}s" if check.seconds is not None else "      -"
+                status = "cached" if check.cached else check.status
+                start = f"started +{check.started:.1f}s" if check.started is not None else ""
+                print(f"  {check.name:<16} {check.resource:<8} {seconds}  {status:<8} {start}")
+            busy = sum(check.seconds or 0 for check in self.checks)
+            print(f"  Total wall time: {self.wall_time:.1f}s "
+                  f"(checks took {busy:.1f}s in sum, {self.jobs} worker(s))")
         
         # Critical Issues
         if self.issues["critical"]:
@@ -474,28 +1120,105 @@ class SGMSAuditor:
             json.dump({
                 "timestamp": datetime.now().isoformat(),
                 "stats": self.stats,
-                "issues": self.issues
+                "issues": self.issues,
+                "wall_time": self.wall_time,
+                "source_index": self._index.stats() if self._index is not None else None,
+                "build_cache": {
+                    "enabled": self.use_cache,
+                    "hits": self.cache.hits,
+                    "misses": self.cache.misses
+                },
+                "timings": {
+                    check.name: {
+                        "resource": check.resource,
+                        "status": check.status,
+                        "cached": check.cached,
+                        "started": check.started,
+                        "seconds": check.seconds
+                    }
+                    for check in self.checks
+                }
             }, f, indent=2)
         
         print(f"\n📄 Detailed report saved to: {report_file}")
 
+    def run_check(self, check: AuditCheck) -> bool:
+        """Run one check, collecting its issues and output; False if it raised"""
+        output = sys.stdout if isinstance(sys.stdout, CheckOutput) else None
+        if output is not None:
+            output.capture()
+        self._local.check = check
+        self._local.cacheable = True
+        try:
+            fingerprint = None
+            if check.name in self.CACHED_INPUTS:
+                patterns, tool = self.CACHED_INPUTS[check.name]
+                fingerprint = self.cache.fingerprint(self.project_root, patterns, [shutil.which(tool) or ""])
+                cached = self.cache.get(check.name, fingerprint) if self.use_cache else None
+                if cached is not None:
+                    self.cache.hits.append(check.name)
+                    check.cached = True
+                    check.issues = cached
+                    print(f"\n♻️  {check.name}: inputs unchanged, reusing the cached result")
+                    return True
+                self.cache.misses.append(check.name)
+            getattr(self, check.method)()
+            if fingerprint and self._local.cacheable:
+                self.cache.put(check.name, fingerprint, check.issues)
+            return True
+        except Exception as e:
+            self.log_issue("critical", "Auditor", f"Check '{check.name}' crashed: {type(e).__name__}: {e}")
+            return False
+        finally:
+            self._local.check = None
+            print(f"   ⏱️  {check.name} finished in {time.perf_counter() - self._started - check.started:.1f}s")
+            if output is not None:
+                output.release()
+
     def run_full_audit(self):
         """Run complete audit"""
-        print("🚀 Starting SGMS Project Audit...\n")
-        
-        self.check_environment_variables()
-        self.check_database_migrations()
-        self.check_backend_compilation()
-        self.check_frontend_dependencies()
-        self.check_api_endpoints()
-        self.check_dto_usage()
-        self.check_security_configuration()
-        self.check_database_connection()
-        self.analyze_code_structure()
+        print(f"🚀 Starting SGMS Project Audit ({self.jobs} worker(s))...\n")
+        
+        self._started = time.perf_counter()
+        self.checks = [AuditCheck(*spec) for spec in self.CHECKS]
+        scheduler = CheckScheduler(self.checks, self.RESOURCE_LIMITS, self.jobs)
+        stdout, sys.stdout = sys.stdout, CheckOutput(sys.stdout)
+        try:
+            scheduler.run(self.run_check)
+        finally:
+            sys.stdout = stdout
+        self.wall_time = time.perf_counter() - self._started
+        self.cache.save()
+        
+        for check in self.checks:
+            if check.status == "skipped":
+                missing = [name for name in check.requires if scheduler.by_name[name].status != "done"]
+                self.log_issue(
+                    "warning",
+                    "Auditor",
+                    f"Check '{check.name}' skipped: {', '.join(missing)} did not complete"
+                )
+            for level, issue in check.issues:
+                self.commit_issue(level, issue)
         
         self.generate_report()
 
 
 if __name__ == "__main__":
-    auditor = SGMSAuditor()
-    auditor.run_full_audit()
+    parser = argparse.ArgumentParser(description="SGMS Project Auditor")
+    parser.add_argument("--jobs", type=int, default=4,
+                        help="Checks run concurrently (default: 4; 1 runs them in sequence)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rebuild even if the build inputs are unchanged since the last audit")
+    parser.add_argument("--routes", action="store_true",
+                        help="Only refresh and print the controllers' route table")
+    args = parser.parse_args()
+    
+    auditor = SGMSAuditor(jobs=args.jobs, use_cache=not args.no_cache)
+    if args.routes:
+        auditor.build_route_index()
+        if auditor.routes is not None:
+            auditor.routes.print_table()
+            print(f"\n📄 Route table saved to: {auditor.routes.path}")
+    else:
+        auditor.run_full_audit()
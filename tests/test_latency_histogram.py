@@ -0,0 +1,144 @@
+"""LatencyHistogram: percentile accuracy, merging and serialization
+
+Run with: python -m pytest tests (or python -m unittest discover tests)
+"""
+
+import json
+import math
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qa_audit import LatencyHistogram  # noqa: E402
+
+PERCENTILES = (1, 25, 50, 90, 95, 99, 99.9, 100)
+
+
+def samples(seed: int, n: int = 20000) -> list:
+    """Log-normal latencies in microseconds, from ~100µs to a few seconds"""
+    rng = random.Random(seed)
+    return [int(rng.lognormvariate(math.log(20000), 1.2)) for _ in range(n)]
+
+
+def exact_percentile(values: list, pct: float) -> int:
+    """Nearest-rank percentile, the definition LatencyHistogram.percentiles follows"""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct * len(ordered) / 100)) - 1]
+
+
+def histogram_of(values: list, significant_digits: int = 3) -> LatencyHistogram:
+    histogram = LatencyHistogram(significant_digits=significant_digits)
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+class PercentileAccuracyTest(unittest.TestCase):
+
+    def test_within_significant_digits(self):
+        values = samples(1)
+        for digits in (2, 3):
+            histogram = histogram_of(values, digits)
+            for pct, value in histogram.percentiles(PERCENTILES).items():
+                exact = exact_percentile(values, pct)
+                with self.subTest(digits=digits, pct=pct):
+                    self.assertGreaterEqual(value, exact)  # Reported as the bucket's highest value
+                    self.assertLessEqual(value - exact, exact * 10 ** -digits + 1)
+
+    def test_small_values_are_exact(self):
+        histogram = histogram_of(range(1, 1001))
+        self.assertEqual(histogram.percentiles((50, 99, 100)), {50: 500, 99: 990, 100: 1000})
+
+    def test_extremes_and_mean(self):
+        values = samples(2, 1000)
+        histogram = histogram_of(values)
+        self.assertEqual(histogram.min_value, min(values))
+        self.assertEqual(histogram.max_value, max(values))
+        self.assertEqual(histogram.value_at_percentile(100), max(values))
+        self.assertAlmostEqual(histogram.mean(), sum(values) / len(values))
+
+    def test_record_ms(self):
+        histogram = LatencyHistogram()
+        histogram.record_ms(12.3456)
+        self.assertEqual(histogram.min_value, 12346)
+        self.assertAlmostEqual(histogram.summary_ms()['p50'], 12.346, places=2)
+
+
+class RangeTest(unittest.TestCase):
+
+    def test_values_above_max_are_clamped(self):
+        histogram = LatencyHistogram(max_value_us=1_000_000)
+        histogram.record(500)
+        histogram.record(5_000_000)
+        self.assertEqual(histogram.total_count, 2)
+        self.assertEqual(histogram.max_value, 1_000_000)
+        self.assertLessEqual(histogram.value_at_percentile(100), 1_000_000)
+        self.assertGreaterEqual(histogram.value_at_percentile(100), 1_000_000 * (1 - 1e-3))
+
+    def test_negative_values_are_clamped_to_zero(self):
+        histogram = LatencyHistogram()
+        histogram.record(-5)
+        self.assertEqual(histogram.min_value, 0)
+        self.assertEqual(histogram.value_at_percentile(50), 0)
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentiles((50, 99)), {50: None, 99: None})
+        self.assertIsNone(histogram.mean())
+        summary = histogram.summary_ms()
+        self.assertEqual(summary['count'], 0)
+        self.assertIsNone(summary['p50'])
+        self.assertIsNone(summary['max'])
+        self.assertEqual(list(histogram.buckets()), [])
+
+
+class MergeTest(unittest.TestCase):
+
+    def test_merge_matches_combined_samples(self):
+        first, second = samples(3), samples(4)
+        merged = histogram_of(first)
+        merged.merge(histogram_of(second))
+        combined = histogram_of(first + second)
+        self.assertEqual(merged.counts, combined.counts)
+        self.assertEqual(merged.total_count, combined.total_count)
+        self.assertEqual(merged.total_sum, combined.total_sum)
+        self.assertEqual((merged.min_value, merged.max_value), (combined.min_value, combined.max_value))
+        self.assertEqual(merged.percentiles(PERCENTILES), combined.percentiles(PERCENTILES))
+
+    def test_merge_into_empty(self):
+        values = samples(5, 100)
+        merged = LatencyHistogram()
+        merged.merge(histogram_of(values))
+        merged.merge(LatencyHistogram())
+        self.assertEqual(merged.percentiles(PERCENTILES), histogram_of(values).percentiles(PERCENTILES))
+
+    def test_merge_rejects_other_configurations(self):
+        with self.assertRaises(ValueError):
+            LatencyHistogram().merge(LatencyHistogram(significant_digits=2))
+
+
+class SerializationTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        histogram = histogram_of(samples(6, 5000))
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+        self.assertEqual(restored.counts, histogram.counts)
+        self.assertEqual(restored.summary_ms(), histogram.summary_ms())
+
+    def test_round_trip_is_mergeable(self):
+        first, second = samples(7, 500), samples(8, 500)
+        restored = LatencyHistogram.from_dict(histogram_of(first).to_dict())
+        restored.merge(histogram_of(second))
+        self.assertEqual(restored.percentiles(PERCENTILES), histogram_of(first + second).percentiles(PERCENTILES))
+
+    def test_encoding_is_sparse(self):
+        histogram = histogram_of([100, 100, 2000])
+        self.assertEqual(len(histogram.to_dict()['counts']), 2)
+        self.assertEqual(LatencyHistogram.from_dict(LatencyHistogram().to_dict()).total_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
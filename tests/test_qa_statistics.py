@@ -0,0 +1,88 @@
+"""Significance tests behind qa_audit's soak-test drift detection
+
+Run with: python -m pytest tests (or python -m unittest discover tests)
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qa_audit import (LatencyHistogram, SGMSQASystem, SoakTester, mann_whitney_counts,  # noqa: E402
+                      mann_whitney_greater, mann_whitney_histograms, proportion_increase_p)
+
+
+def windows(p95s: list, requests: int = 100, errors: int = 0) -> list:
+    return [{'index': i, 'requests': requests, 'errors': errors, 'p95': p95} for i, p95 in enumerate(p95s)]
+
+
+class MannWhitneyTest(unittest.TestCase):
+
+    def test_complete_separation_by_sample_size(self):
+        # One-sided p-values when every late sample is slower than every early one
+        self.assertAlmostEqual(mann_whitney_greater([0, 1], [100, 101]), 0.12264, places=5)
+        self.assertAlmostEqual(mann_whitney_greater([0, 1, 2], [100, 101, 102]), 0.04043, places=5)
+        self.assertAlmostEqual(mann_whitney_greater([0, 1, 2, 3], [100, 101, 102, 103]), 0.01519, places=5)
+
+    def test_no_shift(self):
+        self.assertAlmostEqual(mann_whitney_greater([1, 2, 3, 4], [1, 2, 3, 4]), 0.55879, places=5)
+
+    def test_counts_with_ties(self):
+        # early = [a, a, b], late = [b, c, c]
+        self.assertAlmostEqual(mann_whitney_counts([(2, 0), (1, 1), (0, 2)], 3, 3), 0.05507, places=5)
+
+    def test_counts_degenerate(self):
+        self.assertEqual(mann_whitney_counts([(3, 3)], 3, 3), 1.0)  # All tied: zero variance
+        self.assertEqual(mann_whitney_counts([(3, 0)], 3, 0), 1.0)
+
+    def test_histograms_match_samples(self):
+        early, late = LatencyHistogram(), LatencyHistogram()
+        for value in (10, 11, 12, 13):
+            early.record_ms(value)
+        for value in (100, 110, 120, 130):
+            late.record_ms(value)
+        self.assertAlmostEqual(mann_whitney_histograms(early, late), 0.01519, places=5)
+        self.assertGreater(mann_whitney_histograms(late, early), 0.9)
+
+
+class ProportionTest(unittest.TestCase):
+
+    def test_increase(self):
+        self.assertAlmostEqual(proportion_increase_p(10, 1000, 25, 1000), 0.00526, places=5)
+
+    def test_unchanged(self):
+        self.assertAlmostEqual(proportion_increase_p(10, 1000, 10, 1000), 0.5)
+
+    def test_degenerate(self):
+        self.assertEqual(proportion_increase_p(0, 100, 0, 100), 1.0)
+        self.assertEqual(proportion_increase_p(0, 0, 5, 100), 1.0)
+
+
+class DriftDetectionTest(unittest.TestCase):
+
+    def setUp(self):
+        qa = SGMSQASystem('http://127.0.0.1:9/api', 'http://127.0.0.1:9', verbose=False)
+        self.soak = SoakTester(qa, users=1, ramp_up=0, duration=60, window=1)
+
+    def test_minimum_windows_per_third(self):
+        self.assertEqual(SoakTester.MIN_WINDOWS_PER_THIRD, 4)
+        # The first and last windows are dropped: 13 windows leave 11 usable, 3 per third
+        drift = self.soak.detect_drift(windows([10] * 6 + [1000] * 7))
+        self.assertEqual(drift, {'insufficient': {'windows': 11, 'needed': 12}})
+
+    def test_drift_detected_with_four_per_third(self):
+        drift = self.soak.detect_drift(windows([10, 10, 11, 12, 13, 50, 60, 70, 80, 100, 101, 102, 103, 200]))
+        self.assertEqual(drift['windows_compared'], 4)
+        self.assertTrue(drift['p95']['drift'])
+        self.assertAlmostEqual(drift['p95']['p_value'], 0.01519, places=5)
+        self.assertFalse(drift['error_rate']['drift'])
+
+    def test_no_drift_on_flat_latency(self):
+        drift = self.soak.detect_drift(windows([50, 51, 49, 50] * 4))
+        self.assertFalse(drift['p95']['drift'])
+        self.assertFalse(drift['error_rate']['drift'])
+
+
+if __name__ == '__main__':
+    unittest.main()
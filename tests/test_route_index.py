@@ -0,0 +1,184 @@
+"""RouteIndex: controller parsing and the mtime/size refresh of the route table
+
+Run with: python -m pytest tests (or python -m unittest discover tests)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sgms_auditor import RouteIndex, SourceIndex  # noqa: E402
+
+GUARD_CONTROLLER = '''package com.sgms.guard;
+
+@RestController
+@RequestMapping("/api/guards")
+@PreAuthorize("hasRole('ADMIN')")
+public class GuardController {
+
+    /** @GetMapping("/not-a-route") in Javadoc is ignored */
+    @GetMapping
+    public ResponseEntity<ApiResponse<List<GuardDTO>>> getAll(
+            @RequestParam(required = false) String status,
+            @RequestParam(defaultValue = "0") int page) {
+        return null;
+    }
+
+    @GetMapping("/{id}")
+    @PreAuthorize("hasAnyRole('ROLE_ADMIN', 'SUPERVISOR') or hasAuthority('GUARD')")
+    public ResponseEntity<ApiResponse<GuardDTO>> getById(@PathVariable Long id) {
+        return null;
+    }
+
+    @RequestMapping(value = {"/search", "search/"}, method = {RequestMethod.GET, RequestMethod.POST})
+    public ApiResponse<List<GuardDTO>> search(@RequestBody final GuardSearchRequest request) {
+        return null;
+    }
+
+    @PutMapping(path = "/{guardId}/sites/{siteId}")
+    @PreAuthorize("isAuthenticated()")
+    public ApiResponse<Void> assign(@PathVariable("guardId") Long id, @PathVariable Long siteId) {
+        return null;
+    }
+}
+'''
+
+SITE_CONTROLLER = '''package com.sgms.site;
+
+@RestController
+@RequestMapping({"/api/sites", "/api/v2/sites/"})
+public class SiteController {
+
+    @DeleteMapping("/{id}")
+    @PreAuthorize("hasRole('ADMIN')")
+    public ApiResponse<Void> delete(@PathVariable Long id) {
+        return null;
+    }
+}
+'''
+
+
+def route(routes: list, method: str, path: str) -> dict:
+    matches = [r for r in routes if r['method'] == method and r['path'] == path]
+    assert len(matches) == 1, f"{method} {path}: {len(matches)} routes"
+    return matches[0]
+
+
+class ParseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.routes = RouteIndex.parse(GUARD_CONTROLLER)
+
+    def test_class_and_method_mappings_are_joined(self):
+        self.assertEqual(sorted((r['method'], r['path']) for r in self.routes), [
+            ('GET', '/api/guards'),
+            ('GET', '/api/guards/search'),
+            ('GET', '/api/guards/search'),
+            ('GET', '/api/guards/{id}'),
+            ('POST', '/api/guards/search'),
+            ('POST', '/api/guards/search'),
+            ('PUT', '/api/guards/{guardId}/sites/{siteId}'),
+        ])
+
+    def test_multiple_class_prefixes(self):
+        routes = RouteIndex.parse(SITE_CONTROLLER)
+        self.assertEqual([r['path'] for r in routes], ['/api/sites/{id}', '/api/v2/sites/{id}'])
+        self.assertTrue(all(r['method'] == 'DELETE' for r in routes))
+
+    def test_method_preauthorize_overrides_class(self):
+        self.assertEqual(route(self.routes, 'GET', '/api/guards')['roles'], ['ADMIN'])
+        self.assertEqual(route(self.routes, 'GET', '/api/guards/{id}')['roles'], ['ADMIN', 'SUPERVISOR', 'GUARD'])
+
+    def test_expression_without_role_checks(self):
+        assign = route(self.routes, 'PUT', '/api/guards/{guardId}/sites/{siteId}')
+        self.assertEqual(assign['preauthorize'], 'isAuthenticated()')
+        self.assertEqual(assign['roles'], [])
+
+    def test_no_preauthorize(self):
+        self.assertEqual(RouteIndex.parse(SITE_CONTROLLER.replace('@PreAuthorize("hasRole(\'ADMIN\')")', ''))[0]
+                         ['preauthorize'], None)
+
+    def test_parameters_and_returns(self):
+        get_all = route(self.routes, 'GET', '/api/guards')
+        self.assertEqual(get_all['returns'], 'List<GuardDTO>')
+        self.assertEqual(get_all['query_params'], [{'name': 'status', 'type': 'String', 'required': False},
+                                                   {'name': 'page', 'type': 'int', 'required': False}])
+        assign = route(self.routes, 'PUT', '/api/guards/{guardId}/sites/{siteId}')
+        self.assertEqual(assign['path_variables'], [{'name': 'guardId', 'type': 'Long'},
+                                                    {'name': 'siteId', 'type': 'Long'}])
+        self.assertEqual(assign['handler'], 'assign')
+        search = [r for r in self.routes if r['handler'] == 'search'][0]
+        self.assertEqual(search['request_body'], 'GuardSearchRequest')
+
+    def test_non_controllers_are_ignored(self):
+        self.assertEqual(RouteIndex.parse(GUARD_CONTROLLER.replace('@RestController', '@Service')), [])
+
+
+class UpdateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.source_root = self.root / RouteIndex.SOURCE_DIR
+        self.source_root.mkdir(parents=True)
+        self.guard = self.source_root / 'GuardController.java'
+        self.site = self.source_root / 'SiteController.java'
+        self.guard.write_text(GUARD_CONTROLLER, encoding='utf-8')
+        self.site.write_text(SITE_CONTROLLER, encoding='utf-8')
+        self.table = self.root / 'routes.json'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def refresh(self) -> tuple:
+        """Load the persisted table, update it from a fresh walk and save it again"""
+        routes = RouteIndex.load(self.root, self.table)
+        counts = routes.update(SourceIndex(self.root), self.source_root)
+        routes.save()
+        return counts, routes
+
+    def test_unchanged_files_are_not_parsed(self):
+        (parsed, unchanged), first = self.refresh()
+        self.assertEqual((parsed, unchanged), (2, 0))
+        (parsed, unchanged), second = self.refresh()
+        self.assertEqual((parsed, unchanged), (0, 2))
+        self.assertEqual(second.routes, first.routes)
+
+    def test_changed_mtime_or_size_is_parsed(self):
+        self.refresh()
+        stat = self.site.stat()
+        os.utime(self.site, (stat.st_atime, stat.st_mtime + 10))
+        (parsed, unchanged), _ = self.refresh()
+        self.assertEqual((parsed, unchanged), (1, 1))
+
+        stat = self.guard.stat()
+        self.guard.write_text(GUARD_CONTROLLER.replace('"/{id}"', '"/by-id/{id}"'), encoding='utf-8')
+        os.utime(self.guard, (stat.st_atime, stat.st_mtime))  # Same mtime, new size
+        (parsed, unchanged), routes = self.refresh()
+        self.assertEqual((parsed, unchanged), (1, 1))
+        self.assertIn('/api/guards/by-id/{id}', [r['path'] for r in routes.routes])
+        self.assertNotIn('/api/guards/{id}', [r['path'] for r in routes.routes])
+
+    def test_deleted_files_drop_out(self):
+        self.refresh()
+        self.site.unlink()
+        (parsed, unchanged), routes = self.refresh()
+        self.assertEqual((parsed, unchanged), (0, 1))
+        guard = (RouteIndex.SOURCE_DIR / 'GuardController.java').as_posix()
+        self.assertEqual({r['file'] for r in routes.routes}, {guard})
+
+    def test_outdated_version_is_rebuilt(self):
+        self.refresh()
+        data = json.loads(self.table.read_text(encoding='utf-8'))
+        self.table.write_text(json.dumps({**data, 'version': RouteIndex.VERSION - 1}), encoding='utf-8')
+        (parsed, unchanged), _ = self.refresh()
+        self.assertEqual((parsed, unchanged), (2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()